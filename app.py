@@ -1,10 +1,14 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
+from src import table_store
 from src.extensions import swagger
 from src.logger import logger
 from src.controllers import poly_endpoints
 
 def create_app():
+    if table_store.table_directory:
+        # Only writes files that are missing or stale; otherwise a quick check.
+        table_store.build_table_files(table_store.table_directory)
     app = Flask(__name__)
     swagger.init_app(app)
     app.register_blueprint(poly_endpoints)
@@ -0,0 +1,35 @@
+import argparse
+import random
+from benchmarks.timing import time_call
+from src.additive_fft import multiply_fft, multiply_schoolbook
+from src.fields import get_field
+
+LENGTHS = [16, 32, 64, 128, 256, 512, 1024]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare additive FFT and schoolbook polynomial multiplication')
+    parser.add_argument('--m', type=int, default=16)
+    parser.add_argument('--repeat', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    field = get_field(args.m)
+    print(' '.join(f'{column:>16}' for column in ['length', 'schoolbook_ms', 'fft_ms', 'faster']))
+
+    for length in LENGTHS:
+        if 2 * length - 1 > 1 << args.m:
+            break
+        poly1 = [rng.getrandbits(args.m) for _ in range(length)]
+        poly2 = [rng.getrandbits(args.m) for _ in range(length)]
+        assert multiply_fft(field, poly1, poly2) == multiply_schoolbook(field, poly1, poly2)
+
+        schoolbook_ms = time_call(lambda: multiply_schoolbook(field, poly1, poly2), args.repeat) / 1e3
+        fft_ms = time_call(lambda: multiply_fft(field, poly1, poly2), args.repeat) / 1e3
+        faster = 'fft' if fft_ms < schoolbook_ms else 'schoolbook'
+        print(f'{length:>16} {schoolbook_ms:>16.2f} {fft_ms:>16.2f} {faster:>16}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+import argparse
+import random
+from benchmarks.timing import time_call
+from src import bitslice
+from src.fields import get_field
+from src.services import PolyServices
+
+M_VALUES = [8, 16, 32, 64, 163, 283, 571]
+BATCH_SIZES = [64, 256, 1024, 4096]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Batch multiplication: one element at a time vs bitsliced planes')
+    parser.add_argument('--m', type=int, nargs='*', default=M_VALUES)
+    parser.add_argument('--n', type=int, nargs='*', default=BATCH_SIZES)
+    args = parser.parse_args()
+
+    print(' '.join(f'{column:>16}' for column in ['m', 'n', 'scalar_us', 'bitslice_us', 'speedup', 'bitsliced']))
+    for m in args.m:
+        field = get_field(m)
+        for n in args.n:
+            polys1 = [random.getrandbits(m) for _ in range(n)]
+            polys2 = [random.getrandbits(m) for _ in range(n)]
+
+            def scalar():
+                return [PolyServices._multiply(field, poly1, poly2) for poly1, poly2 in zip(polys1, polys2)]
+
+            def bitsliced():
+                return bitslice.multiply_many(field, polys1, polys2)
+
+            assert scalar() == bitsliced()
+            number = max(1, 2000 // n)
+            scalar_us = time_call(scalar, number, repeat=5)
+            bitslice_us = time_call(bitsliced, number, repeat=5)
+            print(f'{m:>16} {n:>16} {scalar_us:>16.0f} {bitslice_us:>16.0f} {scalar_us / bitslice_us:>15.2f}x '
+                  f'{str(bitslice.is_worthwhile(field, n)):>16}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+import argparse
+import random
+import sys
+import tracemalloc
+from benchmarks.timing import time_call
+from src.element import GF2mElement
+from src.services import PolyServices
+
+M_VALUES = [8, 16, 64, 163, 571, 2048]
+
+
+def bytes_per_item(build, count: int) -> float:
+    tracemalloc.start()
+    items = build(count)
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(items)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='GF2mElement operators vs PolyServices calls, and memory per element')
+    parser.add_argument('--repeat', type=int, default=2000)
+    parser.add_argument('--count', type=int, default=1_000_000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    service = PolyServices()
+    print(' '.join(f'{column:>16}' for column in
+                   ['m', 'service_mul_us', 'element_mul_us', 'speedup', 'service_inv_us', 'element_inv_us', 'speedup']))
+    for m in M_VALUES:
+        x, y = rng.getrandbits(m) | 1, rng.getrandbits(m) | 1
+        a, b = GF2mElement(x, m), GF2mElement(y, m)
+        assert (a * b).value == service.multiply_in_gf(m, x, y)
+        assert (~a).value == service.invert_in_gf(m, x)
+
+        service_mul = time_call(lambda: service.multiply_in_gf(m, x, y), args.repeat)
+        element_mul = time_call(lambda: a * b, args.repeat)
+        service_inv = time_call(lambda: service.invert_in_gf(m, x), args.repeat)
+        element_inv = time_call(lambda: ~a, args.repeat)
+        print(f'{m:>16} {service_mul:>16.2f} {element_mul:>16.2f} {service_mul / element_mul:>15.1f}x '
+              f'{service_inv:>16.2f} {element_inv:>16.2f} {service_inv / element_inv:>15.1f}x')
+
+    m = 64
+    values = [rng.getrandbits(m) for _ in range(args.count)]
+    int_bytes = bytes_per_item(lambda n: [value ^ 1 for value in values[:n]], args.count)
+    element_bytes = bytes_per_item(lambda n: GF2mElement.from_array(values[:n], m), args.count)
+    print(f'\nm={m}, {args.count} values: {int_bytes:.0f} bytes per int, {element_bytes:.0f} bytes per element '
+          f'on top of the ints, which are shared ({sys.getsizeof(GF2mElement(1, m))}-byte element object + list slot)')
+
+
+if __name__ == '__main__':
+    main()
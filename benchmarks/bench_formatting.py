@@ -0,0 +1,64 @@
+import argparse
+import json
+import random
+from app import app
+from benchmarks.timing import time_call
+from flask import jsonify
+from src.formatting import get_formatter
+from src.utils import int_to_hex_bin
+
+OUTPUTS = ['hex_bin', 'hex', 'bin', 'int', 'bytes']
+
+
+def legacy_response(number: int, bits: int):
+    # What every endpoint did before: both padded strings, always.
+    hex_result, bin_result = int_to_hex_bin(number, bits)
+    return jsonify({'result': {'hex': hex_result, 'bin': bin_result}})
+
+
+def legacy_batch(numbers: list[int], bits: int):
+    results = []
+    for number in numbers:
+        hex_result, bin_result = int_to_hex_bin(number, bits)
+        results.append({'result': {'hex': hex_result, 'bin': bin_result}})
+    return jsonify({'results': results})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serialization cost per response: int_to_hex_bin + jsonify vs ResultFormatter')
+    parser.add_argument('--bits', type=int, default=256, choices=[16, 32, 64, 128, 256])
+    parser.add_argument('--batch', type=int, default=1000)
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    bits = args.bits
+    number = random.getrandbits(bits)
+    numbers = [random.getrandbits(bits) for _ in range(args.batch)]
+    batch_number = max(args.number // args.batch, 5)
+
+    with app.app_context():
+        legacy_us = time_call(lambda: legacy_response(number, bits), args.number)
+        legacy_batch_us = time_call(lambda: legacy_batch(numbers, bits), batch_number)
+        legacy_bytes = len(legacy_response(number, bits).data)
+
+        print(' '.join(f'{column:>16}' for column in
+                       ['output', 'bytes', 'single_us', 'single_speedup', 'batch_us', 'batch_speedup']))
+        print(f'{"legacy":>16} {legacy_bytes:>16} {legacy_us:>16.2f} {"1.0x":>16} {legacy_batch_us:>16.0f} {"1.0x":>16}')
+        for output in OUTPUTS:
+            formatter = get_formatter(bits, output)
+            assert json.loads(app.response_class(formatter.batch_body(numbers)).data)['results'][0]['result'] == formatter(numbers[0])
+
+            def single():
+                return jsonify({'result': formatter(number)})
+
+            def batch():
+                return app.response_class(formatter.batch_body(numbers), mimetype='application/json')
+
+            single_us = time_call(single, args.number)
+            batch_us = time_call(batch, batch_number)
+            print(f'{output:>16} {len(single().data):>16} {single_us:>16.2f} {legacy_us / single_us:>15.1f}x '
+                  f'{batch_us:>16.0f} {legacy_batch_us / batch_us:>15.1f}x')
+
+
+if __name__ == '__main__':
+    main()
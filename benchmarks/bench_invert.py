@@ -0,0 +1,42 @@
+import argparse
+import random
+from benchmarks.timing import time_call
+from src.fields import get_field
+from src.inversion import invert_itoh_tsujii
+from src.reduction import reduce_poly
+from src.services import PolyServices
+
+M_VALUES = [17, 32, 64, 128, 163, 233, 283, 409, 571, 1024, 2048, 4096, 8192]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare binary Euclid inversion with Itoh-Tsujii')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(' '.join(f'{column:>16}' for column in ['m', 'euclid_us', 'itoh_tsujii_us', 'faster']))
+
+    faster_m = []
+    for m in M_VALUES:
+        field = get_field(m)
+        poly = rng.getrandbits(m) or 1
+        euclid = lambda: reduce_poly(field, PolyServices._invert_euclid(poly, field.modulus))
+        assert invert_itoh_tsujii(field, poly) == euclid()
+
+        euclid_us = time_call(euclid, args.repeat)
+        itoh_tsujii_us = time_call(lambda: invert_itoh_tsujii(field, poly), args.repeat)
+        faster = 'itoh_tsujii' if itoh_tsujii_us < euclid_us else 'euclid'
+        if faster == 'itoh_tsujii':
+            faster_m.append(m)
+        print(f'{m:>16} {euclid_us:>16.1f} {itoh_tsujii_us:>16.1f} {faster:>16}')
+
+    if faster_m:
+        print(f'Itoh-Tsujii is faster from m = {faster_m[0]}; set GF_ITOH_TSUJII_MIN_M accordingly')
+    else:
+        print('binary Euclid is faster for every m measured')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+import argparse
+import random
+from benchmarks.timing import time_call
+from src.clmul import clmul_karatsuba, clmul_schoolbook
+from src.fields import get_field
+from src.reduction import reduce_poly
+from src.services import PolyServices
+
+M_VALUES = [17, 24, 32, 48, 64, 96, 128, 163, 233, 283, 409, 571, 1024, 2048, 4096, 8192]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare the shift-and-add multiply loop with the clmul paths')
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--base-bits', type=int, nargs='*', default=[1024, 2048, 4096])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    header = ['m', 'loop_us', 'schoolbook_us'] + [f'karatsuba_{bits}_us' for bits in args.base_bits]
+    print(' '.join(f'{column:>18}' for column in header))
+
+    crossover = None
+    for m in M_VALUES:
+        field = get_field(m)
+        poly1, poly2 = rng.getrandbits(m), rng.getrandbits(m)
+        expected = PolyServices._multiply_loop(field, poly1, poly2)
+        assert reduce_poly(field, clmul_schoolbook(poly1, poly2)) == expected
+
+        loop = time_call(lambda: PolyServices._multiply_loop(field, poly1, poly2), args.repeat)
+        schoolbook = time_call(lambda: reduce_poly(field, clmul_schoolbook(poly1, poly2)), args.repeat)
+        karatsuba = [
+            time_call(lambda: reduce_poly(field, clmul_karatsuba(poly1, poly2, bits)), args.repeat)
+            for bits in args.base_bits
+        ]
+        if crossover is None and min([schoolbook] + karatsuba) < loop:
+            crossover = m
+        print(' '.join(f'{value:>18.1f}' if isinstance(value, float) else f'{value:>18}'
+                       for value in [m, loop, schoolbook] + karatsuba))
+
+    print(f'clmul path first beats the loop at m = {crossover}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import argparse
+import random
+from benchmarks.timing import time_call
+from src.fields import get_field
+from src.services import PolyServices
+
+M_VALUES = [17, 32, 64, 163, 233, 283, 571, 1024]
+
+
+def square_and_multiply(field, poly: int, exponent: int) -> int:
+    result = 1
+    for bit in bin(exponent)[2:]:
+        result = PolyServices._multiply(field, result, result)
+        if bit == '1':
+            result = PolyServices._multiply(field, result, poly)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare windowed exponentiation with square-and-multiply')
+    parser.add_argument('--repeat', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    columns = ['m', 'binary_us', 'window_us', 'cached_us', 'speedup']
+    print(' '.join(f'{column:>12}' for column in columns))
+
+    for m in M_VALUES:
+        field = get_field(m)
+        poly = rng.getrandbits(m) | 1
+        exponent = rng.getrandbits(m)
+        expected = square_and_multiply(field, poly, exponent)
+        assert PolyServices._power(field, poly, exponent) == expected
+        assert PolyServices._power(field, poly, exponent, cache_base=True) == expected
+
+        binary_us = time_call(lambda: square_and_multiply(field, poly, exponent), args.repeat)
+        window_us = time_call(lambda: PolyServices._power(field, poly, exponent), args.repeat)
+        cached_us = time_call(lambda: PolyServices._power(field, poly, exponent, cache_base=True), args.repeat)
+        print(f'{m:>12} {binary_us:>12.1f} {window_us:>12.1f} {cached_us:>12.1f} {binary_us / window_us:>11.2f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+import argparse
+import random
+import time
+from src.reed_solomon import get_codec
+
+CODES = [(8, 255, 239), (8, 255, 223), (8, 255, 191), (16, 1024, 960), (16, 4096, 3840)]
+
+
+def throughput(fn, data: bytes) -> float:
+    start = time.perf_counter()
+    fn(data)
+    return len(data) / (time.perf_counter() - start) / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reed-Solomon streaming encode/decode throughput')
+    parser.add_argument('--size', type=int, default=1 << 20, help='payload size in bytes')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    columns = ['code', 'encode_MBps', 'decode_MBps', 'correct_MBps']
+    print(f'{columns[0]:>24} ' + ' '.join(f'{column:>16}' for column in columns[1:]))
+
+    for m, n, k in CODES:
+        codec = get_codec(m, n, k)
+        data = rng.randbytes(args.size - args.size % codec.symbol_bytes)
+        encoded = codec.encode(data)
+
+        # Corrupt half the correctable symbols of every block.
+        corrupted = bytearray(encoded)
+        block_bytes = n * codec.symbol_bytes
+        for start in range(0, len(corrupted), block_bytes):
+            length = min(block_bytes, len(corrupted) - start) // codec.symbol_bytes
+            for position in rng.sample(range(length), min((n - k) // 4, length)):
+                corrupted[start + position * codec.symbol_bytes] ^= rng.randrange(1, 256)
+        corrupted = bytes(corrupted)
+        assert codec.decode(corrupted) == data
+
+        encode = throughput(codec.encode, data)
+        decode = throughput(codec.decode, encoded)
+        correct = throughput(codec.decode, corrupted)
+        print(f'{f"RS({n},{k})/GF(2^{m})":>24} {encode:>16.2f} {decode:>16.2f} {correct:>16.2f}')
+
+
+if __name__ == '__main__':
+    main()
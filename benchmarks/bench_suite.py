@@ -0,0 +1,154 @@
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from itertools import cycle
+from benchmarks.timing import time_call
+from src.result_cache import result_cache
+from src.services import PolyServices
+from src.utils import hex_bin_to_int, int_to_hex_bin
+
+M_VALUES = [8, 16, 64, 163, 571, 4096, 8192]
+MODES = ['service', 'http', 'utils']
+POOL_SIZE = 64
+# The endpoints accept at most 256-bit operands.
+HTTP_BITS = 256
+
+
+def operand_pool(rng: random.Random, bits: int) -> list[tuple[int, int]]:
+    return [(rng.getrandbits(bits) | 1, rng.getrandbits(bits) | 1) for _ in range(POOL_SIZE)]
+
+
+def service_calls(service: PolyServices, m: int, pool: list[tuple[int, int]]) -> dict:
+    pairs = cycle(pool)
+    wide = cycle([(poly1 << m) | poly2 for poly1, poly2 in pool])
+    return {
+        'add': lambda: service.add_in_gf(m, *next(pairs)),
+        'multiply': lambda: service.multiply_in_gf(m, *next(pairs)),
+        'divide': lambda: service.divide_in_gf(m, *next(pairs)),
+        'modulo': lambda: service.modulo_in_gf(m, next(wide)),
+        'invert': lambda: service.invert_in_gf(m, next(pairs)[0]),
+    }
+
+
+def http_calls(client, m: int, pool: list[tuple[int, int]]) -> dict:
+    bits = HTTP_BITS
+    digits = bits // 4
+    doubles = cycle([{'m': m, 'bits': bits, 'type': 'hex',
+                      'hex1': f'{poly1:0{digits}X}', 'hex2': f'{poly2:0{digits}X}'} for poly1, poly2 in pool])
+    singles = cycle([{'m': m, 'bits': bits, 'type': 'hex', 'hex': f'{poly1:0{digits}X}'} for poly1, _ in pool])
+
+    def post(endpoint, bodies):
+        def call():
+            response = client.post(endpoint, json=next(bodies))
+            assert response.status_code == 200, response.data
+        return call
+
+    return {
+        'add': post('/add', doubles),
+        'multiply': post('/multiply', doubles),
+        'divide': post('/divide', doubles),
+        'modulo': post('/modulo', singles),
+        'invert': post('/invert', singles),
+    }
+
+
+def utils_calls(m: int, pool: list[tuple[int, int]]) -> dict:
+    values = [poly1 for poly1, _ in pool]
+    bits = max(m, 16)
+    hexes = cycle([f'{value:X}' for value in values])
+    bins = cycle([f'{value:b}' for value in values])
+    ints = cycle(values)
+    return {
+        'hex_to_int': lambda: hex_bin_to_int(next(hexes), 'hex'),
+        'bin_to_int': lambda: hex_bin_to_int(next(bins), 'bin'),
+        'int_to_hex_bin': lambda: int_to_hex_bin(next(ints), bits),
+    }
+
+
+def run(m_values: list[int], modes: list[str], min_time: float, seed: int) -> dict:
+    rng = random.Random(seed)
+    service = PolyServices()
+    client = None
+    if 'http' in modes:
+        from app import app
+        # Measure the arithmetic, not the opt-in result cache.
+        result_cache.resize(0)
+        client = app.test_client()
+
+    results = {}
+    for m in m_values:
+        pool = operand_pool(rng, m)
+        # Build the field (and search for its modulus) outside the timings.
+        service.invert_in_gf(m, pool[0][0])
+        suites = {}
+        if 'service' in modes:
+            suites['service'] = service_calls(service, m, pool)
+        if 'http' in modes:
+            suites['http'] = http_calls(client, m, operand_pool(rng, min(m, HTTP_BITS)))
+        if 'utils' in modes:
+            suites['utils'] = utils_calls(m, pool)
+        for mode, calls in suites.items():
+            for op, call in calls.items():
+                name = f'{mode}.{op}.m{m}'
+                results[name] = time_call(call, min_time=min_time)
+                print(f'{name:>32} {results[name]:>14.2f} us', flush=True)
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[str]:
+    regressions = []
+    print(f'{"benchmark":>32} {"baseline_us":>14} {"current_us":>14} {"change":>10}')
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        change = current / previous - 1
+        flag = '  REGRESSION' if change > threshold else ''
+        print(f'{name:>32} {previous:>14.2f} {current:>14.2f} {change:>+10.1%}{flag}')
+        if change > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Time every PolyServices operation and the utils conversions over a matrix of m')
+    parser.add_argument('--m', type=int, nargs='*', default=M_VALUES)
+    parser.add_argument('--modes', nargs='*', choices=MODES, default=MODES)
+    parser.add_argument('--min-time', type=float, default=0.05, help='seconds per timed run')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help='write results to this JSON file')
+    parser.add_argument('--compare', help='baseline JSON file written by --output')
+    parser.add_argument('--threshold', type=float, default=0.25, help='allowed slowdown, e.g. 0.25 for 25%%')
+    args = parser.parse_args()
+
+    results = run(args.m, args.modes, args.min_time, args.seed)
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'version': 1,
+                'meta': {
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'seed': args.seed,
+                    'min_time': args.min_time,
+                },
+                'results': results,
+            }, f, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f'{len(regressions)} benchmark(s) slowed down by more than {args.threshold:.0%}: {", ".join(regressions)}')
+            sys.exit(1)
+        print(f'No benchmark slowed down by more than {args.threshold:.0%}')
+
+
+if __name__ == '__main__':
+    main()
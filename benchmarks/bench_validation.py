@@ -0,0 +1,51 @@
+import argparse
+from benchmarks.timing import time_call
+from src.schemas import DoublePolySchema, PowerSchema, SinglePolySchema
+from src.utils import hex_bin_to_int
+from src.validators import validate_double_poly, validate_power, validate_single_poly
+
+REQUESTS = {
+    'single': (SinglePolySchema, validate_single_poly, ('',),
+               {'m': 163, 'bits': 256, 'type': 'hex', 'hex': '7' + 'A' * 40}),
+    'double': (DoublePolySchema, validate_double_poly, ('1', '2'),
+               {'m': 163, 'bits': 256, 'type': 'bin', 'bin1': '10' * 80, 'bin2': '01' * 80}),
+    'power': (PowerSchema, validate_power, ('',),
+              {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A', 'exponent': 254}),
+    'invalid': (DoublePolySchema, validate_double_poly, ('1', '2'),
+                {'m': 0, 'bits': 17, 'type': 'oct', 'hex1': 'ZZ'}),
+}
+
+
+def marshmallow_path(schema_class, suffixes, data):
+    # What the controllers did per request: build the schema, load, then
+    # read and parse the operands from the raw data again.
+    try:
+        schema_class().load(data)
+    except Exception:
+        return None
+    type = data['type']
+    return [hex_bin_to_int(data[type + suffix], type) for suffix in suffixes]
+
+
+def compiled_path(validate, data):
+    try:
+        return validate(data)['operands']
+    except Exception:
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Per-request validation cost: marshmallow schemas vs compiled validators')
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(' '.join(f'{column:>16}' for column in ['request', 'marshmallow_us', 'compiled_us', 'speedup']))
+    for name, (schema_class, validate, suffixes, data) in REQUESTS.items():
+        assert marshmallow_path(schema_class, suffixes, data) == compiled_path(validate, data)
+        marshmallow_us = time_call(lambda: marshmallow_path(schema_class, suffixes, data), args.number)
+        compiled_us = time_call(lambda: compiled_path(validate, data), args.number)
+        print(f'{name:>16} {marshmallow_us:>16.2f} {compiled_us:>16.2f} {marshmallow_us / compiled_us:>15.1f}x')
+
+
+if __name__ == '__main__':
+    main()
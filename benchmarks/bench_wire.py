@@ -0,0 +1,66 @@
+import argparse
+import json
+import random
+from app import app
+from benchmarks.timing import time_call
+from src import wire
+
+# (m, bits of the JSON operands, element width of the binary operands)
+FIELDS = [(8, 16, 1), (16, 16, 2), (64, 64, 8), (163, 256, 21)]
+
+
+def json_request(m: int, bits: int, op: str, records: list[tuple[int, ...]]) -> dict:
+    digits = bits // 4
+    return {'m': m, 'bits': bits, 'type': 'hex', 'operations': [
+        {'op': op, 'operands': [f'{operand:0{digits}X}' for operand in record]} for record in records]}
+
+
+def binary_request(m: int, width: int, op: str, records: list[tuple[int, ...]]) -> bytes:
+    header = wire.HEADER.pack(wire.MAGIC, 1, wire.WIRE_OPERATIONS[op], 0, m, width, len(records))
+    return header + b''.join(operand.to_bytes(width, 'little') for record in records for operand in record)
+
+
+def json_results(response) -> list[int]:
+    return [int(item['result']['hex'], 16) for item in response.json['results']]
+
+
+def binary_results(response, width: int, count: int) -> list[int]:
+    data = response.data[wire.HEADER.size:]
+    return [int.from_bytes(data[i * width:(i + 1) * width], 'little') for i in range(count)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Bulk requests: JSON /batch vs packed /binary')
+    parser.add_argument('--count', type=int, default=1000)
+    parser.add_argument('--op', default='multiply', choices=['add', 'multiply', 'divide', 'invert'])
+    parser.add_argument('--number', type=int, default=10)
+    args = parser.parse_args()
+
+    client = app.test_client()
+    arity = wire.ARITY[args.op]
+    print(' '.join(f'{column:>16}' for column in
+                   ['m', 'json_bytes', 'binary_bytes', 'size_ratio', 'json_ms', 'binary_ms', 'speedup']))
+    for m, bits, width in FIELDS:
+        records = [tuple(random.getrandbits(m) | 1 for _ in range(arity)) for _ in range(args.count)]
+        json_body = json_request(m, bits, args.op, records)
+        binary_body = binary_request(m, width, args.op, records)
+
+        def post_json():
+            return client.post('/batch', json=json_body)
+
+        def post_binary():
+            return client.post('/binary', data=binary_body, content_type=wire.CONTENT_TYPE)
+
+        json_response, binary_response = post_json(), post_binary()
+        assert json_results(json_response) == binary_results(binary_response, width, args.count)
+        json_bytes = len(json.dumps(json_body)) + len(json_response.data)
+        binary_bytes = len(binary_body) + len(binary_response.data)
+
+        json_ms = time_call(post_json, args.number) / 1e3
+        binary_ms = time_call(post_binary, args.number) / 1e3
+        print(f'{m:>16} {json_bytes:>16} {binary_bytes:>16} {json_bytes / binary_bytes:>15.1f}x '
+              f'{json_ms:>16.2f} {binary_ms:>16.2f} {json_ms / binary_ms:>15.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,13 @@
+import timeit
+
+
+def time_call(fn, number: int | None = None, repeat: int = 3, min_time: float = 0.2) -> float:
+    # Microseconds per call, best of `repeat` runs of `number` calls. Without
+    # a number, the loop count grows until one run takes min_time.
+    timer = timeit.Timer(fn)
+    if number is None:
+        number = 1
+        while timer.timeit(number) < min_time and number < 1 << 20:
+            number *= 4
+    number = max(1, number)
+    return min(timer.repeat(repeat=repeat, number=number)) / number * 1e6
@@ -0,0 +1,157 @@
+from src.clmul import multiply_karatsuba
+from src.constants import ADDITIVE_FFT_MIN_LENGTH, ADDITIVE_FFT_TABLE_MIN_LENGTH
+from src.fields import GF2mField
+from src.inversion import invert_itoh_tsujii
+
+# Polynomials over GF(2^m) are lists of field elements, lowest degree first.
+# Transforms of size 2^k evaluate at the field elements 0 .. 2^k - 1, i.e.
+# at every subset sum of the basis 1, x, ..., x^(k-1) (Gao-Mateer).
+
+
+def _multiplier(field: GF2mField):
+    tables = field.log_tables
+    if tables is not None:
+        exp, log = tables.exp, tables.log
+        return lambda poly1, poly2: exp[log[poly1] + log[poly2]] if poly1 and poly2 else 0
+    return lambda poly1, poly2: multiply_karatsuba(field, poly1, poly2)
+
+
+def _invert(field: GF2mField, poly: int) -> int:
+    tables = field.log_tables
+    if tables is not None:
+        return tables.invert(poly)
+    return invert_itoh_tsujii(field, poly)
+
+
+def _levels(field: GF2mField, k: int) -> list[tuple[list[int], list[int], list[int]]]:
+    # One entry per recursion depth for the basis beta_1..beta_L in use
+    # there: powers of beta_L and of its inverse for (un)twisting, and the
+    # span of gamma_i = beta_i / beta_L for the butterflies. The next depth
+    # uses the basis gamma_i^2 + gamma_i.
+    transforms = field.precomputed.setdefault('additive_fft', {})
+    levels = transforms.get(k)
+    if levels is None:
+        multiply = _multiplier(field)
+        basis = [1 << i for i in range(k)]
+        levels = []
+        while basis:
+            last = basis[-1]
+            last_inverse = _invert(field, last)
+            gammas = [multiply(beta, last_inverse) for beta in basis[:-1]]
+            twist = [1]
+            untwist = [1]
+            for _ in range((1 << len(basis)) - 1):
+                twist.append(multiply(twist[-1], last))
+                untwist.append(multiply(untwist[-1], last_inverse))
+            span = [0]
+            for gamma in gammas:
+                span += [alpha ^ gamma for alpha in span]
+            levels.append((twist, untwist, span))
+            basis = [multiply(gamma, gamma) ^ gamma for gamma in gammas]
+        transforms[k] = levels
+    return levels
+
+
+def _taylor(coefficients: list[int], start: int, n: int) -> None:
+    # In-place Taylor expansion at x^2 + x: afterwards positions 2j and
+    # 2j + 1 hold g0_j and g1_j with f(x) = sum (g0_j + x g1_j) (x^2 + x)^j.
+    if n <= 2:
+        return
+    t = 1 << ((n - 1).bit_length() - 2)
+    for i in range(start + n - 1, start + 2 * t - 1, -1):
+        coefficients[i - t] ^= coefficients[i]
+    _taylor(coefficients, start, 2 * t)
+    _taylor(coefficients, start + 2 * t, n - 2 * t)
+
+
+def _untaylor(coefficients: list[int], start: int, n: int) -> None:
+    if n <= 2:
+        return
+    t = 1 << ((n - 1).bit_length() - 2)
+    _untaylor(coefficients, start, 2 * t)
+    _untaylor(coefficients, start + 2 * t, n - 2 * t)
+    for i in range(start + 2 * t, start + n):
+        coefficients[i - t] ^= coefficients[i]
+
+
+def _fft(levels, depth: int, coefficients: list[int], multiply) -> list[int]:
+    if len(coefficients) == 1:
+        return coefficients
+    twist, _, span = levels[depth]
+    twisted = [multiply(coefficient, power) for coefficient, power in zip(coefficients, twist)]
+    _taylor(twisted, 0, len(twisted))
+    values0 = _fft(levels, depth + 1, twisted[0::2], multiply)
+    values1 = _fft(levels, depth + 1, twisted[1::2], multiply)
+    low = [value0 ^ multiply(alpha, value1) for value0, value1, alpha in zip(values0, values1, span)]
+    return low + [value ^ value1 for value, value1 in zip(low, values1)]
+
+
+def _ifft(levels, depth: int, values: list[int], multiply) -> list[int]:
+    n = len(values)
+    if n == 1:
+        return values
+    _, untwist, span = levels[depth]
+    half = n // 2
+    values1 = [low ^ high for low, high in zip(values[:half], values[half:])]
+    values0 = [low ^ multiply(alpha, value1) for low, value1, alpha in zip(values[:half], values1, span)]
+    coefficients = [0] * n
+    coefficients[0::2] = _ifft(levels, depth + 1, values0, multiply)
+    coefficients[1::2] = _ifft(levels, depth + 1, values1, multiply)
+    _untaylor(coefficients, 0, n)
+    return [multiply(coefficient, power) for coefficient, power in zip(coefficients, untwist)]
+
+
+def _transform_size(field: GF2mField, length: int) -> int:
+    k = max(length - 1, 0).bit_length()
+    if k > field.m:
+        raise ValueError(f"Transforms over GF(2^{field.m}) have at most {1 << field.m} points, got {length}")
+    return k
+
+
+def evaluate(field: GF2mField, coefficients: list[int], size: int | None = None) -> list[int]:
+    # Values at the field elements 0 .. size - 1.
+    size = len(coefficients) if size is None else size
+    if len(coefficients) > size:
+        raise ValueError(f"Evaluating {len(coefficients)} coefficients needs at least as many points, got {size}")
+    k = _transform_size(field, size)
+    coefficients = list(coefficients) + [0] * ((1 << k) - len(coefficients))
+    return _fft(_levels(field, k), 0, coefficients, _multiplier(field))[:size]
+
+
+def interpolate(field: GF2mField, values: list[int]) -> list[int]:
+    # Coefficients of the polynomial of degree < len(values) through the
+    # field elements 0 .. len(values) - 1; the length must be a power of two.
+    k = _transform_size(field, len(values))
+    if len(values) != 1 << k:
+        raise ValueError(f"Interpolation needs a power-of-two number of points, got {len(values)}")
+    return _ifft(_levels(field, k), 0, list(values), _multiplier(field))
+
+
+def multiply_schoolbook(field: GF2mField, poly1: list[int], poly2: list[int]) -> list[int]:
+    multiply = _multiplier(field)
+    product = [0] * (len(poly1) + len(poly2) - 1)
+    for i, coefficient1 in enumerate(poly1):
+        if coefficient1:
+            for j, coefficient2 in enumerate(poly2):
+                product[i + j] ^= multiply(coefficient1, coefficient2)
+    return product
+
+
+def multiply_fft(field: GF2mField, poly1: list[int], poly2: list[int]) -> list[int]:
+    length = len(poly1) + len(poly2) - 1
+    k = _transform_size(field, length)
+    levels = _levels(field, k)
+    field_multiply = _multiplier(field)
+    values1 = _fft(levels, 0, list(poly1) + [0] * ((1 << k) - len(poly1)), field_multiply)
+    values2 = _fft(levels, 0, list(poly2) + [0] * ((1 << k) - len(poly2)), field_multiply)
+    product = _ifft(levels, 0, [field_multiply(a, b) for a, b in zip(values1, values2)], field_multiply)
+    return product[:length]
+
+
+def multiply(field: GF2mField, poly1: list[int], poly2: list[int]) -> list[int]:
+    if not poly1 or not poly2:
+        return []
+    min_length = ADDITIVE_FFT_MIN_LENGTH if field.log_tables is None else ADDITIVE_FFT_TABLE_MIN_LENGTH
+    if min(len(poly1), len(poly2)) < min_length or len(poly1) + len(poly2) - 1 > 1 << field.m:
+        return multiply_schoolbook(field, poly1, poly2)
+    return multiply_fft(field, poly1, poly2)
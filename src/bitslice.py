@@ -0,0 +1,158 @@
+import sys
+from array import array
+from src.constants import BITSLICE_KARATSUBA_PLANES, BITSLICE_MIN_BATCH, BITSLICE_MIN_BATCH_PER_BIT, BITSLICE_TABLE_MIN_BATCH
+from src.fields import GF2mField
+
+# Bitsliced GF(2^m) arithmetic over batches of elements. A batch of n
+# elements is transposed into m bit planes: bit j of planes[i] is bit i of
+# element j. One AND or XOR on a plane then acts on all n elements at once,
+# so a multiplication is a fixed circuit of ANDs/XORs (Karatsuba above a
+# few dozen planes) plus the reduction taps, however large the batch.
+
+
+# _BIT_CHARS[b] maps a byte to b'1' if its bit b is set and b'0' otherwise,
+# so translating a column of bytes and parsing it in base 2 packs that bit
+# of every element into one plane. _CHAR_BITS[b] maps b'0'/b'1' back to 0 or
+# 1 << b, so the planes of one byte column OR together as byte strings.
+_BIT_CHARS = [bytes(0x31 if value >> b & 1 else 0x30 for value in range(256)) for b in range(8)]
+_CHAR_BITS = [bytes((1 << b) if value == 0x31 else 0 for value in range(256)) for b in range(8)]
+_ARRAY_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+def _width(m: int) -> int:
+    return (m + 7) // 8
+
+
+def _pack(values: list[int], width: int) -> bytes:
+    code = _ARRAY_CODES.get(width)
+    if code is not None and array(code).itemsize == width:
+        packed = array(code, values)
+        if sys.byteorder == 'big':
+            packed.byteswap()
+        return packed.tobytes()
+    return b''.join(value.to_bytes(width, 'little') for value in values)
+
+
+def _unpack(data: bytes, width: int) -> list[int]:
+    code = _ARRAY_CODES.get(width)
+    if code is not None and array(code).itemsize == width:
+        unpacked = array(code, data)
+        if sys.byteorder == 'big':
+            unpacked.byteswap()
+        return unpacked.tolist()
+    return [int.from_bytes(data[i:i + width], 'little') for i in range(0, len(data), width)]
+
+
+def transpose_in(values: list[int], m: int) -> list[int]:
+    # Operands must be below 2^m. Element j lands in bit j of every plane.
+    if not values:
+        return [0] * m
+    width = _width(m)
+    data = _pack(values, width)
+    planes = []
+    for k in range(width):
+        column = data[k::width][::-1]
+        for b in range(min(8, m - 8 * k)):
+            planes.append(int(column.translate(_BIT_CHARS[b]), 2))
+    return planes
+
+
+def transpose_out(planes: list[int], n: int) -> list[int]:
+    if n == 0:
+        return []
+    width = _width(len(planes))
+    data = bytearray(n * width)
+    for k in range(width):
+        column = 0
+        for b, plane in enumerate(planes[8 * k:8 * k + 8]):
+            chars = format(plane, f'0{n}b').encode('ascii')[::-1]
+            column |= int.from_bytes(chars.translate(_CHAR_BITS[b]), 'little')
+        data[k::width] = column.to_bytes(n, 'little')
+    return _unpack(data, width)
+
+
+def is_worthwhile(field: GF2mField, n: int) -> bool:
+    if field.log_tables is not None:
+        return n >= BITSLICE_TABLE_MIN_BATCH
+    return n >= max(BITSLICE_MIN_BATCH, field.m * BITSLICE_MIN_BATCH_PER_BIT)
+
+
+def _taps(field: GF2mField) -> list[int]:
+    taps = field.precomputed.get('bitslice_taps')
+    if taps is None:
+        low = field.modulus & field.mask
+        taps = field.precomputed['bitslice_taps'] = [t for t in range(field.m) if low >> t & 1]
+    return taps
+
+
+def reduce_planes(field: GF2mField, product: list[int]) -> list[int]:
+    # x^k = x^(k-m) * (modulus - x^m): fold every plane above m - 1 onto the
+    # tap positions, highest first so folded planes get folded again.
+    m = field.m
+    taps = _taps(field)
+    for k in range(len(product) - 1, m - 1, -1):
+        plane = product[k]
+        if plane:
+            base = k - m
+            for t in taps:
+                product[base + t] ^= plane
+    return product[:m]
+
+
+def _schoolbook(planes1: list[int], planes2: list[int]) -> list[int]:
+    product = [0] * (len(planes1) + len(planes2) - 1)
+    for i, a in enumerate(planes1):
+        if a:
+            for j, b in enumerate(planes2, i):
+                product[j] ^= a & b
+    return product
+
+
+def _karatsuba(planes1: list[int], planes2: list[int]) -> list[int]:
+    # Same split as src/clmul.py, over plane lists: three half-size products
+    # instead of four, down to BITSLICE_KARATSUBA_PLANES planes.
+    n = len(planes1)
+    if n <= BITSLICE_KARATSUBA_PLANES:
+        return _schoolbook(planes1, planes2)
+    half = n // 2
+    low1, high1 = planes1[:half], planes1[half:]
+    low2, high2 = planes2[:half], planes2[half:]
+    low = _karatsuba(low1, low2)
+    high = _karatsuba(high1, high2)
+    # Pad the low halves to the high halves' length before adding.
+    size = n - half
+    sum1 = [a ^ b for a, b in zip(low1 + [0] * (size - half), high1)]
+    sum2 = [a ^ b for a, b in zip(low2 + [0] * (size - half), high2)]
+    middle = _karatsuba(sum1, sum2)
+
+    product = [0] * (2 * n - 1)
+    for i, plane in enumerate(low):
+        product[i] = plane
+        middle[i] ^= plane
+    for i, plane in enumerate(high):
+        product[i + 2 * half] ^= plane
+        middle[i] ^= plane
+    for i, plane in enumerate(middle):
+        product[i + half] ^= plane
+    return product
+
+
+def multiply_planes(field: GF2mField, planes1: list[int], planes2: list[int]) -> list[int]:
+    return reduce_planes(field, _karatsuba(planes1, planes2))
+
+
+def square_planes(field: GF2mField, planes: list[int]) -> list[int]:
+    # Squaring is linear over GF(2): plane i moves to plane 2i.
+    product = [0] * (2 * field.m - 1)
+    product[0::2] = planes
+    return reduce_planes(field, product)
+
+
+def multiply_many(field: GF2mField, polys1: list[int], polys2: list[int]) -> list[int]:
+    # Operands must already be reduced (below 2^m).
+    m = field.m
+    return transpose_out(multiply_planes(field, transpose_in(polys1, m), transpose_in(polys2, m)), len(polys1))
+
+
+def square_many(field: GF2mField, polys: list[int]) -> list[int]:
+    return transpose_out(square_planes(field, transpose_in(polys, field.m)), len(polys))
@@ -0,0 +1,283 @@
+import argparse
+import contextlib
+import mmap
+import multiprocessing
+import os
+import sys
+import time
+from src import wire
+from src.constants import CLI_CHUNK_SIZE
+from src.fields import get_field
+from src.services import PolyServices
+
+# Offline bulk processing: python -m src.cli OP -m M -i INPUT -o OUTPUT
+#
+# Input is either packed (records of one or two fixed-width operands, the
+# /binary payload without its header) or text with one record per line,
+# operands separated by whitespace, in hex or bin. The file is memory-mapped
+# and processed in chunks cut on record boundaries; results are written as
+# each chunk finishes, in input order, so a stopped job can be resumed from
+# the last reported input offset; the output file is first cut back to the
+# results for the input before that offset. Elements that fail (division by zero, zero
+# inverse) are written as zero in packed output and as an ERROR line in text
+# output. Blank input lines are skipped.
+
+FORMATS = ('packed', 'hex', 'bin')
+BASES = {'hex': 16, 'bin': 2}
+STATUS_MESSAGES = {
+    wire.STATUS_DIVISION_BY_ZERO: 'ERROR division by zero',
+    wire.STATUS_INVALID: 'ERROR invalid operand',
+}
+
+_service = None
+
+
+class CliError(ValueError):
+    pass
+
+
+class Job:
+    # Everything a worker needs to process a chunk; picklable.
+    def __init__(self, op: str, m: int, input_format: str, output_format: str, width: int, byteorder: str):
+        self.op = op
+        self.m = m
+        self.input_format = input_format
+        self.output_format = output_format
+        self.width = width
+        self.byteorder = byteorder
+        self.arity = wire.ARITY[op]
+        self.record_size = self.arity * width
+
+    def parse_text(self, data) -> list[list[int]]:
+        base = BASES[self.input_format]
+        columns = [[] for _ in range(self.arity)]
+        for line in bytes(data).splitlines():
+            operands = line.split()
+            if not operands:
+                continue
+            if len(operands) != self.arity:
+                raise CliError(f"{self.op} needs {self.arity} operands per line, got {line.decode(errors='replace')!r}")
+            for column, operand in zip(columns, operands):
+                try:
+                    column.append(int(operand, base))
+                except ValueError:
+                    raise CliError(f"{operand.decode(errors='replace')!r} is not a {self.input_format} operand")
+        return columns
+
+    def format_results(self, results, statuses: bytearray) -> bytes:
+        if self.output_format == 'packed':
+            return wire.pack_results(results, statuses, self.width, self.byteorder)
+        if not isinstance(results, list):
+            results = results.tolist()
+        spec = f'0{(self.m + 3) // 4}X' if self.output_format == 'hex' else f'0{self.m}b'
+        lines = [STATUS_MESSAGES[status] if status else format(result, spec)
+                 for result, status in zip(results, statuses)]
+        return ('\n'.join(lines) + '\n').encode('ascii') if lines else b''
+
+
+def process_chunk(job: Job, data) -> tuple[bytes, int, int]:
+    # Returns (output bytes, records, failed records).
+    global _service
+    if _service is None:
+        _service = PolyServices()
+    if job.input_format == 'packed':
+        request = wire.WireRequest(job.op, job.m, job.width, job.byteorder, len(data) // job.record_size, data)
+        results, statuses = wire.evaluate(_service, request)
+    else:
+        results, statuses = wire.evaluate_columns(_service, job.op, job.m, job.parse_text(data))
+    output = job.format_results(results, statuses)
+    return output, len(statuses), len(statuses) - statuses.count(0)
+
+
+def _process_range(task: tuple[str, Job, int, int]) -> tuple[bytes, int, int]:
+    # Worker entry point: map the file again rather than pickling the chunk.
+    path, job, begin, end = task
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        view = memoryview(mapped)[begin:end]
+        try:
+            return process_chunk(job, view)
+        finally:
+            view.release()
+
+
+def chunk_ranges(mapped, job: Job, start: int, chunk_size: int, stop: int | None = None):
+    total = len(mapped) if stop is None else stop
+    if job.input_format == 'packed':
+        chunk_size = max(chunk_size // job.record_size, 1) * job.record_size
+    begin = start
+    while begin < total:
+        end = min(begin + chunk_size, total)
+        if job.input_format != 'packed' and end < total:
+            newline = mapped.find(b'\n', end - 1)
+            end = total if newline < 0 else newline + 1
+        yield begin, end
+        begin = end
+
+
+def records_before(mapped, job: Job, offset: int) -> int:
+    # Records in the input before a resume offset, i.e. results already written.
+    if job.input_format == 'packed':
+        return offset // job.record_size
+    records = 0
+    for begin, end in chunk_ranges(mapped, job, 0, CLI_CHUNK_SIZE, offset):
+        records += sum(1 for line in mapped[begin:end].splitlines() if line.strip())
+    return records
+
+
+class Progress:
+    def __init__(self, total: int, start: int, stream, interval: float = 1.0):
+        self.total = total
+        self.start = start
+        self.offset = start
+        self.records = 0
+        self.failed = 0
+        self.stream = stream
+        self.interval = interval
+        self.started = time.perf_counter()
+        self.reported = self.started
+
+    def update(self, end: int, records: int, failed: int) -> None:
+        self.offset = end
+        self.records += records
+        self.failed += failed
+        now = time.perf_counter()
+        if self.stream is not None and now - self.reported >= self.interval:
+            self.reported = now
+            self.report()
+
+    def report(self) -> None:
+        elapsed = max(time.perf_counter() - self.started, 1e-9)
+        done = self.offset - self.start
+        percent = 100.0 * self.offset / self.total if self.total else 100.0
+        print(f"{self.offset}/{self.total} bytes ({percent:.1f}%), {self.records} records, {self.failed} failed, "
+              f"{done / elapsed / 1e6:.1f} MB/s, {self.records / elapsed:.0f} records/s, "
+              f"resume offset {self.offset}", file=self.stream, flush=True)
+
+
+def _output_offset(output, job: Job, records: int) -> int:
+    # Byte length of the first `records` results in an existing output file.
+    if job.output_format == 'packed':
+        offset = records * job.width
+        if os.fstat(output.fileno()).st_size < offset:
+            raise CliError(f"output holds fewer than the {records} results before the resume offset")
+        return offset
+    offset = 0
+    remaining = records
+    while remaining:
+        block = output.read(CLI_CHUNK_SIZE)
+        if not block:
+            raise CliError(f"output holds fewer than the {records} results before the resume offset")
+        lines = block.count(b'\n')
+        if lines < remaining:
+            remaining -= lines
+            offset += len(block)
+            continue
+        position = -1
+        for _ in range(remaining):
+            position = block.index(b'\n', position + 1)
+        return offset + position + 1
+    return offset
+
+
+def _open_output(path: str, job: Job, records: int):
+    if path == '-':
+        return sys.stdout.buffer
+    if not records:
+        return open(path, 'wb')
+    # Drop anything written past the resume point by the stopped run.
+    output = open(path, 'r+b')
+    try:
+        output.truncate(_output_offset(output, job, records))
+    except BaseException:
+        output.close()
+        raise
+    output.seek(0, os.SEEK_END)
+    return output
+
+
+def run(job: Job, input_path: str, output_path: str, chunk_size: int = CLI_CHUNK_SIZE, jobs: int = 1,
+        resume_from: int = 0, progress_stream=None) -> Progress:
+    with open(input_path, 'rb') as f:
+        total = os.fstat(f.fileno()).st_size
+        if not 0 <= resume_from <= total:
+            raise CliError(f"resume offset {resume_from} is outside the {total}-byte input")
+        if job.input_format == 'packed' and resume_from % job.record_size:
+            raise CliError(f"resume offset must be a multiple of the {job.record_size}-byte record")
+        if job.input_format == 'packed' and (total - resume_from) % job.record_size:
+            raise CliError(f"input size is not a multiple of the {job.record_size}-byte record")
+
+        progress = Progress(total, resume_from, progress_stream)
+        # An empty file cannot be mapped; it has nothing to process either.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) if total else contextlib.nullcontext(b'') as mapped:
+            if job.input_format != 'packed' and 0 < resume_from < total and mapped[resume_from - 1] != ord('\n'):
+                raise CliError(f"resume offset {resume_from} is not at the start of a line")
+            output = _open_output(output_path, job, records_before(mapped, job, resume_from))
+            try:
+                ranges = list(chunk_ranges(mapped, job, resume_from, chunk_size))
+
+                if jobs > 1:
+                    # Resolve the field once here, so for an m outside the
+                    # shipped table the workers read the cached modulus
+                    # instead of each running the same search.
+                    get_field(job.m)
+                    tasks = [(input_path, job, begin, end) for begin, end in ranges]
+                    with multiprocessing.get_context('spawn').Pool(jobs) as pool:
+                        for (_, end), (data, records, failed) in zip(ranges, pool.imap(_process_range, tasks)):
+                            output.write(data)
+                            output.flush()
+                            progress.update(end, records, failed)
+                else:
+                    for begin, end in ranges:
+                        view = memoryview(mapped)[begin:end]
+                        try:
+                            data, records, failed = process_chunk(job, view)
+                        finally:
+                            view.release()
+                        output.write(data)
+                        output.flush()
+                        progress.update(end, records, failed)
+            finally:
+                if output is not sys.stdout.buffer:
+                    output.close()
+    return progress
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.cli', description='Run GF(2^m) operations over files of field elements')
+    parser.add_argument('op', choices=list(wire.WIRE_OPERATIONS), help='power takes the exponent as the second operand')
+    parser.add_argument('-m', type=int, required=True, help='field degree, 1 to 8192')
+    parser.add_argument('-i', '--input', required=True)
+    parser.add_argument('-o', '--output', required=True, help="output file, or - for stdout")
+    parser.add_argument('--format', choices=FORMATS, default='packed', help='input format')
+    parser.add_argument('--output-format', choices=FORMATS, help='defaults to the input format')
+    parser.add_argument('--width', type=int, help='bytes per packed element, at least ceil(m / 8) (the default)')
+    parser.add_argument('--byteorder', choices=['little', 'big'], default='little')
+    parser.add_argument('--chunk-size', type=int, default=CLI_CHUNK_SIZE, help='bytes of input per chunk')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='worker processes')
+    parser.add_argument('--resume-from', type=int, default=0, metavar='OFFSET',
+                        help='input byte offset to start at, as printed in the progress report')
+    parser.add_argument('-q', '--quiet', action='store_true', help='no progress report')
+    args = parser.parse_args(argv)
+
+    if not 1 <= args.m <= 2**13:
+        parser.error('m must be between 1 and 8192')
+    width = args.width or (args.m + 7) // 8
+    if width < (args.m + 7) // 8:
+        parser.error(f'--width must be at least {(args.m + 7) // 8} bytes for m={args.m}')
+    if args.chunk_size < 1 or args.jobs < 1:
+        parser.error('--chunk-size and --jobs must be positive')
+
+    job = Job(args.op, args.m, args.format, args.output_format or args.format, width, args.byteorder)
+    progress_stream = None if args.quiet else sys.stderr
+    try:
+        progress = run(job, args.input, args.output, args.chunk_size, args.jobs, args.resume_from, progress_stream)
+    except (CliError, OSError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if progress_stream is not None:
+        progress.report()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,48 @@
+from src.constants import KARATSUBA_BASE_BITS
+from src.fields import GF2mField
+from src.reduction import reduce_poly
+
+
+def clmul_schoolbook(poly1: int, poly2: int) -> int:
+    if poly1.bit_length() < poly2.bit_length():
+        poly1, poly2 = poly2, poly1
+
+    # Precompute every multiple of poly1 by a w-bit polynomial, then do one
+    # shifted XOR per w-bit window of poly2 instead of one per bit.
+    width = 8 if poly2.bit_length() >= 1024 else 4
+    window = (1 << width) - 1
+    multiples = [0] * (window + 1)
+    for k in range(1, window + 1):
+        low = k & -k
+        multiples[k] = multiples[k ^ low] ^ (poly1 << (low.bit_length() - 1))
+
+    result = 0
+    shift = 0
+    while poly2:
+        digit = poly2 & window
+        if digit:
+            result ^= multiples[digit] << shift
+        poly2 >>= width
+        shift += width
+    return result
+
+
+def clmul_karatsuba(poly1: int, poly2: int, base_bits: int = KARATSUBA_BASE_BITS) -> int:
+    n = max(poly1.bit_length(), poly2.bit_length())
+    if n <= base_bits or min(poly1.bit_length(), poly2.bit_length()) <= base_bits // 2:
+        return clmul_schoolbook(poly1, poly2)
+
+    # Split on a 64-bit word boundary so the halves stay word aligned.
+    half = ((n + 1) // 2 + 63) & ~63
+    mask = (1 << half) - 1
+    low1, high1 = poly1 & mask, poly1 >> half
+    low2, high2 = poly2 & mask, poly2 >> half
+
+    low = clmul_karatsuba(low1, low2, base_bits)
+    high = clmul_karatsuba(high1, high2, base_bits)
+    middle = clmul_karatsuba(low1 ^ high1, low2 ^ high2, base_bits) ^ low ^ high
+    return low ^ (middle << half) ^ (high << (2 * half))
+
+
+def multiply_karatsuba(field: GF2mField, poly1: int, poly2: int) -> int:
+    return reduce_poly(field, clmul_karatsuba(poly1, poly2))
@@ -15,57 +15,180 @@ irreducible_polynomials_map = {
     15: 32771,
     16: 65579,
     17: 131081,
-    18: 262147,
-    19: 524355,
+    18: 262273,
+    19: 524327,
     20: 1048585,
     21: 2097157,
     22: 4194307,
-    23: 8388617,
+    23: 8388641,
     24: 16777243,
     25: 33554441,
-    26: 67108873,
-    27: 134217757,
+    26: 67108935,
+    27: 134217767,
     28: 268435465,
     29: 536870917,
-    30: 1073741825,
+    30: 1073741827,
     31: 2147483657,
-    32: 4294967315,
-    33: 8589934593,
-    34: 17179869209,
-    35: 34359738421,
-    36: 68719476737,
-    37: 137438953481,
-    38: 274877906899,
-    39: 549755813881,
-    40: 1099511627791,
+    32: 4294967493,
+    33: 8589935617,
+    34: 17179869313,
+    35: 34359738373,
+    36: 68719477249,
+    37: 137438953555,
+    38: 274877907043,
+    39: 549755813905,
+    40: 1099511627833,
     41: 2199023255579,
-    42: 4398046511107,
-    43: 8796093022235,
-    44: 17592186044423,
-    45: 35184372088831,
-    46: 70368744177679,
-    47: 140737488355333,
-    48: 281474976710677,
-    49: 562949953421381,
-    50: 1125899906842627,
-    51: 2251799813685253,
-    52: 4503599627370517,
-    53: 9007199254740997,
-    54: 18014398509481999,
-    55: 36028797018963913,
-    56: 72057594037927931,
-    57: 144115188075855859,
-    58: 288230376151711717,
-    59: 576460752303423433,
-    60: 1152921504606846883,
-    61: 2305843009213693951,
-    62: 4611686018427387847,
-    63: 9223372036854775783,
-    64: 18446744073709551557,
-    163: 6277101735386680763835789423207666416102355444464034512895,
-    233: 6901746346790563787434755862277025452451108972170386555162524223799295,
-    239: 8307674973655724205648794126752150369156417774605122925579,
-    283: 3932922657273049864463250699604814463536150735774448675,
-    409: 1044388881413152506691752710716624382579964249047383780384233483283953907971551,
-    571: 3868562622766813359059763193271175310772103296
-}
\ No newline at end of file
+    42: 4398046511233,
+    43: 8796093022297,
+    44: 17592186044449,
+    45: 35184372088859,
+    46: 70368744177667,
+    47: 140737488355361,
+    48: 281474976710701,
+    49: 562949953421825,
+    50: 1125899906842653,
+    51: 2251799813685323,
+    52: 4503599627370505,
+    53: 9007199254741063,
+    54: 18014398509482497,
+    55: 36028797018964097,
+    56: 72057594037928085,
+    57: 144115188075855889,
+    58: 288230376152236033,
+    59: 576460752303423637,
+    60: 1152921504606846979,
+    61: 2305843009213693991,
+    62: 4611686018964258817,
+    63: 9223372036854775811,
+    64: 18446744073709551643
+}
+
+# Standard (NIST / SEC 2) trinomials and pentanomials, as exponent lists
+standard_sparse_polynomials = {
+    163: (163, 7, 6, 3, 0),
+    233: (233, 74, 0),
+    239: (239, 158, 0),
+    283: (283, 12, 7, 5, 0),
+    409: (409, 87, 0),
+    571: (571, 10, 5, 2, 0)
+}
+
+irreducible_polynomials_map.update(
+    (m, sum(1 << exponent for exponent in exponents))
+    for m, exponents in standard_sparse_polynomials.items()
+)
+
+LOG_TABLE_MAX_M = 16
+SPARSE_MAX_TAPS = 4
+FIELD_CACHE_SIZE = 64
+
+BATCH_OPERATIONS = {
+    'add': 2,
+    'subtract': 2,
+    'multiply': 2,
+    'divide': 2,
+    'modulo': 1,
+    'invert': 1,
+    'square': 1,
+    'sqrt': 1,
+}
+
+MAX_BATCH_SIZE = 10000
+
+VECTORIZE_MAX_M = 64
+VECTORIZE_MIN_BATCH = 32
+
+KARATSUBA_MIN_M = 32
+KARATSUBA_BASE_BITS = 4096
+REDUCTION_WINDOW_BITS = 8
+
+SIEVE_MAX_DEGREE = 16
+PRIMITIVE_SEARCH_MAX_M = 32
+
+# benchmarks/bench_invert.py: on CPython the binary Euclid beats
+# Itoh-Tsujii for every m the API accepts, so it is opt-in by default.
+ITOH_TSUJII_MIN_M = 2**13 + 1
+MULTI_SQUARE_MIN_K = 16
+MULTI_SQUARE_TABLE_MAX_M = 1024
+
+POWER_TABLE_CACHE_SIZE = 16
+
+REED_SOLOMON_M_VALUES = (8, 16)
+# Request limits: building a codec costs O((n - k)^2) field operations and
+# decoding a block O(n * (n - k)); at these sizes both stay around 0.1-0.3 s.
+REED_SOLOMON_MAX_N = 4096
+REED_SOLOMON_MAX_NSYM = 256
+# Codecs kept per field, least recently used evicted first.
+REED_SOLOMON_CODEC_CACHE_SIZE = 8
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Schoolbook is faster below this many coefficients (benchmarks/bench_additive_fft.py);
+# with log tables a field multiplication is cheap enough to move the crossover up.
+ADDITIVE_FFT_MIN_LENGTH = 64
+ADDITIVE_FFT_TABLE_MIN_LENGTH = 256
+
+NDJSON_MAX_LINE_BYTES = 1 << 20
+
+# Result cache is opt-in: set GF_RESULT_CACHE_BYTES to a byte budget.
+RESULT_CACHE_BYTES = 0
+RESULT_CACHE_ENTRY_OVERHEAD = 64
+RESULT_CACHE_MAX_ENTRY_FRACTION = 1 / 64
+# Pinned entries sit outside the byte budget, so their number is capped.
+RESULT_CACHE_MAX_PINNED = 256
+
+TABLE_FILE_VERSION = 1
+
+# /metrics histogram buckets: request latency and phase time in seconds,
+# payload size in bytes, and the upper bounds of the m label buckets.
+METRICS_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+METRICS_PAYLOAD_BUCKETS = (64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+METRICS_M_BUCKETS = (8, 16, 64, 256, 1024, 2**13)
+
+# Process-pool offload is opt-in: set GF_OFFLOAD_WORKERS to a worker count.
+# Operations run in the pool from these m on, where a call holds the GIL for
+# a millisecond or more (benchmarks/bench_suite.py); the rest stay inline.
+OFFLOAD_WORKERS = 0
+OFFLOAD_TIMEOUT = 10.0
+OFFLOAD_MIN_M = {
+    'multiply': 8192,
+    'divide': 2048,
+    'invert': 2048,
+    'sqrt': 8192,
+    'power': 1024,
+}
+
+# Binary wire format (src/wire.py): operation codes and limits.
+WIRE_VERSION = 1
+WIRE_OPERATIONS = {
+    'add': 1,
+    'subtract': 2,
+    'multiply': 3,
+    'divide': 4,
+    'modulo': 5,
+    'invert': 6,
+    'square': 7,
+    'sqrt': 8,
+    'power': 9,
+}
+WIRE_MAX_WIDTH = 2048
+WIRE_MAX_PAYLOAD_BYTES = 16 << 20
+
+# Result encodings a request can ask for with `output`; hex_bin returns both
+# strings, as every endpoint did before the option existed.
+OUTPUT_FORMATS = ('hex_bin', 'hex', 'bin', 'int', 'bytes')
+DEFAULT_OUTPUT_FORMAT = 'hex_bin'
+
+# Bitsliced batches (src/bitslice.py): schoolbook below this many planes.
+# A batch is bitsliced from max(BITSLICE_MIN_BATCH, m * BITSLICE_MIN_BATCH_PER_BIT)
+# elements on; fields with log tables multiply fast enough one at a time
+# to need BITSLICE_TABLE_MIN_BATCH (benchmarks/bench_bitslice.py).
+BITSLICE_KARATSUBA_PLANES = 16
+BITSLICE_MIN_BATCH = 128
+BITSLICE_MIN_BATCH_PER_BIT = 2
+BITSLICE_TABLE_MIN_BATCH = 1024
+# Past this m squaring one element at a time (spread_bits) is faster.
+BITSLICE_SQUARE_MAX_M = 256
+
+# Offline CLI (src/cli.py): bytes of input handed to one evaluation.
+CLI_CHUNK_SIZE = 1 << 20
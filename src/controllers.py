@@ -1,14 +1,48 @@
-from flask import Blueprint, request, jsonify
+import json
+from itertools import chain
+from flask import Blueprint, Response, g, has_app_context, request, jsonify, stream_with_context
 from marshmallow import ValidationError
-from src.services import PolyServices
-from src.schemas import SinglePolySchema, DoublePolySchema
-from src.utils import hex_bin_to_int, int_to_hex_bin
-from src.logger import logger
+from src import schemas, validators, wire
+from src.fields import field_cache
+from src.formatting import get_formatter
+from src.offload import OffloadTimeoutError, offload_pool
+from src.metrics import CONTENT_TYPE, RequestMetrics, TimedService, registry, timed_validator
+from src.result_cache import CachePinError, result_cache
+from src.services import CachedPolyServices
+from src.constants import DEFAULT_OUTPUT_FORMAT, NDJSON_MAX_LINE_BYTES, STREAM_CHUNK_SIZE
+from src.schemas import BatchSchema, PinSchema, ReedSolomonSchema
+from src.utils import hex_bin_to_int
+from src.logger import logger, operation_logger
 
 
 poly_endpoints = Blueprint('poly_endpoints', __name__)
 
 
+def current_request_metrics() -> RequestMetrics | None:
+    return g.get('request_metrics') if has_app_context() else None
+
+
+service = TimedService(CachedPolyServices(result_cache, offload_pool), current_request_metrics)
+validate_single_poly = timed_validator(validators.validate_single_poly, current_request_metrics)
+validate_double_poly = timed_validator(validators.validate_double_poly, current_request_metrics)
+validate_power = timed_validator(validators.validate_power, current_request_metrics)
+validate_batch_operation = timed_validator(schemas.validate_batch_operation, current_request_metrics)
+
+
+@poly_endpoints.before_request
+def start_request_metrics():
+    g.request_metrics = RequestMetrics(request.endpoint.rpartition('.')[2] if request.endpoint else 'unknown')
+
+
+@poly_endpoints.after_request
+def finish_request_metrics(response):
+    metrics = g.pop('request_metrics', None)
+    if metrics is not None:
+        metrics.finish(response.status_code, request.content_length,
+                       None if response.is_streamed else response.content_length)
+    return response
+
+
 @poly_endpoints.route('/add', methods=['POST'])
 def add():
     """
@@ -61,6 +95,10 @@ def add():
               type: string
               required: false
               description: The second polynomial in hexadecimal
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial addition result
@@ -68,42 +106,31 @@ def add():
             description: Validation error
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter add endpoint")
-    data = request.json
-    schema = DoublePolySchema()
-
+    operation_logger.debug("Enter add endpoint")
     try:
-        schema.load(data)
+        data = validate_double_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in add endpoint: {e.messages}")
+        logger.info("Validation error in add endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
-    
+
     m = data['m']
     bits = data['bits']
-    type = data['type']
-
-    service = PolyServices()
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly1, poly2 = data['operands']
 
     try:
-        poly1 = data[type + '1']
-        poly2 = data[type + '2']
-
-        poly1 = hex_bin_to_int(poly1, type)
-        poly2 = hex_bin_to_int(poly2, type)
-
         result = service.add_in_gf(m, poly1, poly2)
-        hex_result, bin_result = int_to_hex_bin(result, bits)
 
-        logger.info("Exit add endpoint")
-        return jsonify({
-            'result': {
-                'hex': hex_result,
-                'bin': bin_result
-            }
-        }), 200
+        operation_logger.debug("Exit add endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in add endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in add endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in add endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
 
@@ -152,6 +179,10 @@ def subtract():
             hex2:
               type: string
               description: Second polynomial in hexadecimal
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial subtraction result
@@ -159,42 +190,31 @@ def subtract():
             description: Validation error
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter subtract endpoint")
-    data = request.json
-    schema = DoublePolySchema()
-
+    operation_logger.debug("Enter subtract endpoint")
     try:
-        schema.load(data)
+        data = validate_double_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in subtract endpoint: {e.messages}")
+        logger.info("Validation error in subtract endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
 
     m = data['m']
     bits = data['bits']
-    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly1, poly2 = data['operands']
 
-    service = PolyServices()
-    
     try:
-        poly1 = data[type + '1']
-        poly2 = data[type + '2']
-
-        poly1 = hex_bin_to_int(poly1, type)
-        poly2 = hex_bin_to_int(poly2, type)
-
         result = service.subtract_in_gf(m, poly1, poly2)
-        hex_result, bin_result = int_to_hex_bin(result, bits)
 
-        logger.info("Exit subtract endpoint")
-        return jsonify({
-            'result': {
-                'hex': hex_result,
-                'bin': bin_result
-            }
-        }), 200
+        operation_logger.debug("Exit subtract endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in subtract endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in subtract endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in subtract endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
     
 @poly_endpoints.route('/multiply', methods=['POST'])
@@ -241,6 +261,10 @@ def multiply():
             hex2:
               type: string
               description: Second polynomial in hexadecimal 
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial multiplication result
@@ -248,42 +272,31 @@ def multiply():
             description: Validation error
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter multiply endpoint")
-    data = request.json
-    schema = DoublePolySchema()
-
+    operation_logger.debug("Enter multiply endpoint")
     try:
-        schema.load(data)
+        data = validate_double_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in multiply endpoint: {e.messages}")
+        logger.info("Validation error in multiply endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
-    
+
     m = data['m']
     bits = data['bits']
-    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly1, poly2 = data['operands']
 
-    service = PolyServices()
-    
     try:
-        poly1 = data[type + '1']
-        poly2 = data[type + '2']
-
-        poly1 = hex_bin_to_int(poly1, type)
-        poly2 = hex_bin_to_int(poly2, type)
-          
         result = service.multiply_in_gf(m, poly1, poly2)
-        hex_result, bin_result = int_to_hex_bin(result, bits)
 
-        logger.info("Exit multiply endpoint")
-        return jsonify({
-            'result': {
-                'hex': hex_result,
-                'bin': bin_result
-            }
-        }), 200
+        operation_logger.debug("Exit multiply endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in multiply endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in multiply endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in multiply endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
 
@@ -331,6 +344,10 @@ def divide():
             hex2:
               type: string
               description: Second polynomial in hexadecimal 
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial multiplication result
@@ -342,45 +359,35 @@ def divide():
             description: Polynomial not invertible
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter divide endpoint")
-    data = request.json
-    schema = DoublePolySchema()
-
+    operation_logger.debug("Enter divide endpoint")
     try:
-        schema.load(data)
+        data = validate_double_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in divide endpoint: {e.messages}")
+        logger.info("Validation error in divide endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
-    
+
     m = data['m']
     bits = data['bits']
-    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    dividend, divisor = data['operands']
 
-    service = PolyServices()
-    
     try:
-        dividend = data[type + '1']
-        divisor = data[type + '2']
-
-        dividend = hex_bin_to_int(dividend, type)
-        divisor = hex_bin_to_int(divisor, type)
-        
         result = service.divide_in_gf(m, dividend, divisor)
 
-        result_hex, result_bin = int_to_hex_bin(result, bits)
-
-        logger.info("Exit divide endpoint")
-        return jsonify({
-            'hex': result_hex,
-            'bin': result_bin
-        }), 200
+        operation_logger.debug("Exit divide endpoint")
+        return jsonify(get_formatter(bits, output)(result)), 200
     except ZeroDivisionError as e:
         return jsonify({'error': str(e)}), 404
     except ValueError as e:
         return jsonify({'error': str(e)}), 405
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in divide endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in divide endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in divide endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
     
 @poly_endpoints.route('/modulo', methods=['POST'])
@@ -419,6 +426,10 @@ def modulo():
             hex:
               type: string
               description: Polynomial in hexadecimal 
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial modulo reduction result
@@ -426,39 +437,31 @@ def modulo():
             description: Validation error
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter modulo endpoint")
-    data = request.json
-    schema = SinglePolySchema()
-
+    operation_logger.debug("Enter modulo endpoint")
     try:
-        schema.load(data)
+        data = validate_single_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in modulo endpoint: {e.messages}")
+        logger.info("Validation error in modulo endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
-    
+
     m = data['m']
     bits = data['bits']
-    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly = data['operands'][0]
 
-    service = PolyServices()
-    
     try:
-        poly = data[type]
-        poly = hex_bin_to_int(poly, type)
-
         result = service.modulo_in_gf(m, poly)
-        hex_result, bin_result = int_to_hex_bin(result, bits)
 
-        logger.info("Exit modulo endpoint")
-        return jsonify({
-            'result': {
-                'hex': hex_result,
-                'bin': bin_result
-            }
-        }), 200
+        operation_logger.debug("Exit modulo endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in modulo endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in modulo endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in modulo endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
     
 @poly_endpoints.route('/invert', methods=['POST'])
@@ -497,6 +500,10 @@ def invert():
             hex:
               type: string
               description: Polynomial in hexadecimal
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
     responses:
         200:
             description: Polynomial inversion result
@@ -506,39 +513,876 @@ def invert():
             description: Polynomial not invertible
         500:
             description: Internal server error
+        504:
+            description: Offloaded computation timed out
     """
-    logger.info("Enter invert endpoint")
-    data = request.json
-    schema = SinglePolySchema()
-
+    operation_logger.debug("Enter invert endpoint")
     try:
-        schema.load(data)
+        data = validate_single_poly(request.json)
     except ValidationError as e:
-        logger.info(f"Validation error in invert endpoint: {e.messages}")
+        logger.info("Validation error in invert endpoint: %s", e.messages)
         return jsonify({'error': e.messages}), 400
-    
+
     m = data['m']
     bits = data['bits']
-    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly = data['operands'][0]
+
+    try:
+        result = service.invert_in_gf(m, poly)
 
-    service = PolyServices()
+        operation_logger.debug("Exit invert endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 405
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in invert endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except Exception as e:
+        logger.error("An unexpected error occurred in invert endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
 
+
+@poly_endpoints.route('/power', methods=['POST'])
+def power():
+    """
+    Raise a polynomial to an integer power in GF(2^m)
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - bin
+            - hex
+            - exponent
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            bin:
+              type: string
+              description: Polynomial in binary
+            hex:
+              type: string
+              description: Polynomial in hexadecimal
+            exponent:
+              type: integer
+              description: The exponent; negative exponents raise the inverse
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
+    responses:
+        200:
+            description: Polynomial exponentiation result
+        400:
+            description: Validation error
+        405:
+            description: Zero raised to a negative power
+        500:
+            description: Internal server error
+        504:
+            description: Offloaded computation timed out
+    """
+    operation_logger.debug("Enter power endpoint")
     try:
-        poly = data[type]
-        poly = hex_bin_to_int(poly, type)
+        data = validate_power(request.json)
+    except ValidationError as e:
+        logger.info("Validation error in power endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
 
-        result = service.invert_in_gf(m, poly)
-        hex_result, bin_result = int_to_hex_bin(result,bits)
+    m = data['m']
+    bits = data['bits']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly = data['operands'][0]
 
-        logger.info("Exit invert endpoint")
-        return jsonify({
-            'result': {
-                'hex': hex_result,
-                'bin': bin_result
-            }
-        }), 200
+    try:
+        result = service.pow_in_gf(m, poly, data['exponent'])
+
+        operation_logger.debug("Exit power endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
     except ValueError as e:
         return jsonify({'error': str(e)}), 405
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in power endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except Exception as e:
+        logger.error("An unexpected error occurred in power endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+@poly_endpoints.route('/square', methods=['POST'])
+def square():
+    """
+    Square a polynomial in GF(2^m)
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - bin
+            - hex
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            bin:
+              type: string
+              description: Polynomial in binary
+            hex:
+              type: string
+              description: Polynomial in hexadecimal
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
+    responses:
+        200:
+            description: Polynomial squaring result
+        400:
+            description: Validation error
+        500:
+            description: Internal server error
+        504:
+            description: Offloaded computation timed out
+    """
+    operation_logger.debug("Enter square endpoint")
+    try:
+        data = validate_single_poly(request.json)
+    except ValidationError as e:
+        logger.info("Validation error in square endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    m = data['m']
+    bits = data['bits']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly = data['operands'][0]
+
+    try:
+        result = service.square_in_gf(m, poly)
+
+        operation_logger.debug("Exit square endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in square endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except Exception as e:
+        logger.error("An unexpected error occurred in square endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+@poly_endpoints.route('/sqrt', methods=['POST'])
+def sqrt():
+    """
+    Take the square root of a polynomial in GF(2^m)
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - bin
+            - hex
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            bin:
+              type: string
+              description: Polynomial in binary
+            hex:
+              type: string
+              description: Polynomial in hexadecimal
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
+    responses:
+        200:
+            description: Polynomial square root result
+        400:
+            description: Validation error
+        500:
+            description: Internal server error
+        504:
+            description: Offloaded computation timed out
+    """
+    operation_logger.debug("Enter sqrt endpoint")
+    try:
+        data = validate_single_poly(request.json)
+    except ValidationError as e:
+        logger.info("Validation error in sqrt endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    m = data['m']
+    bits = data['bits']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    poly = data['operands'][0]
+
+    try:
+        result = service.sqrt_in_gf(m, poly)
+
+        operation_logger.debug("Exit sqrt endpoint")
+        return jsonify({'result': get_formatter(bits, output)(result)}), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in sqrt endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except Exception as e:
+        logger.error("An unexpected error occurred in sqrt endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+@poly_endpoints.route('/batch', methods=['POST'])
+def batch():
+    """
+    Run a batch of operations in GF(2^m)
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - operations
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            operations:
+              type: array
+              description: Operations to run, in order
+              items:
+                type: object
+                properties:
+                  op:
+                    type: string
+                    description: One of add, subtract, multiply, divide, modulo, invert, square, sqrt
+                  operands:
+                    type: array
+                    description: One or two polynomials in the batch input type
+                    items:
+                      type: string
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
+    responses:
+        200:
+            description: Positional results, each holding a result or an error with its status
+        400:
+            description: Validation error
+        500:
+            description: Internal server error
+        504:
+            description: Offloaded computation timed out
+    """
+    operation_logger.debug("Enter batch endpoint")
+    data = request.json
+    schema = BatchSchema()
+
+    try:
+        schema.load(data)
+    except ValidationError as e:
+        logger.info("Validation error in batch endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    m = data['m']
+    bits = data['bits']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    type = data['type']
+
+    results = [None] * len(data['operations'])
+    positions = []
+    operations = []
+    for index, operation in enumerate(data['operations']):
+        try:
+            op, operands = validate_batch_operation(operation, type, bits)
+        except ValidationError as e:
+            results[index] = {'error': e.messages, 'status': 400}
+            continue
+        positions.append(index)
+        operations.append((op, [hex_bin_to_int(operand, type) for operand in operands]))
+
+    try:
+        outputs = service.batch_in_gf(m, operations)
+
+        for index, result in zip(positions, outputs):
+            if isinstance(result, ZeroDivisionError):
+                results[index] = {'error': str(result), 'status': 404}
+            elif isinstance(result, ValueError):
+                results[index] = {'error': str(result), 'status': 405}
+            else:
+                results[index] = result
+
+        operation_logger.debug("Exit batch endpoint")
+        return Response(get_formatter(bits, output).batch_body(results), mimetype='application/json'), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in batch endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except Exception as e:
+        logger.error("An unexpected error occurred in batch endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+def _reed_solomon_stream(name: str, method) -> tuple[Response, int]:
+    schema = ReedSolomonSchema()
+
+    try:
+        params = schema.load(request.args)
+    except ValidationError as e:
+        logger.info("Validation error in %s endpoint: %s", name, e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    try:
+        chunks = iter(lambda: request.stream.read(STREAM_CHUNK_SIZE), b'')
+        blocks = method(params['m'], params['n'], params['k'], chunks)
+        # Produce the first block up front so that errors in it still get a
+        # status code; later ones can only cut the stream short.
+        first = next(blocks, b'')
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 405
+    except Exception as e:
+        logger.error("An unexpected error occurred in %s endpoint: %s", name, e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+    def generate():
+        try:
+            yield from chain([first], blocks)
+        except Exception as e:
+            logger.error("Aborting %s stream: %s", name, e)
+            return
+        operation_logger.debug("Exit %s endpoint", name)
+
+    return Response(stream_with_context(generate()), mimetype='application/octet-stream'), 200
+
+
+@poly_endpoints.route('/reed-solomon/encode', methods=['POST'])
+def reed_solomon_encode():
+    """
+    Encode a payload with a Reed-Solomon code over GF(2^m)
+    ---
+    tags:
+        - reed-solomon
+    consumes:
+        - application/octet-stream
+    produces:
+        - application/octet-stream
+    parameters:
+      - in: query
+        name: m
+        type: integer
+        required: true
+        description: Symbol size in bits (8 or 16)
+      - in: query
+        name: n
+        type: integer
+        required: true
+        description: Codeword length in symbols, at most 4096
+      - in: query
+        name: k
+        type: integer
+        required: true
+        description: Message length in symbols; n - k is at most 256
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: string
+          format: binary
+        description: Raw payload; the last block may be shorter than k symbols
+    responses:
+        200:
+            description: Encoded blocks of n symbols, streamed as it is produced
+        400:
+            description: Validation error
+        405:
+            description: Payload cannot be split into symbols
+        500:
+            description: Internal server error
+    """
+    operation_logger.debug("Enter Reed-Solomon encode endpoint")
+    return _reed_solomon_stream('Reed-Solomon encode', service.rs_encode_stream)
+
+
+@poly_endpoints.route('/reed-solomon/decode', methods=['POST'])
+def reed_solomon_decode():
+    """
+    Decode a payload with a Reed-Solomon code over GF(2^m)
+    ---
+    tags:
+        - reed-solomon
+    consumes:
+        - application/octet-stream
+    produces:
+        - application/octet-stream
+    parameters:
+      - in: query
+        name: m
+        type: integer
+        required: true
+        description: Symbol size in bits (8 or 16)
+      - in: query
+        name: n
+        type: integer
+        required: true
+        description: Codeword length in symbols, at most 4096
+      - in: query
+        name: k
+        type: integer
+        required: true
+        description: Message length in symbols; n - k is at most 256
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: string
+          format: binary
+        description: Encoded blocks of n symbols; the last block may be shorter
+    responses:
+        200:
+            description: Decoded message, streamed as it is produced
+        400:
+            description: Validation error
+        405:
+            description: Malformed or uncorrectable block
+        500:
+            description: Internal server error
+    """
+    operation_logger.debug("Enter Reed-Solomon decode endpoint")
+    return _reed_solomon_stream('Reed-Solomon decode', service.rs_decode_stream)
+
+
+STREAM_OPERATIONS = {
+    'add': (validate_double_poly, service.add_in_gf),
+    'subtract': (validate_double_poly, service.subtract_in_gf),
+    'multiply': (validate_double_poly, service.multiply_in_gf),
+    'divide': (validate_double_poly, service.divide_in_gf),
+    'modulo': (validate_single_poly, service.modulo_in_gf),
+    'invert': (validate_single_poly, service.invert_in_gf),
+    'square': (validate_single_poly, service.square_in_gf),
+    'sqrt': (validate_single_poly, service.sqrt_in_gf),
+    'power': (validate_power, service.pow_in_gf),
+}
+
+
+def _stream_operation(line: bytes) -> dict:
+    try:
+        data = json.loads(line)
+        if not isinstance(data, dict):
+            raise ValidationError('Each line must be a JSON object')
+        op = data.pop('op', None)
+        if op not in STREAM_OPERATIONS:
+            raise ValidationError(f'op must be one of: {", ".join(STREAM_OPERATIONS)}')
+        validate, method = STREAM_OPERATIONS[op]
+        data = validate(data)
+    except ValidationError as e:
+        return {'error': e.messages, 'status': 400}
+    except ValueError as e:
+        return {'error': f'Invalid JSON: {str(e)}', 'status': 400}
+
+    m = data['m']
+    bits = data['bits']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+    operands = data['operands']
+    if 'exponent' in data:
+        operands.append(data['exponent'])
+
+    try:
+        result = method(m, *operands)
+        return {'result': get_formatter(bits, output)(result)}
+    except ZeroDivisionError as e:
+        return {'error': str(e), 'status': 404}
+    except ValueError as e:
+        return {'error': str(e), 'status': 405}
+    except OffloadTimeoutError as e:
+        return {'error': str(e), 'status': 504}
+    except Exception as e:
+        logger.error("An unexpected error occurred in stream endpoint: %s", e)
+        return {'error': f'Internal server error: {str(e)}', 'status': 500}
+
+
+@poly_endpoints.route('/stream', methods=['POST'])
+def stream():
+    """
+    Run newline-delimited JSON operations in GF(2^m), streaming one result line per operation
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/x-ndjson
+    produces:
+        - application/x-ndjson
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: string
+        description: >
+          One JSON object per line with an op (add, subtract, multiply,
+          divide, modulo, invert, square, sqrt, power) and the fields of the
+          matching endpoint. Blank lines are skipped.
+    responses:
+        200:
+            description: One line per operation holding a result or an error with its status
+    """
+    operation_logger.debug("Enter stream endpoint")
+
+    def generate():
+        count = 0
+        while True:
+            line = request.stream.readline(NDJSON_MAX_LINE_BYTES + 1)
+            if not line:
+                break
+            if len(line) > NDJSON_MAX_LINE_BYTES and not line.endswith(b'\n'):
+                # Skip the rest of an oversized line without buffering it.
+                while line and not line.endswith(b'\n'):
+                    line = request.stream.readline(STREAM_CHUNK_SIZE)
+                output = {'error': f'Lines must be at most {NDJSON_MAX_LINE_BYTES} bytes', 'status': 400}
+            elif not line.strip():
+                continue
+            else:
+                output = _stream_operation(line)
+            count += 1
+            yield json.dumps(output) + '\n'
+        operation_logger.debug("Exit stream endpoint after %s operations", count)
+
+    return Response(stream_with_context(generate()), mimetype='application/x-ndjson'), 200
+
+
+@poly_endpoints.route('/cache/stats', methods=['GET'])
+def cache_stats():
+    """
+    Result and field cache counters
+    ---
+    tags:
+        - cache
+    responses:
+        200:
+            description: Sizes and hit, miss and eviction counters of the result cache and the field cache
+    """
+    return jsonify({'results': result_cache.stats(), 'fields': field_cache.stats(), 'offload': offload_pool.stats()}), 200
+
+
+@poly_endpoints.route('/cache/pin', methods=['POST'])
+def cache_pin():
+    """
+    Compute an operation and pin its result in the result cache
+    ---
+    tags:
+        - cache
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - op
+            - operands
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            op:
+              type: string
+              description: One of add, subtract, multiply, divide, modulo, invert, square, sqrt
+            operands:
+              type: array
+              description: One or two polynomials in the input type
+              items:
+                type: string
+            output:
+              type: string
+              required: false
+              description: Result encoding, one of hex_bin (default, both strings), hex, bin, int or bytes (base64)
+    responses:
+        200:
+            description: The pinned result; it is never evicted
+        400:
+            description: Validation error
+        409:
+            description: The result cache is disabled or already holds the maximum number of pinned entries
+        404:
+            description: Division by zero
+        405:
+            description: Polynomial not invertible
+        500:
+            description: Internal server error
+        504:
+            description: Offloaded computation timed out
+    """
+    operation_logger.debug("Enter cache pin endpoint")
+    data = request.json
+    schema = PinSchema()
+
+    try:
+        schema.load(data)
+        op, operands = validate_batch_operation(data, data['type'], data['bits'])
+    except ValidationError as e:
+        logger.info("Validation error in cache pin endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    m = data['m']
+    bits = data['bits']
+    type = data['type']
+    output = data.get('output', DEFAULT_OUTPUT_FORMAT)
+
+    try:
+        operands = [hex_bin_to_int(operand, type) for operand in operands]
+        result = service.pin(op, m, operands)
+
+        operation_logger.debug("Exit cache pin endpoint")
+        return jsonify({
+            'result': get_formatter(bits, output)(result),
+            'pinned': result_cache.stats()['pinned']
+        }), 200
+    except CachePinError as e:
+        logger.info("Cache pin rejected: %s", e)
+        return jsonify({'error': str(e)}), 409
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in cache pin endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
+    except ZeroDivisionError as e:
+        return jsonify({'error': str(e)}), 404
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 405
+    except Exception as e:
+        logger.error("An unexpected error occurred in cache pin endpoint: %s", e)
+        return jsonify({'error': f'Internal server error: {str(e)}'}), 500
+
+
+@poly_endpoints.route('/cache/unpin', methods=['POST'])
+def cache_unpin():
+    """
+    Remove a pinned result from the result cache
+    ---
+    tags:
+        - cache
+    consumes:
+        - application/json
+    parameters:
+      - in: body
+        name: body
+        schema:
+          type: object
+          required:
+            - m
+            - bits
+            - type
+            - op
+            - operands
+          properties:
+            m:
+              type: integer
+              description: The degree of the polynomial (1 to 2^13)
+            bits:
+              type: integer
+              description: The number of bits (16,32,64,128,256)
+            type:
+              type: string
+              description: Input type ('bin' or 'hex')
+            op:
+              type: string
+              description: The operation the result was pinned for
+            operands:
+              type: array
+              description: The operands it was pinned with
+              items:
+                type: string
+    responses:
+        200:
+            description: Whether an entry was unpinned, and the number still pinned
+        400:
+            description: Validation error
+    """
+    operation_logger.debug("Enter cache unpin endpoint")
+    data = request.json
+    schema = PinSchema()
+
+    try:
+        schema.load(data)
+        op, operands = validate_batch_operation(data, data['type'], data['bits'])
+    except ValidationError as e:
+        logger.info("Validation error in cache unpin endpoint: %s", e.messages)
+        return jsonify({'error': e.messages}), 400
+
+    operands = [hex_bin_to_int(operand, data['type']) for operand in operands]
+    unpinned = service.unpin(op, data['m'], operands)
+    operation_logger.debug("Exit cache unpin endpoint")
+    return jsonify({'unpinned': unpinned, 'pinned': result_cache.stats()['pinned']}), 200
+
+
+@poly_endpoints.route('/cache/clear', methods=['POST'])
+def cache_clear():
+    """
+    Empty the result cache, pinned entries included, and reset its counters
+    ---
+    tags:
+        - cache
+    responses:
+        200:
+            description: The result cache counters after clearing
+    """
+    result_cache.clear(pinned=True)
+    logger.info("Result cache cleared")
+    return jsonify({'results': result_cache.stats()}), 200
+
+
+@poly_endpoints.route('/metrics', methods=['GET'])
+def metrics():
+    """
+    Request metrics in the Prometheus text format
+    ---
+    tags:
+        - metrics
+    produces:
+        - text/plain
+    responses:
+        200:
+            description: Request and error counts, latency histograms by operation and m, payload sizes and time per phase
+    """
+    return Response(registry.render(), content_type=CONTENT_TYPE), 200
+
+
+def _read_limited_body(limit: int) -> bytearray | None:
+    # None when the body is larger than limit. The declared length is checked
+    # before reading, and a body without one is read only one chunk past limit.
+    if request.content_length is not None and request.content_length > limit:
+        return None
+    body = bytearray()
+    for chunk in iter(lambda: request.stream.read(STREAM_CHUNK_SIZE), b''):
+        body += chunk
+        if len(body) > limit:
+            return None
+    return body
+
+
+@poly_endpoints.route('/binary', methods=['POST'])
+def binary():
+    """
+    Apply one operation to packed binary operands
+    ---
+    tags:
+        - poly
+    consumes:
+        - application/octet-stream
+    produces:
+        - application/octet-stream
+    description: |
+        Header (16 bytes, little-endian): magic "GF2B", version (1), op code
+        (1 add, 2 subtract, 3 multiply, 4 divide, 5 modulo, 6 invert, 7 square,
+        8 sqrt, 9 power), flags (bit 0 set for big-endian elements), one pad
+        byte, m (uint16), element width in bytes (uint16), count (uint32).
+        Then count records of one or two operands (power carries the exponent
+        second), each element width bytes. The response has the same header,
+        count results and one status byte per result (0 ok, 1 division by
+        zero, 2 invalid operand or not invertible).
+    parameters:
+      - in: body
+        name: body
+        required: true
+        schema:
+          type: string
+          format: binary
+    responses:
+        200:
+            description: Packed results followed by status bytes
+        400:
+            description: Malformed header or payload
+        413:
+            description: Request larger than the header and the maximum payload
+        500:
+            description: Internal server error
+    """
+    operation_logger.debug("Enter binary endpoint")
+    body = _read_limited_body(wire.MAX_MESSAGE_BYTES)
+    if body is None:
+        logger.info("Oversized request in binary endpoint: %s bytes", request.content_length)
+        return jsonify({'error': f"Request must be at most {wire.MAX_MESSAGE_BYTES} bytes"}), 413
+
+    try:
+        message = wire.decode(body)
+    except wire.WireFormatError as e:
+        logger.info("Validation error in binary endpoint: %s", e)
+        return jsonify({'error': str(e)}), 400
+
+    try:
+        results, statuses = wire.evaluate(service, message)
+        body = wire.encode(message, results, statuses)
+
+        operation_logger.debug("Exit binary endpoint after %s %s operations", message.count, message.op)
+        return Response(body, content_type=wire.CONTENT_TYPE), 200
+    except OffloadTimeoutError as e:
+        logger.warning("Timed out in binary endpoint: %s", e)
+        return jsonify({'error': str(e)}), 504
     except Exception as e:
-        logger.error(f"An unexpected error occurred in invert endpoint: {str(e)}")
+        logger.error("An unexpected error occurred in binary endpoint: %s", e)
         return jsonify({'error': f'Internal server error: {str(e)}'}), 500
@@ -0,0 +1,216 @@
+import sys
+from array import array
+from functools import partial
+from src.clmul import multiply_karatsuba
+from src.constants import KARATSUBA_MIN_M
+from src.fields import GF2mField, get_field
+from src.inversion import invert_itoh_tsujii, use_itoh_tsujii
+from src.reduction import reduce_poly, square_poly
+from src.services import PolyServices
+
+# Field elements as values: GF2mElement(0x57, 8) * GF2mElement(0x83, 8).
+# An element is an int and a reference to the FieldContext of its field,
+# which picks the fastest kernels for the field once (log tables up to
+# m = 16, Karatsuba from KARATSUBA_MIN_M, Itoh-Tsujii inversion where it
+# wins) so an operation is one kernel call with no lookup or logging.
+# Elements have no __dict__; each costs one two-slot object on top of its int.
+
+_ARRAY_CODES = {1: 'B', 2: 'H', 4: 'I', 8: 'Q'}
+
+
+class FieldContext:
+    __slots__ = ('field', 'm', 'modulus', 'multiply', 'square', 'invert', 'divide', 'power')
+
+    def __init__(self, field: GF2mField):
+        self.field = field
+        self.m = field.m
+        self.modulus = field.modulus
+        tables = field.log_tables
+        if tables is not None:
+            self.multiply = tables.multiply
+            self.square = lambda poly: tables.multiply(poly, poly)
+            self.invert = tables.invert
+            self.divide = tables.divide
+            self.power = tables.power
+            return
+        if field.m >= KARATSUBA_MIN_M:
+            self.multiply = partial(multiply_karatsuba, field)
+        else:
+            self.multiply = partial(PolyServices._multiply_loop, field)
+        self.square = partial(square_poly, field)
+        if use_itoh_tsujii(field.m):
+            self.invert = partial(invert_itoh_tsujii, field)
+        else:
+            self.invert = self._invert_euclid
+        self.divide = self._divide
+        self.power = self._power
+
+    def __repr__(self) -> str:
+        return f"FieldContext(m={self.m}, modulus={self.modulus:#x})"
+
+    def _invert_euclid(self, poly: int) -> int:
+        if poly == 0:
+            raise ValueError(f"Zero has no inverse in GF(2^{self.m})")
+        return reduce_poly(self.field, PolyServices._invert_euclid(poly, self.modulus))
+
+    def _divide(self, dividend: int, divisor: int) -> int:
+        if divisor == 0:
+            raise ZeroDivisionError(f"Division by zero in GF(2^{self.m})")
+        return self.multiply(dividend, self.invert(divisor))
+
+    def _power(self, poly: int, exponent: int) -> int:
+        if poly == 0:
+            if exponent < 0:
+                raise ValueError(f"Zero has no inverse in GF(2^{self.m})")
+            return 1 if exponent == 0 else 0
+        if exponent < 0:
+            poly = self.invert(poly)
+            exponent = -exponent
+        return PolyServices._power(self.field, poly, exponent % ((1 << self.m) - 1))
+
+    def reduce(self, poly: int) -> int:
+        if poly < 0:
+            raise ValueError("Field elements must be non-negative")
+        return poly if poly >> self.m == 0 else reduce_poly(self.field, poly)
+
+
+def get_context(m: int, modulus: int | None = None) -> FieldContext:
+    field = get_field(m, modulus)
+    context = field.precomputed.get('element_context')
+    if context is None:
+        context = field.precomputed['element_context'] = FieldContext(field)
+    return context
+
+
+class GF2mElement:
+    __slots__ = ('value', 'context')
+
+    def __init__(self, value: int, m: int, modulus: int | None = None):
+        context = get_context(m, modulus)
+        _set_value(self, context.reduce(value))
+        _set_context(self, context)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    __delattr__ = __setattr__
+
+    def __reduce__(self):
+        return GF2mElement, (self.value, self.context.m, self.context.modulus)
+
+    @property
+    def m(self) -> int:
+        return self.context.m
+
+    # Bulk constructors. Values of m bits or more are reduced.
+
+    @classmethod
+    def from_array(cls, values, m: int, modulus: int | None = None) -> list['GF2mElement']:
+        # Any iterable of ints: a list, an array.array or a numpy array.
+        if hasattr(values, 'tolist'):
+            values = values.tolist()
+        context = get_context(m, modulus)
+        reduce = context.reduce
+        return [_element(context, reduce(value)) for value in values]
+
+    @classmethod
+    def from_bytes(cls, data, m: int, width: int | None = None, byteorder: str = 'little',
+                   modulus: int | None = None) -> list['GF2mElement']:
+        # Consecutive fixed-width elements, ceil(m / 8) bytes each by default.
+        width = width or (m + 7) // 8
+        view = memoryview(data).cast('B')
+        if len(view) % width:
+            raise ValueError(f"Data length {len(view)} is not a multiple of the {width}-byte element width")
+        code = _ARRAY_CODES.get(width)
+        if code is not None and array(code).itemsize == width:
+            values = array(code)
+            values.frombytes(view)
+            if byteorder != sys.byteorder:
+                values.byteswap()
+        else:
+            from_bytes = int.from_bytes
+            values = [from_bytes(view[i:i + width], byteorder) for i in range(0, len(view), width)]
+        return cls.from_array(values, m, modulus)
+
+    @classmethod
+    def from_hex(cls, values, m: int, modulus: int | None = None) -> list['GF2mElement']:
+        # A whitespace-separated string or an iterable of hex strings, with or
+        # without a 0x prefix.
+        if isinstance(values, str):
+            values = values.split()
+        return cls.from_array([int(value, 16) for value in values], m, modulus)
+
+    def _check(self, other) -> FieldContext:
+        context = self.context
+        if other.context is not context and (other.context.m, other.context.modulus) != (context.m, context.modulus):
+            raise ValueError(f"Cannot combine elements of GF(2^{context.m}) and GF(2^{other.context.m})")
+        return context
+
+    def __add__(self, other):
+        if type(other) is not GF2mElement:
+            return NotImplemented
+        return _element(self._check(other), self.value ^ other.value)
+
+    __sub__ = __add__
+
+    def __mul__(self, other):
+        if type(other) is not GF2mElement:
+            return NotImplemented
+        context = self._check(other)
+        if self is other:
+            return _element(context, context.square(self.value))
+        return _element(context, context.multiply(self.value, other.value))
+
+    def __truediv__(self, other):
+        if type(other) is not GF2mElement:
+            return NotImplemented
+        context = self._check(other)
+        return _element(context, context.divide(self.value, other.value))
+
+    def __pow__(self, exponent: int):
+        if not isinstance(exponent, int):
+            return NotImplemented
+        context = self.context
+        if exponent == 2:
+            return _element(context, context.square(self.value))
+        return _element(context, context.power(self.value, exponent))
+
+    def __invert__(self):
+        context = self.context
+        return _element(context, context.invert(self.value))
+
+    def __neg__(self):
+        # -a == a in characteristic 2.
+        return self
+
+    def __eq__(self, other):
+        if type(other) is not GF2mElement:
+            return NotImplemented
+        context, other_context = self.context, other.context
+        return self.value == other.value and (
+            context is other_context or (context.m, context.modulus) == (other_context.m, other_context.modulus))
+
+    def __hash__(self) -> int:
+        return hash((self.context.m, self.value))
+
+    def __bool__(self) -> bool:
+        return self.value != 0
+
+    def __int__(self) -> int:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"GF2mElement({self.value:#x}, m={self.context.m})"
+
+
+_set_value = GF2mElement.value.__set__
+_set_context = GF2mElement.context.__set__
+_new = object.__new__
+
+
+def _element(context: FieldContext, value: int) -> GF2mElement:
+    # Skips __init__: value is already reduced.
+    element = _new(GF2mElement)
+    _set_value(element, value)
+    _set_context(element, context)
+    return element
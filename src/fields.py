@@ -0,0 +1,97 @@
+import os
+from collections import OrderedDict
+from threading import Lock
+from src.constants import LOG_TABLE_MAX_M, SPARSE_MAX_TAPS, FIELD_CACHE_SIZE
+from src.tables import LogTables
+from src.table_store import load_log_tables
+from src.irreducible import get_irreducible_polynomial
+
+
+class GF2mField:
+    __slots__ = ('m', 'modulus', 'degree', 'mask', 'high_bit', 'reduction_modulus', 'taps', 'precomputed', '_log_tables')
+
+    def __init__(self, m: int, modulus: int):
+        self.m = m
+        self.modulus = modulus
+        self.degree = modulus.bit_length() - 1
+        self.mask = (1 << m) - 1
+        self.high_bit = 1 << (m - 1)
+        # Multiplication reduces by x^m plus the low m bits of the modulus.
+        # When that has a few low-degree terms it is also kept as their
+        # exponents, so a 2m-bit product folds down in a handful of passes.
+        low_terms = modulus & self.mask
+        self.reduction_modulus = (1 << m) | low_terms
+        self.taps = None
+        if low_terms.bit_count() <= SPARSE_MAX_TAPS and low_terms.bit_length() <= 3 * m // 4 + 1:
+            self.taps = tuple(i for i in range(low_terms.bit_length() - 1, -1, -1) if (low_terms >> i) & 1)
+        self.precomputed = {}
+        self._log_tables = None
+
+    def __repr__(self) -> str:
+        return f"GF2mField(m={self.m}, modulus={self.modulus:#x})"
+
+    @property
+    def log_tables(self) -> LogTables | None:
+        if self._log_tables is None and 2 <= self.m <= LOG_TABLE_MAX_M:
+            self._log_tables = load_log_tables(self.m, self.modulus)
+        return self._log_tables
+
+
+class FieldCache:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fields: OrderedDict[tuple[int, int], GF2mField] = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def get(self, m: int, modulus: int | None = None) -> GF2mField:
+        if modulus is None:
+            modulus = get_irreducible_polynomial(m)
+        key = (m, modulus)
+        with self._lock:
+            field = self._fields.get(key)
+            if field is not None:
+                self._fields.move_to_end(key)
+                self.hits += 1
+                return field
+            self.misses += 1
+            field = GF2mField(m, modulus)
+            self._fields[key] = field
+            self._evict()
+            return field
+
+    def resize(self, maxsize: int) -> None:
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fields.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            'size': len(self._fields),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+        }
+
+    def _evict(self) -> None:
+        while len(self._fields) > max(self.maxsize, 0):
+            self._fields.popitem(last=False)
+            self.evictions += 1
+
+
+field_cache = FieldCache(int(os.environ.get('GF_FIELD_CACHE_SIZE', FIELD_CACHE_SIZE)))
+
+
+def get_field(m: int, modulus: int | None = None) -> GF2mField:
+    return field_cache.get(m, modulus)
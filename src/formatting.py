@@ -0,0 +1,67 @@
+import base64
+import json
+from functools import lru_cache
+from src.constants import DEFAULT_OUTPUT_FORMAT, OUTPUT_FORMATS
+
+# Result encodings. A ResultFormatter is built once per (bits, output) with
+# its format specs precomputed, and formats a result either as the dict the
+# endpoints put under 'result' or directly as a JSON fragment, which batches
+# join into one response body without a generic JSON encoder pass.
+
+
+class ResultFormatter:
+    def __init__(self, bits: int, output: str = DEFAULT_OUTPUT_FORMAT):
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"output must be one of: {', '.join(OUTPUT_FORMATS)}")
+        self.bits = bits
+        self.output = output
+        self.hex_spec = f'0{bits // 4}X'
+        self.bin_spec = f'0{bits}b'
+        self.size = bits // 8
+
+    def _bytes(self, number: int) -> str:
+        size = max(self.size, (number.bit_length() + 7) // 8)
+        return base64.b64encode(number.to_bytes(size, 'big')).decode('ascii')
+
+    def __call__(self, number: int) -> dict:
+        output = self.output
+        if output == 'hex':
+            return {'hex': '0x' + format(number, self.hex_spec)}
+        if output == 'bin':
+            return {'bin': '0b' + format(number, self.bin_spec)}
+        if output == 'int':
+            return {'int': number}
+        if output == 'bytes':
+            return {'bytes': self._bytes(number)}
+        return {'hex': '0x' + format(number, self.hex_spec), 'bin': '0b' + format(number, self.bin_spec)}
+
+    def json(self, number: int) -> str:
+        # The same value as json.dumps(self(number)); hex, bin and base64
+        # digits never need escaping.
+        output = self.output
+        if output == 'hex':
+            return '{"hex":"0x' + format(number, self.hex_spec) + '"}'
+        if output == 'bin':
+            return '{"bin":"0b' + format(number, self.bin_spec) + '"}'
+        if output == 'int':
+            return '{"int":' + str(number) + '}'
+        if output == 'bytes':
+            return '{"bytes":"' + self._bytes(number) + '"}'
+        return ('{"hex":"0x' + format(number, self.hex_spec) + '","bin":"0b' + format(number, self.bin_spec) + '"}')
+
+    def batch_body(self, results: list) -> str:
+        # {"results": [...]} where each item is an int result or an error dict.
+        parts = []
+        append = parts.append
+        to_json = self.json
+        for item in results:
+            if isinstance(item, int):
+                append('{"result":' + to_json(item) + '}')
+            else:
+                append(json.dumps(item))
+        return '{"results":[' + ','.join(parts) + ']}\n'
+
+
+@lru_cache(maxsize=None)
+def get_formatter(bits: int, output: str = DEFAULT_OUTPUT_FORMAT) -> ResultFormatter:
+    return ResultFormatter(bits, output)
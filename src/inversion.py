@@ -0,0 +1,79 @@
+import os
+from src.clmul import multiply_karatsuba
+from src.constants import ITOH_TSUJII_MIN_M, MULTI_SQUARE_MIN_K, MULTI_SQUARE_TABLE_MAX_M
+from src.fields import GF2mField
+from src.reduction import multi_square_poly, square_poly
+
+itoh_tsujii_min_m = int(os.environ.get('GF_ITOH_TSUJII_MIN_M', ITOH_TSUJII_MIN_M))
+
+
+def _addition_chain(n: int) -> list[int]:
+    # Binary addition chain for n, read from the top bit: each step doubles
+    # the exponent (k -> 2k) and a set bit then adds one (2k -> 2k + 1).
+    return [int(bit) for bit in bin(n)[3:]]
+
+
+def _chain(field: GF2mField) -> list[int]:
+    chain = field.precomputed.get('itoh_tsujii_chain')
+    if chain is None:
+        chain = field.precomputed['itoh_tsujii_chain'] = _addition_chain(field.m - 1)
+    return chain
+
+
+def _multi_square_table(field: GF2mField, count: int) -> list[list[int]]:
+    # poly -> poly^(2^count) is linear over GF(2), so it is tabulated on
+    # 4-bit slices of the input: row j holds the images of every
+    # b * x^(4j), built from the images of single monomials
+    # x^i -> (x^(2^count))^i.
+    tables = field.precomputed.setdefault('multi_square_tables', {})
+    table = tables.get(count)
+    if table is None:
+        step = multi_square_poly(field, 2, count)
+        images = [1]
+        for _ in range(field.m - 1):
+            images.append(multiply_karatsuba(field, images[-1], step))
+        images += [0] * (-len(images) % 4)
+
+        table = []
+        for j in range(0, len(images), 4):
+            row = [0] * 16
+            for b in range(1, 16):
+                low = b & -b
+                row[b] = row[b ^ low] ^ images[j + low.bit_length() - 1]
+            table.append(row)
+        tables[count] = table
+    return table
+
+
+def multi_square(field: GF2mField, poly: int, count: int) -> int:
+    if count < MULTI_SQUARE_MIN_K or field.m > MULTI_SQUARE_TABLE_MAX_M:
+        return multi_square_poly(field, poly, count)
+
+    result = 0
+    for row in _multi_square_table(field, count):
+        result ^= row[poly & 15]
+        poly >>= 4
+    return result
+
+
+def invert_itoh_tsujii(field: GF2mField, poly: int) -> int:
+    # Fermat: poly^-1 = poly^(2^m - 2) = (poly^(2^(m-1) - 1))^2. With
+    # beta_k = poly^(2^k - 1), beta_(j+k) = beta_j^(2^k) * beta_k, so
+    # beta_(m-1) takes m - 1 squarings and O(log m) multiplications, in the
+    # same sequence for every input.
+    if poly == 0:
+        raise ValueError(f"Zero has no inverse in GF(2^{field.m})")
+
+    beta = poly
+    k = 1
+    for bit in _chain(field):
+        beta = multiply_karatsuba(field, multi_square(field, beta, k), beta)
+        k *= 2
+        if bit:
+            beta = multiply_karatsuba(field, square_poly(field, beta), poly)
+            k += 1
+    return square_poly(field, beta)
+
+
+def use_itoh_tsujii(m: int) -> bool:
+    return m >= itoh_tsujii_min_m
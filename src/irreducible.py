@@ -0,0 +1,272 @@
+import json
+import os
+from threading import Lock
+from src.constants import irreducible_polynomials_map, SIEVE_MAX_DEGREE, PRIMITIVE_SEARCH_MAX_M
+from src.squaring import spread_bits
+from src.logger import logger
+
+
+def _prime_factors(n: int) -> list[int]:
+    factors = []
+    d = 2
+    while d * d <= n:
+        if n % d == 0:
+            factors.append(d)
+            while n % d == 0:
+                n //= d
+        d += 1 if d == 2 else 2
+    if n > 1:
+        factors.append(n)
+    return factors
+
+
+def _gcd(poly1: int, poly2: int) -> int:
+    while poly2:
+        degree = poly2.bit_length()
+        while poly1.bit_length() >= degree:
+            poly1 ^= poly2 << (poly1.bit_length() - degree)
+        poly1, poly2 = poly2, poly1
+    return poly1
+
+
+class _Modulus:
+    def __init__(self, poly: int):
+        self.poly = poly
+        self.m = poly.bit_length() - 1
+        self.mask = (1 << self.m) - 1
+        low_terms = poly & self.mask
+        self.taps = None
+        if low_terms.bit_count() <= 8 and low_terms.bit_length() <= 3 * self.m // 4 + 1:
+            self.taps = [i for i in range(low_terms.bit_length()) if (low_terms >> i) & 1]
+
+    def reduce(self, value: int) -> int:
+        m = self.m
+        if self.taps is None:
+            while value.bit_length() > m:
+                value ^= self.poly << (value.bit_length() - 1 - m)
+            return value
+        mask = self.mask
+        while value >> m:
+            high = value >> m
+            value &= mask
+            for tap in self.taps:
+                value ^= high << tap
+        return value
+
+    def multiply(self, poly1: int, poly2: int) -> int:
+        result = 0
+        while poly2:
+            if poly2 & 1:
+                result ^= poly1
+            poly2 >>= 1
+            poly1 <<= 1
+        return self.reduce(result)
+
+    def power(self, base: int, exponent: int) -> int:
+        result = 1
+        while exponent:
+            if exponent & 1:
+                result = self.multiply(result, base)
+            base = self.reduce(spread_bits(base))
+            exponent >>= 1
+        return result
+
+
+def is_irreducible(poly: int) -> bool:
+    # Rabin: f of degree m is irreducible iff x^(2^m) = x (mod f) and
+    # gcd(f, x^(2^(m/q)) - x) = 1 for every prime q dividing m.
+    m = poly.bit_length() - 1
+    if m < 1:
+        return False
+    if m == 1:
+        return True
+    if not poly & 1:
+        return False
+
+    modulus = _Modulus(poly)
+    checkpoints = {m // q for q in _prime_factors(m)}
+    saved = {}
+    power = 2
+    for i in range(1, m + 1):
+        power = modulus.reduce(spread_bits(power))
+        if i in checkpoints:
+            saved[i] = power
+    if power != 2:
+        return False
+    return all(_gcd(poly, saved[i] ^ 2) == 1 for i in checkpoints)
+
+
+def is_primitive(poly: int) -> bool:
+    m = poly.bit_length() - 1
+    if not is_irreducible(poly):
+        return False
+    if m == 1:
+        return True
+    order = (1 << m) - 1
+    modulus = _Modulus(poly)
+    return all(modulus.power(2, order // q) != 1 for q in _prime_factors(order))
+
+
+class _SmallFactorSieve:
+    # Residues of x^e modulo every irreducible polynomial of small degree, so
+    # a sparse candidate with a small factor is rejected with a few table
+    # lookups instead of a full Rabin test. Rabin costs grow with m squared,
+    # so larger fields sieve deeper.
+    def __init__(self, m: int):
+        max_degree = min(SIEVE_MAX_DEGREE, m.bit_length() + 2, m - 1)
+        self.divisors = [g for g in range(3, 1 << (max_degree + 1), 2) if is_irreducible(g)]
+        self.moduli = [_Modulus(g) for g in self.divisors]
+        self.x_to_m = [modulus.power(2, m) for modulus in self.moduli]
+        self.powers = [[1] for _ in self.divisors]
+
+    def _power(self, index: int, exponent: int) -> int:
+        powers = self.powers[index]
+        modulus = self.moduli[index]
+        while len(powers) <= exponent:
+            powers.append(modulus.reduce(powers[-1] << 1))
+        return powers[exponent]
+
+    def has_small_factor(self, exponents: tuple[int, ...]) -> bool:
+        for index in range(len(self.divisors)):
+            residue = self.x_to_m[index]
+            for exponent in exponents:
+                residue ^= self._power(index, exponent)
+            if residue == 0:
+                return True
+        return False
+
+
+def _candidates(m: int, weight: int):
+    if weight == 3:
+        # Swan's theorem: no trinomial of degree 8k is irreducible.
+        if m % 8 == 0:
+            return
+        for k in range(1, m // 2 + 1):
+            yield (k, 0)
+    else:
+        for a in range(3, m):
+            for b in range(2, a):
+                for c in range(1, b):
+                    yield (a, b, c, 0)
+
+
+def find_irreducible(m: int, primitive: bool | None = None) -> int:
+    if m < 1:
+        raise ValueError(f"Degree must be positive, got {m}")
+    if m == 1:
+        return 0b11
+    if primitive is None:
+        primitive = m <= PRIMITIVE_SEARCH_MAX_M
+
+    sieve = _SmallFactorSieve(m)
+    for weight in (3, 5):
+        fallback = None
+        for exponents in _candidates(m, weight):
+            if sieve.has_small_factor(exponents):
+                continue
+            poly = (1 << m) | sum(1 << exponent for exponent in exponents)
+            if not is_irreducible(poly):
+                continue
+            if not primitive or is_primitive(poly):
+                return poly
+            if fallback is None:
+                fallback = poly
+        if fallback is not None:
+            return fallback
+    raise ValueError(f"No irreducible trinomial or pentanomial of degree {m}")
+
+
+def verify_table(table: dict[int, int]) -> tuple[dict[int, int], list[int]]:
+    verified = {}
+    rejected = []
+    for m, poly in table.items():
+        if poly.bit_length() - 1 == m and is_irreducible(poly):
+            verified[m] = poly
+        else:
+            rejected.append(m)
+    return verified, rejected
+
+
+class IrreducibleCache:
+    def __init__(self, path: str | None):
+        self.path = path
+        self._polynomials: dict[int, int] | None = None
+        # _lock guards the dict and the file; a search holds only the lock
+        # for its own degree, so lookups and other degrees never wait on it.
+        self._lock = Lock()
+        self._searches: dict[int, Lock] = {}
+
+    def _load(self) -> dict[int, int]:
+        if self._polynomials is None:
+            self._polynomials = self._read()
+        return self._polynomials
+
+    def _read(self) -> dict[int, int]:
+        if not self.path or not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path) as f:
+                stored = json.load(f)
+            polynomials = {int(m): int(poly, 16) for m, poly in stored.get('polynomials', {}).items()}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning("Ignoring unreadable irreducible polynomial cache %s: %s", self.path, e)
+            return {}
+        return {m: poly for m, poly in polynomials.items() if poly.bit_length() - 1 == m}
+
+    def _write(self) -> None:
+        if not self.path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            # Merge with whatever other workers stored since we last read.
+            polynomials = {**self._read(), **self._polynomials}
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w') as f:
+                json.dump({'version': 1, 'polynomials': {str(m): hex(poly) for m, poly in sorted(polynomials.items())}}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.warning("Could not write irreducible polynomial cache %s: %s", self.path, e)
+
+    def _cached(self, m: int) -> int | None:
+        polynomials = self._polynomials
+        if polynomials is None:
+            with self._lock:
+                polynomials = self._load()
+        return polynomials.get(m)
+
+    def get(self, m: int) -> int:
+        poly = self._cached(m)
+        if poly is not None:
+            return poly
+        with self._lock:
+            search = self._searches.setdefault(m, Lock())
+        with search:
+            # Another caller may have finished the same search meanwhile.
+            poly = self._cached(m)
+            if poly is None:
+                logger.info("Searching for an irreducible polynomial of degree %s", m)
+                poly = find_irreducible(m)
+                with self._lock:
+                    self._polynomials[m] = poly
+                    self._write()
+        with self._lock:
+            self._searches.pop(m, None)
+        return poly
+
+
+verified_polynomials, rejected_degrees = verify_table(irreducible_polynomials_map)
+if rejected_degrees:
+    logger.warning("Shipped moduli are not irreducible of the right degree for m = %s; "
+                   "they will be replaced by generated polynomials", rejected_degrees)
+
+irreducible_cache = IrreducibleCache(os.environ.get(
+    'GF_IRREDUCIBLE_CACHE',
+    os.path.join(os.path.expanduser('~'), '.cache', 'polynomial_arithmetic', 'irreducible.json'),
+))
+
+
+def get_irreducible_polynomial(m: int) -> int:
+    poly = verified_polynomials.get(m)
+    if poly is None:
+        poly = irreducible_cache.get(m)
+    return poly
@@ -1,13 +1,84 @@
+import atexit
 import logging
+import os
+import queue
+from itertools import count
+from logging.handlers import QueueHandler, QueueListener
+from threading import Lock
 
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 
-logging.basicConfig(
-        level=logging.DEBUG,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(),
-            logging.FileHandler('app.log')
-        ]
-    )
 
-logger = logging.getLogger('Polynomial_Arithmetic')
\ No newline at end of file
+class DeferredQueueHandler(QueueHandler):
+    # Records never leave the process, so there is no need to format them
+    # into picklable strings on the calling thread: message formatting (and
+    # any int-to-string conversion of its arguments) runs on the listener.
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class SamplingFilter(logging.Filter):
+    # Keeps an evenly spaced fraction `rate` of the records it sees.
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = min(max(rate, 0.0), 1.0)
+        self._counter = count()
+        self._lock = Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if self.rate >= 1.0:
+            return True
+        with self._lock:
+            n = next(self._counter)
+        return int((n + 1) * self.rate) > int(n * self.rate)
+
+
+def shutdown_logging() -> None:
+    global listener
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+        listener = None
+
+
+def configure_logging(level: str | None = None, log_file: str | None = None,
+                      sample_rate: float | None = None) -> QueueListener:
+    global listener
+    shutdown_logging()
+    level = (level or os.environ.get('GF_LOG_LEVEL', 'INFO')).upper()
+    log_file = os.environ.get('GF_LOG_FILE', 'app.log') if log_file is None else log_file
+    sample_rate = float(os.environ.get('GF_LOG_SAMPLE_RATE', 1.0)) if sample_rate is None else sample_rate
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = [logging.StreamHandler()]
+    if log_file:
+        handlers.append(logging.FileHandler(log_file))
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    records = queue.SimpleQueue()
+    listener = QueueListener(records, *handlers, respect_handler_level=True)
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        if isinstance(handler, DeferredQueueHandler):
+            root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(records))
+    root.setLevel(level)
+
+    for existing in list(operation_logger.filters):
+        operation_logger.removeFilter(existing)
+    if sample_rate < 1.0:
+        operation_logger.addFilter(SamplingFilter(sample_rate))
+
+    listener.start()
+    return listener
+
+
+logger = logging.getLogger('Polynomial_Arithmetic')
+# Per-operation "Enter/Exit" traces: DEBUG level, optionally sampled.
+operation_logger = logger.getChild('operations')
+
+listener: QueueListener | None = None
+configure_logging()
+atexit.register(shutdown_logging)
@@ -0,0 +1,227 @@
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from functools import wraps
+from threading import Lock
+from src.constants import METRICS_LATENCY_BUCKETS, METRICS_M_BUCKETS, METRICS_PAYLOAD_BUCKETS
+
+# In-process metrics in the Prometheus text exposition format. Every family
+# guards its samples with one lock and an update is a dict lookup plus an
+# addition, so recording stays well below the cost of the cheapest request.
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    type = 'counter'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        self._values: dict[tuple, float] = defaultdict(int)
+        self._lock = Lock()
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] += amount
+
+    def value(self, *labels) -> float:
+        with self._lock:
+            return self._values.get(labels, 0)
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f'{self.name}{_labels(self.label_names, labels)} {_number(value)}' for labels, value in values]
+
+
+class Histogram:
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labels: tuple[str, ...] = (), buckets: tuple = METRICS_LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = labels
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts (the last one is +Inf), sum]
+        self._values: dict[tuple, list] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def count(self, *labels) -> int:
+        with self._lock:
+            entry = self._values.get(labels)
+            return sum(entry[0]) if entry else 0
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            values = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._values.items())
+        lines = []
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + ('+Inf',), counts):
+                cumulative += bucket_count
+                le = 'le="' + (bound if bound == '+Inf' else _number(bound)) + '"'
+                lines.append(f'{self.name}_bucket{_labels(self.label_names, labels, le)} {cumulative}')
+            lines.append(f'{self.name}_sum{_labels(self.label_names, labels)} {_number(total)}')
+            lines.append(f'{self.name}_count{_labels(self.label_names, labels)} {cumulative}')
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, documentation: str, labels: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def histogram(self, name: str, documentation: str, labels: tuple[str, ...] = (), buckets: tuple = METRICS_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def _register(self, metric):
+        if any(existing.name == metric.name for existing in self.metrics):
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f'# HELP {metric.name} {metric.documentation}')
+            lines.append(f'# TYPE {metric.name} {metric.type}')
+            lines.extend(metric.samples())
+        return '\n'.join(lines) + '\n'
+
+
+def m_bucket(m: int | None) -> str:
+    # Bounded label values: one series per range of m rather than per m.
+    if m is None:
+        return 'none'
+    lower = 1
+    for upper in METRICS_M_BUCKETS:
+        if m <= upper:
+            return f'{lower}-{upper}'
+        lower = upper + 1
+    return f'{lower}+'
+
+
+registry = MetricsRegistry()
+requests_total = registry.counter(
+    'gf_requests_total', 'Requests handled, by operation and status.', ('operation', 'status'))
+request_errors_total = registry.counter(
+    'gf_request_errors_total', 'Requests answered with a 4xx or 5xx status.', ('operation', 'status'))
+request_duration = registry.histogram(
+    'gf_request_duration_seconds', 'Time from the start of a request until its response is ready.',
+    ('operation', 'm_bucket'))
+phase_duration = registry.histogram(
+    'gf_request_phase_duration_seconds', 'Time spent validating, computing and serializing a request.',
+    ('operation', 'phase'))
+payload_size = registry.histogram(
+    'gf_payload_size_bytes', 'Request and response body sizes.', ('operation', 'direction'), METRICS_PAYLOAD_BUCKETS)
+
+
+class RequestMetrics:
+    # Per-request phase accounting. The request hooks create one, the
+    # validators and the service record into it, and finish() publishes it.
+    # Streamed responses are finished when their headers are sent, so their
+    # latency is the time to the first byte and their response size is not
+    # known.
+    def __init__(self, operation: str):
+        self.operation = operation
+        self.start = time.perf_counter()
+        self.m: int | None = None
+        self.validation = 0.0
+        self.compute = 0.0
+        self.computed_at: float | None = None
+        self.finished = False
+
+    def finish(self, status: int, request_bytes: int | None, response_bytes: int | None) -> None:
+        now = time.perf_counter()
+        self.finished = True
+        operation = self.operation
+        requests_total.inc(operation, str(status))
+        if status >= 400:
+            request_errors_total.inc(operation, str(status))
+        request_duration.observe(now - self.start, operation, m_bucket(self.m))
+        if self.validation:
+            phase_duration.observe(self.validation, operation, 'validation')
+        if self.computed_at is not None:
+            phase_duration.observe(self.compute, operation, 'compute')
+            phase_duration.observe(now - self.computed_at, operation, 'serialization')
+        if request_bytes is not None:
+            payload_size.observe(request_bytes, operation, 'request')
+        if response_bytes is not None:
+            payload_size.observe(response_bytes, operation, 'response')
+
+
+def timed_validator(validate, current):
+    # Wraps a validator so that its time, and the m of a valid request, are
+    # recorded on current(), the RequestMetrics of the request being served.
+    @wraps(validate)
+    def wrapper(*args, **kwargs):
+        metrics = current()
+        if metrics is None or metrics.finished:
+            return validate(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            data = validate(*args, **kwargs)
+        finally:
+            metrics.validation += time.perf_counter() - start
+        if isinstance(data, dict) and isinstance(data.get('m'), int):
+            metrics.m = data['m']
+        return data
+    return wrapper
+
+
+class TimedService:
+    # Proxy that times every call into the wrapped service as compute time
+    # of the current request. The bound wrappers are built once per method.
+    def __init__(self, service, current):
+        self._service = service
+        self._current = current
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._service, name)
+        if not callable(attribute):
+            return attribute
+        current = self._current
+
+        @wraps(attribute)
+        def wrapper(*args, **kwargs):
+            metrics = current()
+            if metrics is None or metrics.finished:
+                return attribute(*args, **kwargs)
+            if metrics.m is None and args and isinstance(args[0], int):
+                metrics.m = args[0]
+            start = time.perf_counter()
+            try:
+                return attribute(*args, **kwargs)
+            finally:
+                metrics.computed_at = time.perf_counter()
+                metrics.compute += metrics.computed_at - start
+        setattr(self, name, wrapper)
+        return wrapper
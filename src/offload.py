@@ -0,0 +1,120 @@
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from threading import Lock
+from src.constants import OFFLOAD_MIN_M, OFFLOAD_TIMEOUT, OFFLOAD_WORKERS
+from src.logger import logger
+
+# Heavy large-field operations run in a persistent pool of worker
+# processes, so that an m=8192 inversion does not hold the GIL of the
+# worker serving GF(2^8) traffic. Each process keeps its own FieldCache,
+# so fields stay warm between calls; `warm` builds some up front.
+
+_worker_service = None
+
+
+def _initialize_worker(warm: tuple[int, ...]) -> None:
+    global _worker_service
+    from src.fields import get_field
+    from src.services import PolyServices
+    _worker_service = PolyServices()
+    for m in warm:
+        get_field(m)
+
+
+def _run(method: str, args: tuple):
+    return getattr(_worker_service, method)(*args)
+
+
+class OffloadTimeoutError(TimeoutError):
+    pass
+
+
+class OffloadPool:
+    def __init__(self, workers: int, timeout: float = OFFLOAD_TIMEOUT,
+                 min_m: dict[str, int] | None = None, warm: tuple[int, ...] = ()):
+        self.workers = workers
+        self.timeout = timeout
+        self.min_m = dict(OFFLOAD_MIN_M if min_m is None else min_m)
+        self.warm = tuple(warm)
+        self.submitted = 0
+        self.timeouts = 0
+        self.restarts = 0
+        self._executor: ProcessPoolExecutor | None = None
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.workers > 0
+
+    def should_offload(self, op: str, m: int) -> bool:
+        return self.enabled and m >= self.min_m.get(op, float('inf'))
+
+    def run(self, method: str, *args):
+        # Raises OffloadTimeoutError when the call takes longer than the
+        # timeout; the pool is then replaced so the stuck worker stops using
+        # CPU. Calls that were running on the replaced pool are retried once.
+        retried = False
+        while True:
+            executor = self._get_executor()
+            try:
+                future = executor.submit(_run, method, args)
+                with self._lock:
+                    self.submitted += 1
+                return future.result(timeout=self.timeout)
+            except FutureTimeoutError:
+                with self._lock:
+                    self.timeouts += 1
+                if not future.cancel():
+                    self._restart(executor)
+                raise OffloadTimeoutError(f"{method} did not finish within {self.timeout:g} seconds")
+            except BrokenProcessPool:
+                self._restart(executor)
+                if retried:
+                    raise
+                retried = True
+
+    def stats(self) -> dict[str, int | float]:
+        return {
+            'workers': self.workers,
+            'timeout': self.timeout,
+            'submitted': self.submitted,
+            'timeouts': self.timeouts,
+            'restarts': self.restarts,
+        }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # spawn, not fork: the parent runs logging and server threads.
+                self._executor = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_initialize_worker, initargs=(self.warm,))
+            return self._executor
+
+    def _restart(self, executor: ProcessPoolExecutor) -> None:
+        with self._lock:
+            if self._executor is not executor:
+                return
+            self._executor = None
+            self.restarts += 1
+        logger.warning("Restarting the offload pool")
+        for process in list((getattr(executor, '_processes', None) or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+offload_pool = OffloadPool(
+    int(os.environ.get('GF_OFFLOAD_WORKERS', OFFLOAD_WORKERS)),
+    timeout=float(os.environ.get('GF_OFFLOAD_TIMEOUT', OFFLOAD_TIMEOUT)),
+    warm=tuple(int(m) for m in os.environ.get('GF_OFFLOAD_WARM_M', '').split(',') if m.strip()),
+)
+atexit.register(offload_pool.shutdown)
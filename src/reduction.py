@@ -0,0 +1,63 @@
+from src.constants import REDUCTION_WINDOW_BITS
+from src.fields import GF2mField
+from src.squaring import spread_bits
+
+
+def reduce_sparse(field: GF2mField, poly: int) -> int:
+    # x^m = sum(x^tap), so everything at or above bit m folds down in one
+    # shifted XOR per tap; each pass shrinks the excess by m - max(taps).
+    m = field.m
+    mask = field.mask
+    taps = field.taps
+    while poly >> m:
+        high = poly >> m
+        poly &= mask
+        for tap in taps:
+            poly ^= high << tap
+    return poly
+
+
+def _reduction_table(field: GF2mField) -> tuple[int, list[int]]:
+    table = field.precomputed.get('reduction_table')
+    if table is None:
+        m = field.m
+        width = REDUCTION_WINDOW_BITS
+        modulus = field.reduction_modulus
+        # Entry k is the multiple of the modulus whose bits m .. m + width - 1
+        # equal k, so XORing it in clears a whole window of high bits.
+        multiples = [0] * (1 << width)
+        for k in range(1, 1 << width):
+            remainder = k << m
+            multiple = 0
+            for i in range(width - 1, -1, -1):
+                if (remainder >> (m + i)) & 1:
+                    remainder ^= modulus << i
+                    multiple ^= modulus << i
+            multiples[k] = multiple
+        table = field.precomputed['reduction_table'] = (width, multiples)
+    return table
+
+
+def reduce_windowed(field: GF2mField, poly: int) -> int:
+    m = field.m
+    width, multiples = _reduction_table(field)
+    while poly.bit_length() > m:
+        shift = max(poly.bit_length() - m - width, 0)
+        poly ^= multiples[poly >> (m + shift)] << shift
+    return poly
+
+
+def reduce_poly(field: GF2mField, poly: int) -> int:
+    if field.taps is not None:
+        return reduce_sparse(field, poly)
+    return reduce_windowed(field, poly)
+
+
+def square_poly(field: GF2mField, poly: int) -> int:
+    return reduce_poly(field, spread_bits(poly))
+
+
+def multi_square_poly(field: GF2mField, poly: int, count: int) -> int:
+    for _ in range(count):
+        poly = reduce_poly(field, spread_bits(poly))
+    return poly
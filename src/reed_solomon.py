@@ -0,0 +1,251 @@
+import struct
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator
+from threading import Lock
+from src.constants import REED_SOLOMON_CODEC_CACHE_SIZE, REED_SOLOMON_M_VALUES
+from src.fields import GF2mField, get_field
+
+
+class ReedSolomonError(ValueError):
+    pass
+
+
+class ReedSolomon:
+    # Systematic RS(n, k) over GF(2^8) or GF(2^16). Codewords are the k
+    # message symbols followed by n - k parity symbols, highest degree
+    # first; the generator has roots alpha^0 .. alpha^(n-k-1). A final block
+    # shorter than n is treated as a shortened code with leading zeros.
+    def __init__(self, field: GF2mField, n: int, k: int):
+        m = field.m
+        if m not in REED_SOLOMON_M_VALUES:
+            raise ValueError(f"Reed-Solomon codes are supported for m in {REED_SOLOMON_M_VALUES}, got {m}")
+        if not 0 < k < n <= (1 << m) - 1:
+            raise ValueError(f"Reed-Solomon codes need 0 < k < n <= {(1 << m) - 1}, got n={n}, k={k}")
+
+        self.field = field
+        self.tables = field.log_tables
+        self.m = m
+        self.n = n
+        self.k = k
+        self.nsym = n - k
+        self.symbol_bytes = m // 8
+        self.generator = self._generator_poly()
+        self._feedback = self._feedback_tables()
+
+    def _generator_poly(self) -> list[int]:
+        # g(x) = (x - alpha^0)(x - alpha^1)...(x - alpha^(nsym-1)), lowest
+        # degree first.
+        tables = self.tables
+        generator = [1]
+        for i in range(self.nsym):
+            root = tables.exp[i]
+            shifted = [0] + generator
+            for j, coefficient in enumerate(generator):
+                shifted[j] ^= tables.multiply(coefficient, root)
+            generator = shifted
+        return generator
+
+    def _feedback_tables(self) -> list[list[int]]:
+        # The parity register holds one symbol per m bits, x^i in bits
+        # [i*m, (i+1)*m). Each step adds feedback * (g(x) - x^nsym), which is
+        # linear in the feedback symbol, so it is tabulated per feedback byte.
+        tables = self.tables
+        m = self.m
+
+        def packed(symbol: int) -> int:
+            value = 0
+            for i, coefficient in enumerate(self.generator[:-1]):
+                value |= tables.multiply(symbol, coefficient) << (i * m)
+            return value
+
+        return [[packed(b << shift) for b in range(256)] for shift in range(0, m, 8)]
+
+    def _symbols(self, block: bytes) -> list[int] | bytes:
+        if self.symbol_bytes == 1:
+            return block
+        return struct.unpack(f'>{len(block) // 2}H', block)
+
+    def _pack(self, symbols) -> bytes:
+        if self.symbol_bytes == 1:
+            return bytes(symbols)
+        return struct.pack(f'>{len(symbols)}H', *symbols)
+
+    def _parity(self, message) -> int:
+        # Remainder of message(x) * x^nsym modulo g(x), one LFSR step per
+        # message symbol.
+        m = self.m
+        shift = m * (self.nsym - 1)
+        mask = (1 << (m * self.nsym)) - 1
+        parity = 0
+        if m == 8:
+            table = self._feedback[0]
+            for symbol in message:
+                parity = ((parity << 8) & mask) ^ table[symbol ^ (parity >> shift)]
+        else:
+            low, high = self._feedback
+            for symbol in message:
+                feedback = symbol ^ (parity >> shift)
+                parity = ((parity << m) & mask) ^ low[feedback & 255] ^ high[feedback >> 8]
+        return parity
+
+    def encode_block(self, block: bytes) -> bytes:
+        parity = self._parity(self._symbols(block))
+        return block + parity.to_bytes(self.nsym * self.symbol_bytes, 'big')
+
+    def syndromes(self, remainder: int) -> list[int]:
+        # The received word and its remainder modulo g(x) agree at every
+        # root of g, so only nsym coefficients are evaluated instead of n.
+        log = self.tables.log
+        symbol_mask = (1 << self.m) - 1
+        terms = []
+        for i in range(self.nsym):
+            coefficient = (remainder >> (i * self.m)) & symbol_mask
+            if coefficient:
+                terms.append((log[coefficient], i))
+        return [self._evaluate(terms, j) for j in range(self.nsym)]
+
+    def _evaluate(self, terms: list[tuple[int, int]], j: int) -> int:
+        exp, order = self.tables.exp, self.tables.order
+        value = 0
+        for log_coefficient, i in terms:
+            value ^= exp[(log_coefficient + i * j) % order]
+        return value
+
+    def berlekamp_massey(self, syndromes: list[int]) -> list[int]:
+        tables = self.tables
+        locator = [1]
+        previous = [1]
+        length = 0
+        shift = 1
+        previous_discrepancy = 1
+        for i, syndrome in enumerate(syndromes):
+            discrepancy = syndrome
+            for j in range(1, length + 1):
+                discrepancy ^= tables.multiply(locator[j], syndromes[i - j])
+            if discrepancy == 0:
+                shift += 1
+                continue
+
+            scale = tables.divide(discrepancy, previous_discrepancy)
+            updated = locator + [0] * max(0, len(previous) + shift - len(locator))
+            for j, coefficient in enumerate(previous):
+                updated[j + shift] ^= tables.multiply(scale, coefficient)
+            if 2 * length <= i:
+                previous, previous_discrepancy = locator, discrepancy
+                length = i + 1 - length
+                shift = 1
+            else:
+                shift += 1
+            locator = updated
+        return locator[:length + 1]
+
+    def chien_search(self, locator: list[int], length: int) -> list[int]:
+        # Position p of a block of the given length holds the coefficient of
+        # x^(length-1-p); it is in error iff locator(alpha^-(length-1-p)) = 0.
+        exp, log, order = self.tables.exp, self.tables.log, self.tables.order
+        terms = [(log[coefficient], i) for i, coefficient in enumerate(locator) if coefficient]
+        positions = []
+        for degree in range(length):
+            value = 0
+            for log_coefficient, i in terms:
+                value ^= exp[(log_coefficient - degree * i) % order]
+            if value == 0:
+                positions.append(length - 1 - degree)
+        return positions
+
+    def forney(self, syndromes: list[int], locator: list[int], positions: list[int], length: int) -> list[int]:
+        tables = self.tables
+        evaluator = [0] * self.nsym
+        for i, syndrome in enumerate(syndromes):
+            for j, coefficient in enumerate(locator[:self.nsym - i]):
+                evaluator[i + j] ^= tables.multiply(syndrome, coefficient)
+
+        magnitudes = []
+        for position in positions:
+            degree = length - 1 - position
+            x_inverse = tables.power(tables.exp[degree], -1)
+            numerator = 0
+            for i, coefficient in enumerate(evaluator):
+                numerator ^= tables.multiply(coefficient, tables.power(x_inverse, i))
+            derivative = 0
+            for i in range(1, len(locator), 2):
+                derivative ^= tables.multiply(locator[i], tables.power(x_inverse, i - 1))
+            # With the first root at alpha^0, e = X * omega(X^-1) / lambda'(X^-1).
+            magnitudes.append(tables.multiply(tables.exp[degree], tables.divide(numerator, derivative)))
+        return magnitudes
+
+    def decode_block(self, block: bytes) -> tuple[bytes, int]:
+        parity_bytes = self.nsym * self.symbol_bytes
+        message = block[:-parity_bytes]
+        remainder = self._parity(self._symbols(message)) ^ int.from_bytes(block[-parity_bytes:], 'big')
+        if remainder == 0:
+            return message, 0
+
+        syndromes = self.syndromes(remainder)
+        locator = self.berlekamp_massey(syndromes)
+        length = len(block) // self.symbol_bytes
+        errors = len(locator) - 1
+        positions = self.chien_search(locator, length)
+        if 2 * errors > self.nsym or len(positions) != errors:
+            raise ReedSolomonError(f"Too many errors to correct in RS({self.n}, {self.k}) block")
+
+        symbols = list(self._symbols(block))
+        for position, magnitude in zip(positions, self.forney(syndromes, locator, positions, length)):
+            symbols[position] ^= magnitude
+        corrected = self._pack(symbols)
+        if self._parity(self._symbols(corrected[:-parity_bytes])) != int.from_bytes(corrected[-parity_bytes:], 'big'):
+            raise ReedSolomonError(f"Too many errors to correct in RS({self.n}, {self.k}) block")
+        return corrected[:-parity_bytes], errors
+
+    def _blocks(self, chunks: Iterable[bytes], block_bytes: int, min_bytes: int) -> Iterator[bytes]:
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            if len(buffer) < block_bytes:
+                continue
+            end = len(buffer) - len(buffer) % block_bytes
+            view = memoryview(buffer)
+            for start in range(0, end, block_bytes):
+                yield bytes(view[start:start + block_bytes])
+            view.release()
+            del buffer[:end]
+        if buffer:
+            if len(buffer) % self.symbol_bytes:
+                raise ValueError(f"Payload length must be a multiple of {self.symbol_bytes} bytes")
+            if len(buffer) < min_bytes:
+                raise ValueError(f"Truncated RS({self.n}, {self.k}) block of {len(buffer)} bytes")
+            yield bytes(buffer)
+
+    def encode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for block in self._blocks(chunks, self.k * self.symbol_bytes, self.symbol_bytes):
+            yield self.encode_block(block)
+
+    def decode_stream(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        min_bytes = (self.nsym + 1) * self.symbol_bytes
+        for block in self._blocks(chunks, self.n * self.symbol_bytes, min_bytes):
+            yield self.decode_block(block)[0]
+
+    def encode(self, data: bytes) -> bytes:
+        return b''.join(self.encode_stream([data]))
+
+    def decode(self, data: bytes) -> bytes:
+        return b''.join(self.decode_stream([data]))
+
+
+_codec_lock = Lock()
+
+
+def get_codec(m: int, n: int, k: int) -> ReedSolomon:
+    field = get_field(m)
+    with _codec_lock:
+        codecs = field.precomputed.setdefault('reed_solomon', OrderedDict())
+        codec = codecs.get((n, k))
+        if codec is not None:
+            codecs.move_to_end((n, k))
+            return codec
+    codec = ReedSolomon(field, n, k)
+    with _codec_lock:
+        codecs[(n, k)] = codec
+        while len(codecs) > REED_SOLOMON_CODEC_CACHE_SIZE:
+            codecs.popitem(last=False)
+    return codec
@@ -0,0 +1,143 @@
+import os
+import time
+from collections import OrderedDict
+from threading import Lock
+from src.constants import (RESULT_CACHE_BYTES, RESULT_CACHE_ENTRY_OVERHEAD, RESULT_CACHE_MAX_ENTRY_FRACTION,
+                           RESULT_CACHE_MAX_PINNED)
+
+
+class CachePinError(Exception):
+    pass
+
+
+class ResultCache:
+    # LRU over a byte budget rather than an entry count: an entry costs the
+    # bytes of its operands and result plus a fixed overhead, so one
+    # 8192-bit product displaces a few dozen small entries instead of
+    # counting the same as each of them. Entries over max_entry_bytes are
+    # not admitted at all. Pinned entries live outside the budget and never
+    # expire; there can be at most max_pinned of them, and only while the
+    # cache is enabled.
+    def __init__(self, max_bytes: int, ttl: float | None = None, max_entry_bytes: int | None = None,
+                 max_pinned: int = RESULT_CACHE_MAX_PINNED):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.max_pinned = max_pinned
+        self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else int(max_bytes * RESULT_CACHE_MAX_ENTRY_FRACTION)
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+        self._entries: OrderedDict[tuple, tuple[int, int, float | None]] = OrderedDict()
+        self._pinned: dict[tuple, int] = {}
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries) + len(self._pinned)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_bytes > 0
+
+    @staticmethod
+    def cost(key: tuple, result: int) -> int:
+        values = [value for value in key if isinstance(value, int)] + [result]
+        return RESULT_CACHE_ENTRY_OVERHEAD + sum((value.bit_length() + 7) // 8 for value in values)
+
+    def get(self, key: tuple) -> int | None:
+        with self._lock:
+            result = self._pinned.get(key)
+            if result is not None:
+                self.hits += 1
+                return result
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            result, cost, expires = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.size_bytes -= cost
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: tuple, result: int) -> None:
+        cost = self.cost(key, result)
+        with self._lock:
+            if key in self._pinned:
+                return
+            if cost > self.max_entry_bytes:
+                self.rejections += 1
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size_bytes -= previous[1]
+            expires = time.monotonic() + self.ttl if self.ttl else None
+            self._entries[key] = (result, cost, expires)
+            self.size_bytes += cost
+            self._evict()
+
+    def pin(self, key: tuple, result: int) -> None:
+        with self._lock:
+            if not self.enabled:
+                raise CachePinError("The result cache is disabled; set GF_RESULT_CACHE_BYTES to enable it")
+            if key not in self._pinned and len(self._pinned) >= self.max_pinned:
+                raise CachePinError(f"The result cache already holds the maximum of {self.max_pinned} pinned entries")
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.size_bytes -= entry[1]
+            self._pinned[key] = result
+
+    def unpin(self, key: tuple) -> bool:
+        with self._lock:
+            return self._pinned.pop(key, None) is not None
+
+    def resize(self, max_bytes: int, max_entry_bytes: int | None = None) -> None:
+        with self._lock:
+            self.max_bytes = max_bytes
+            self.max_entry_bytes = max_entry_bytes if max_entry_bytes is not None else int(max_bytes * RESULT_CACHE_MAX_ENTRY_FRACTION)
+            self._evict()
+
+    def clear(self, pinned: bool = False) -> None:
+        # Pinned entries are kept unless pinned is set.
+        with self._lock:
+            self._entries.clear()
+            if pinned:
+                self._pinned.clear()
+            self.size_bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = self.rejections = 0
+
+    def stats(self) -> dict[str, int | float | None]:
+        return {
+            'size': len(self._entries),
+            'pinned': len(self._pinned),
+            'max_pinned': self.max_pinned,
+            'size_bytes': self.size_bytes,
+            'max_bytes': self.max_bytes,
+            'max_entry_bytes': self.max_entry_bytes,
+            'ttl': self.ttl,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'rejections': self.rejections,
+        }
+
+    def _evict(self) -> None:
+        while self.size_bytes > max(self.max_bytes, 0):
+            _, (_, cost, _) = self._entries.popitem(last=False)
+            self.size_bytes -= cost
+            self.evictions += 1
+
+
+result_cache = ResultCache(
+    int(os.environ.get('GF_RESULT_CACHE_BYTES', RESULT_CACHE_BYTES)),
+    ttl=float(os.environ['GF_RESULT_CACHE_TTL']) if os.environ.get('GF_RESULT_CACHE_TTL') else None,
+    max_pinned=int(os.environ.get('GF_RESULT_CACHE_MAX_PINNED', RESULT_CACHE_MAX_PINNED)),
+)
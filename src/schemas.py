@@ -1,4 +1,14 @@
+import re
 from marshmallow import Schema, fields, validate, ValidationError, validates_schema
+from src.constants import (BATCH_OPERATIONS, MAX_BATCH_SIZE, OUTPUT_FORMATS, REED_SOLOMON_M_VALUES, REED_SOLOMON_MAX_N,
+                           REED_SOLOMON_MAX_NSYM)
+
+OPERAND_PATTERNS = {
+    'bin': re.compile(r'^[01]+$'),
+    'hex': re.compile(r'^[0-9A-F]+$'),
+    'bin_or_empty': re.compile(r'^[01]*$'),
+    'hex_or_empty': re.compile(r'^[0-9A-F]*$'),
+}
 
 class SinglePolySchema(Schema):
     m = fields.Integer(required=True, validate=validate.Range(min=1, max=2**13))
@@ -6,6 +16,7 @@ class SinglePolySchema(Schema):
     type = fields.String(required=True, validate=validate.OneOf(['bin', 'hex']))
     bin = fields.String(required=False, validate=validate.Regexp(r'^[01]*$'))
     hex = fields.String(required=False, validate=validate.Regexp(r'^[0-9A-F]*$'))
+    output = fields.String(required=False, validate=validate.OneOf(OUTPUT_FORMATS))
 
     @validates_schema
     def validate_input(self, data, **kwargs):
@@ -18,6 +29,9 @@ class SinglePolySchema(Schema):
         if data['type'] == 'hex' and len(data['hex']) > data['bits'] // 4:
             raise ValidationError(f'hex must be of length at most {data["bits"]} / 4')
 
+class PowerSchema(SinglePolySchema):
+    exponent = fields.Integer(required=True, strict=True)
+
 class DoublePolySchema(Schema):
     m = fields.Integer(required=True, validate=validate.Range(min=1, max=2**13))
     bits = fields.Integer(required=True, validate=validate.OneOf([16, 32, 64, 128, 256]))
@@ -26,6 +40,7 @@ class DoublePolySchema(Schema):
     hex1 = fields.String(required=False, validate=validate.Regexp(r'^[0-9A-F]*$'))
     bin2 = fields.String(required=False, validate=validate.Regexp(r'^[01]*$'))
     hex2 = fields.String(required=False, validate=validate.Regexp(r'^[0-9A-F]*$'))
+    output = fields.String(required=False, validate=validate.OneOf(OUTPUT_FORMATS))
 
     @validates_schema
     def validate_input(self, data, **kwargs):
@@ -64,3 +79,55 @@ class DoublePolySchema(Schema):
 
         if data['type'] == 'hex' and len(data['hex2']) > data['bits'] // 4:
             raise ValidationError(f'hex2 must be of length at most {data["bits"]} / 4')
+
+
+class BatchSchema(Schema):
+    m = fields.Integer(required=True, validate=validate.Range(min=1, max=2**13))
+    bits = fields.Integer(required=True, validate=validate.OneOf([16, 32, 64, 128, 256]))
+    type = fields.String(required=True, validate=validate.OneOf(['bin', 'hex']))
+    operations = fields.List(fields.Raw(), required=True, validate=validate.Length(min=1, max=MAX_BATCH_SIZE))
+    output = fields.String(required=False, validate=validate.OneOf(OUTPUT_FORMATS))
+
+class ReedSolomonSchema(Schema):
+    m = fields.Integer(required=True, validate=validate.OneOf(REED_SOLOMON_M_VALUES))
+    n = fields.Integer(required=True)
+    k = fields.Integer(required=True)
+
+    @validates_schema
+    def validate_code(self, data, **kwargs):
+        if not 0 < data['k'] < data['n'] <= 2 ** data['m'] - 1:
+            raise ValidationError(f'n and k must satisfy 0 < k < n <= {2 ** data["m"] - 1}')
+        if data['n'] > REED_SOLOMON_MAX_N:
+            raise ValidationError(f'n must be at most {REED_SOLOMON_MAX_N}')
+        if data['n'] - data['k'] > REED_SOLOMON_MAX_NSYM:
+            raise ValidationError(f'n - k must be at most {REED_SOLOMON_MAX_NSYM}')
+
+class PinSchema(Schema):
+    m = fields.Integer(required=True, validate=validate.Range(min=1, max=2**13))
+    bits = fields.Integer(required=True, validate=validate.OneOf([16, 32, 64, 128, 256]))
+    type = fields.String(required=True, validate=validate.OneOf(['bin', 'hex']))
+    op = fields.String(required=True)
+    operands = fields.List(fields.Raw(), required=True)
+    output = fields.String(required=False, validate=validate.OneOf(OUTPUT_FORMATS))
+
+def validate_batch_operation(operation: dict, type: str, bits: int) -> tuple[str, list[str]]:
+    if not isinstance(operation, dict):
+        raise ValidationError('operation must be an object with op and operands')
+
+    op = operation.get('op')
+    if op not in BATCH_OPERATIONS:
+        raise ValidationError(f'op must be one of: {", ".join(BATCH_OPERATIONS)}')
+
+    operands = operation.get('operands')
+    if not isinstance(operands, list) or len(operands) != BATCH_OPERATIONS[op]:
+        raise ValidationError(f'{op} requires exactly {BATCH_OPERATIONS[op]} operands')
+
+    max_length = bits if type == 'bin' else bits // 4
+    pattern = OPERAND_PATTERNS[type]
+    for operand in operands:
+        if not isinstance(operand, str) or not pattern.match(operand):
+            raise ValidationError(f'operands must be non-empty {type} strings')
+        if len(operand) > max_length:
+            raise ValidationError(f'{type} operands must be of length at most {max_length}')
+
+    return op, operands
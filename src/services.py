@@ -1,5 +1,21 @@
-from src.utils import get_irreducible_polynomial
-from src.logger import logger
+from collections.abc import Iterable, Iterator
+from itertools import chain
+from src import bitslice
+from src.clmul import multiply_karatsuba
+from src.constants import BITSLICE_SQUARE_MAX_M, KARATSUBA_MIN_M, POWER_TABLE_CACHE_SIZE, VECTORIZE_MIN_BATCH
+from src.fields import GF2mField, get_field
+from src.inversion import invert_itoh_tsujii, use_itoh_tsujii
+from src.reduction import multi_square_poly, reduce_poly
+from src.reed_solomon import get_codec
+from src.result_cache import ResultCache
+from src.squaring import split_bits, spread_bits
+from src.logger import operation_logger
+from src.offload import OffloadPool
+
+try:
+    from src import vectorized
+except ImportError:
+    vectorized = None
 
 class PolyServices:
     def __init__(self):
@@ -8,84 +24,100 @@ class PolyServices:
     @staticmethod
     def xor_in_gf(m: int, poly1: int, poly2: int) -> int:
         xor = poly1 ^ poly2
-        while xor.bit_length() > m:
-            xor ^= get_irreducible_polynomial(m)
-            m -= 1
+        if xor >> m:
+            xor = reduce_poly(get_field(m), xor)
         return xor
 
     def add_in_gf(self, m: int, poly1: int, poly2: int) -> int:
-        logger.info("Enter add method")
+        operation_logger.debug("Enter add method")
         result = self.xor_in_gf(m, poly1, poly2)
-        logger.info(f"Exit add method with result: {result}")
+        operation_logger.debug("Exit add method with result: %#x", result)
         return result
 
     def subtract_in_gf(self, m: int, poly1: int, poly2: int) -> int:
-        logger.info("Enter subtract method")
+        operation_logger.debug("Enter subtract method")
         result = self.xor_in_gf(m, poly1, poly2)
-        logger.info(f"Exit subtract method with result: {result}")
+        operation_logger.debug("Exit subtract method with result: %#x", result)
         return result
 
     @staticmethod
-    def multiply_in_gf(m: int, poly1: int, poly2: int) -> int:
-        logger.info("Enter multiply method")
-        irreducible_poly = get_irreducible_polynomial(m)
-        logger.info(f"Irreducible polynomial: {irreducible_poly}")
-        
+    def _multiply_loop(field: GF2mField, poly1: int, poly2: int) -> int:
+        irreducible_poly = field.modulus
+        high_bit = field.high_bit
+        mask = field.mask
+
         result = 0
-        for _ in range(m):
+        for _ in range(field.m):
             if (poly2 & 1) != 0:
                 result ^= poly1
 
             poly2 >>= 1
 
-            carry = (poly1 & (1 << (m - 1))) != 0
+            carry = (poly1 & high_bit) != 0
             poly1 <<= 1
             if carry:
                 poly1 ^= irreducible_poly
 
-            poly1 &= (1 << m) - 1
+            poly1 &= mask
+        return result
+
+    @staticmethod
+    def _multiply(field: GF2mField, poly1: int, poly2: int) -> int:
+        m = field.m
+        if poly1 >> m == 0 and poly2 >> m == 0:
+            tables = field.log_tables
+            if tables is not None:
+                return tables.multiply(poly1, poly2)
+            if m >= KARATSUBA_MIN_M:
+                return multiply_karatsuba(field, poly1, poly2)
+        return PolyServices._multiply_loop(field, poly1, poly2)
+
+    @staticmethod
+    def multiply_in_gf(m: int, poly1: int, poly2: int) -> int:
+        operation_logger.debug("Enter multiply method")
+        field = get_field(m)
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
 
-        logger.info(f"Exit multiply method with result: {result}")
+        result = PolyServices._multiply(field, poly1, poly2)
+
+        operation_logger.debug("Exit multiply method with result: %#x", result)
         return result
     
     def divide_in_gf(self, m: int, dividend: int, divisor: int) -> tuple[int, int]:
-        logger.info("Enter divide method")
+        operation_logger.debug("Enter divide method")
         if divisor == 0:
-            logger.info("Division by zero")
+            operation_logger.debug("Division by zero")
             raise ZeroDivisionError(f"Division by zero in GF(2^{m})")
 
-        irreducible_poly = get_irreducible_polynomial(m)
-        logger.info(f"Irreducible polynomial: {irreducible_poly}")
+        field = get_field(m)
+        tables = field.log_tables
+        if tables is not None and dividend >> m == 0 and divisor >> m == 0:
+            result = tables.divide(dividend, divisor)
+            operation_logger.debug("Exit divide method with result: %#x", result)
+            return result
+
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
 
         divisor_inv = self.invert_in_gf(m, divisor)
         result = self.multiply_in_gf(m, dividend, divisor_inv)
 
-        logger.info(f"Exit divide method with result: {result}")
+        operation_logger.debug("Exit divide method with result: %#x", result)
         return result
 
     @staticmethod
     def modulo_in_gf(m: int, poly: int) -> int:
-        logger.info("Enter modulo method")
-        irreducible_poly = get_irreducible_polynomial(m)
-        logger.info(f"Irreducible polynomial: {irreducible_poly}")
+        operation_logger.debug("Enter modulo method")
+        field = get_field(m)
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
 
-        while poly.bit_length() > m + 1:
-            shift = poly.bit_length() - (m + 1)
-            poly ^= irreducible_poly << shift
+        poly = reduce_poly(field, poly)
 
-        logger.info(f"Exit modulo method with result: {poly}")
+        operation_logger.debug("Exit modulo method with result: %#x", poly)
         return poly
 
 
-    def invert_in_gf(self, m: int, poly: int) -> int:
-        logger.info("Enter invert method")
-        if poly == 0:
-            logger.info(f"Zero has no inverse in GF(2^{m})")
-            raise ValueError(f"Zero has no inverse in GF(2^{m})")
-
-        irreducible_poly = get_irreducible_polynomial(m)
-        logger.info(f"Irreducible polynomial: {irreducible_poly}")
-
+    @staticmethod
+    def _invert_euclid(poly: int, irreducible_poly: int) -> int | None:
         u = poly
         v = irreducible_poly
         g1 = 1
@@ -101,7 +133,444 @@ class PolyServices:
             g1 ^= g2 << shift
 
         if u == 1:
+            return g1
+        return None
+
+    def invert_in_gf(self, m: int, poly: int) -> int:
+        operation_logger.debug("Enter invert method")
+        if poly == 0:
+            operation_logger.debug("Zero has no inverse in GF(2^%s)", m)
+            raise ValueError(f"Zero has no inverse in GF(2^{m})")
+
+        field = get_field(m)
+        tables = field.log_tables
+        if tables is not None and poly >> m == 0:
+            result = tables.invert(poly)
+            operation_logger.debug("Exit invert method with result: %#x", result)
+            return result
+
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
+
+        if use_itoh_tsujii(m) and poly >> m == 0:
+            result = invert_itoh_tsujii(field, poly)
+            operation_logger.debug("Exit invert method with result: %#x", result)
+            return result
+
+        g1 = self._invert_euclid(poly, field.modulus)
+        if g1 is not None:
             result = self.modulo_in_gf(m, g1)
-            logger.info(f"Exit invert method with result: {result}")
+            operation_logger.debug("Exit invert method with result: %#x", result)
             return result
         raise ValueError(f"No inverse exists for {poly} in GF(2^{m})")
+
+    @staticmethod
+    def _square(field: GF2mField, poly: int) -> int:
+        tables = field.log_tables
+        if tables is not None and poly >> field.m == 0:
+            return tables.power(poly, 2)
+        return reduce_poly(field, spread_bits(poly))
+
+    @staticmethod
+    def _window_width(bits: int) -> int:
+        for width, limit in enumerate((8, 24, 80, 240, 672), start=1):
+            if bits <= limit:
+                return width
+        return 6
+
+    @staticmethod
+    def _odd_powers(field: GF2mField, base: int, width: int) -> list[int]:
+        square = PolyServices._square(field, base)
+        powers = [base]
+        for _ in range((1 << (width - 1)) - 1):
+            powers.append(PolyServices._multiply(field, powers[-1], square))
+        return powers
+
+    @staticmethod
+    def _power_table(field: GF2mField, base: int, width: int, cache_base: bool) -> list[int]:
+        if not cache_base:
+            return PolyServices._odd_powers(field, base, width)
+        tables = field.precomputed.setdefault('power_tables', {})
+        powers = tables.get(base)
+        if powers is None:
+            if len(tables) >= POWER_TABLE_CACHE_SIZE:
+                del tables[next(iter(tables))]
+            powers = tables[base] = PolyServices._odd_powers(field, base, width)
+        return powers
+
+    @staticmethod
+    def _power(field: GF2mField, base: int, exponent: int, cache_base: bool = False) -> int:
+        # Left-to-right sliding window over the exponent bits, using a table
+        # of the odd powers base^1, base^3, ..., base^(2^width - 1).
+        width = 6 if cache_base else PolyServices._window_width(exponent.bit_length())
+        powers = PolyServices._power_table(field, base, width, cache_base)
+        width = (2 * len(powers) - 1).bit_length()
+
+        result = 1
+        i = exponent.bit_length() - 1
+        while i >= 0:
+            if not (exponent >> i) & 1:
+                result = PolyServices._square(field, result)
+                i -= 1
+                continue
+            j = max(i - width + 1, 0)
+            while not (exponent >> j) & 1:
+                j += 1
+            for _ in range(i - j + 1):
+                result = PolyServices._square(field, result)
+            result = PolyServices._multiply(field, result, powers[((exponent >> j) & ((1 << (i - j + 1)) - 1)) >> 1])
+            i = j - 1
+        return result
+
+    def pow_in_gf(self, m: int, poly: int, exponent: int, cache_base: bool = False) -> int:
+        operation_logger.debug("Enter power method")
+        field = get_field(m)
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
+
+        poly = reduce_poly(field, poly)
+        if poly == 0:
+            if exponent < 0:
+                operation_logger.debug("Zero has no inverse in GF(2^%s)", m)
+                raise ValueError(f"Zero has no inverse in GF(2^{m})")
+            result = 1 if exponent == 0 else 0
+        else:
+            if exponent < 0:
+                poly = self.invert_in_gf(m, poly)
+                exponent = -exponent
+            # Non-zero elements have order dividing 2^m - 1.
+            exponent %= (1 << m) - 1
+            tables = field.log_tables
+            if tables is not None:
+                result = tables.power(poly, exponent)
+            else:
+                result = self._power(field, poly, exponent, cache_base)
+
+        operation_logger.debug("Exit power method with result: %#x", result)
+        return result
+
+    def square_in_gf(self, m: int, poly: int) -> int:
+        operation_logger.debug("Enter square method")
+        field = get_field(m)
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
+
+        result = self._square(field, reduce_poly(field, poly))
+
+        operation_logger.debug("Exit square method with result: %#x", result)
+        return result
+
+    def sqrt_in_gf(self, m: int, poly: int) -> int:
+        operation_logger.debug("Enter square root method")
+        field = get_field(m)
+        operation_logger.debug("Irreducible polynomial: %#x", field.modulus)
+
+        poly = reduce_poly(field, poly)
+        tables = field.log_tables
+        if tables is not None:
+            result = tables.power(poly, 1 << (m - 1))
+        else:
+            # sqrt is linear: sqrt(even(x^2) + x * odd(x^2)) = even + sqrt(x) * odd,
+            # with sqrt(x) = x^(2^(m-1)) computed once per field.
+            sqrt_x = field.precomputed.get('sqrt_x')
+            if sqrt_x is None:
+                sqrt_x = field.precomputed['sqrt_x'] = multi_square_poly(field, 2, m - 1)
+            even, odd = split_bits(poly)
+            result = even ^ self._multiply(field, sqrt_x, odd)
+
+        operation_logger.debug("Exit square root method with result: %#x", result)
+        return result
+
+    def invert_many_in_gf(self, m: int, polys: list[int]) -> list[int | ValueError]:
+        operation_logger.debug("Enter invert many method with %s elements", len(polys))
+        field = get_field(m)
+        multiply = self._multiply
+
+        # Montgomery's trick: invert the product of every element once, then
+        # peel single inverses off it with three multiplications each. Zeros
+        # and unreduced operands are left out of the product.
+        results = [None] * len(polys)
+        indexes = []
+        prefix = []
+        running = 1
+        for index, poly in enumerate(polys):
+            if poly == 0:
+                results[index] = ValueError(f"Zero has no inverse in GF(2^{m})")
+            elif poly >> m:
+                try:
+                    results[index] = self.invert_in_gf(m, poly)
+                except ValueError as e:
+                    results[index] = e
+            else:
+                running = multiply(field, running, poly)
+                prefix.append(running)
+                indexes.append(index)
+
+        if indexes:
+            inverse = self.invert_in_gf(m, running)
+            for i in range(len(indexes) - 1, 0, -1):
+                results[indexes[i]] = multiply(field, inverse, prefix[i - 1])
+                inverse = multiply(field, inverse, polys[indexes[i]])
+            results[indexes[0]] = inverse
+
+        operation_logger.debug("Exit invert many method")
+        return results
+
+    def multiply_many_in_gf(self, m: int, polys1: list[int], polys2: list[int]) -> list[int]:
+        operation_logger.debug("Enter multiply many method with %s elements", len(polys1))
+        field = get_field(m)
+        if vectorized is not None and vectorized.is_vectorizable(m) and len(polys1) >= VECTORIZE_MIN_BATCH \
+                and all(poly >> m == 0 for poly in chain(polys1, polys2)):
+            results = vectorized.multiply(m, vectorized.from_ints(m, polys1), vectorized.from_ints(m, polys2)).tolist()
+        elif bitslice.is_worthwhile(field, len(polys1)) and all(poly >> m == 0 for poly in chain(polys1, polys2)):
+            results = bitslice.multiply_many(field, polys1, polys2)
+        else:
+            results = [self._multiply(field, poly1, poly2) for poly1, poly2 in zip(polys1, polys2)]
+
+        operation_logger.debug("Exit multiply many method")
+        return results
+
+    def divide_many_in_gf(self, m: int, dividends: list[int], divisors: list[int]) -> list[int | Exception]:
+        operation_logger.debug("Enter divide many method with %s elements", len(divisors))
+        field = get_field(m)
+
+        results = []
+        for dividend, divisor, inverse in zip(dividends, divisors, self.invert_many_in_gf(m, divisors)):
+            if divisor == 0:
+                results.append(ZeroDivisionError(f"Division by zero in GF(2^{m})"))
+            elif isinstance(inverse, ValueError):
+                results.append(inverse)
+            else:
+                results.append(self._multiply(field, dividend, inverse))
+
+        operation_logger.debug("Exit divide many method")
+        return results
+
+    def rs_encode_stream(self, m: int, n: int, k: int, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        operation_logger.debug("Enter Reed-Solomon encode method for RS(%s, %s) over GF(2^%s)", n, k, m)
+        return get_codec(m, n, k).encode_stream(chunks)
+
+    def rs_decode_stream(self, m: int, n: int, k: int, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        operation_logger.debug("Enter Reed-Solomon decode method for RS(%s, %s) over GF(2^%s)", n, k, m)
+        return get_codec(m, n, k).decode_stream(chunks)
+
+    def batch_in_gf(self, m: int, operations: list[tuple[str, list[int]]]) -> list[int | Exception]:
+        operation_logger.debug("Enter batch method with %s operations", len(operations))
+        get_field(m)
+        methods = {
+            'add': self.add_in_gf,
+            'subtract': self.subtract_in_gf,
+            'multiply': self.multiply_in_gf,
+            'divide': self.divide_in_gf,
+            'modulo': self.modulo_in_gf,
+            'invert': self.invert_in_gf,
+            'square': self.square_in_gf,
+            'sqrt': self.sqrt_in_gf,
+        }
+
+        results = [None] * len(operations)
+        pending = self._batch_vectorized(m, operations, results)
+        pending = self._batch_bitsliced(m, operations, pending, results)
+        pending = self._batch_inversions(m, operations, pending, results)
+        for index in pending:
+            op, operands = operations[index]
+            try:
+                results[index] = methods[op](m, *operands)
+            except (ZeroDivisionError, ValueError) as e:
+                results[index] = e
+
+        operation_logger.debug("Exit batch method")
+        return results
+
+    @staticmethod
+    def _batch_bitsliced(m: int, operations: list[tuple[str, list[int]]], pending: list[int], results: list) -> list[int]:
+        # Multiplications and squarings with reduced operands, transposed
+        # into bit planes and computed a whole group at a time.
+        field = get_field(m)
+        if not bitslice.is_worthwhile(field, len(pending)):
+            return pending
+
+        groups = {'multiply': [], 'square': []} if m <= BITSLICE_SQUARE_MAX_M else {'multiply': []}
+        for index in pending:
+            op, operands = operations[index]
+            if op in groups and all(operand >> m == 0 for operand in operands):
+                groups[op].append(index)
+
+        done = set()
+        for op, indexes in groups.items():
+            if not bitslice.is_worthwhile(field, len(indexes)):
+                continue
+            columns = [list(column) for column in zip(*(operations[index][1] for index in indexes))]
+            outputs = bitslice.multiply_many(field, *columns) if op == 'multiply' else bitslice.square_many(field, columns[0])
+            for index, value in zip(indexes, outputs):
+                results[index] = value
+            done.update(indexes)
+        return [index for index in pending if index not in done] if done else pending
+
+    def _batch_inversions(self, m: int, operations: list[tuple[str, list[int]]], pending: list[int], results: list) -> list[int]:
+        inversions = [index for index in pending if operations[index][0] in ('invert', 'divide')]
+        if len(inversions) < 2:
+            return pending
+
+        divisors = [operations[index][1][-1] for index in inversions]
+        dividends = [operations[index][1][0] if operations[index][0] == 'divide' else 1 for index in inversions]
+        quotients = self.divide_many_in_gf(m, dividends, divisors)
+        for index, quotient in zip(inversions, quotients):
+            if operations[index][0] == 'invert' and isinstance(quotient, ZeroDivisionError):
+                quotient = ValueError(f"Zero has no inverse in GF(2^{m})")
+            results[index] = quotient
+
+        done = set(inversions)
+        return [index for index in pending if index not in done]
+
+    @staticmethod
+    def _batch_vectorized(m: int, operations: list[tuple[str, list[int]]], results: list) -> list[int]:
+        if vectorized is None or not vectorized.is_vectorizable(m) or len(operations) < VECTORIZE_MIN_BATCH:
+            return list(range(len(operations)))
+
+        kernels = {
+            'add': vectorized.add,
+            'subtract': vectorized.subtract,
+            'multiply': vectorized.multiply,
+            'divide': vectorized.divide,
+            'invert': vectorized.invert,
+        }
+        groups = {}
+        pending = []
+        for index, (op, operands) in enumerate(operations):
+            # Zero divisors and unreduced operands take the scalar path so
+            # they keep their exact per-item results and errors.
+            if op in kernels and (op not in ('divide', 'invert') or operands[-1] != 0) and all(operand >> m == 0 for operand in operands):
+                groups.setdefault(op, []).append(index)
+            else:
+                pending.append(index)
+
+        for op, indexes in groups.items():
+            if len(indexes) < VECTORIZE_MIN_BATCH:
+                pending.extend(indexes)
+                continue
+            columns = zip(*(operations[index][1] for index in indexes))
+            arrays = [vectorized.from_ints(m, column) for column in columns]
+            for index, value in zip(indexes, kernels[op](m, *arrays).tolist()):
+                results[index] = value
+
+        pending.sort()
+        return pending
+
+
+class CachedPolyServices(PolyServices):
+    # PolyServices with results memoized in a ResultCache keyed by
+    # (operation, m, operands). Addition, subtraction and multiplication
+    # commute, so their operands are sorted to share one entry. Misses are
+    # computed on a plain PolyServices, so only the operations callers ask
+    # for are cached and not the ones they make internally; batch and bulk
+    # calls are cached per element. Misses on heavy large-field operations
+    # are computed in the offload pool, if any.
+    OPERATIONS = {
+        'add': 'add_in_gf',
+        'subtract': 'subtract_in_gf',
+        'multiply': 'multiply_in_gf',
+        'divide': 'divide_in_gf',
+        'modulo': 'modulo_in_gf',
+        'invert': 'invert_in_gf',
+        'square': 'square_in_gf',
+        'sqrt': 'sqrt_in_gf',
+        'power': 'pow_in_gf',
+    }
+    COMMUTATIVE = frozenset({'add', 'subtract', 'multiply'})
+
+    def __init__(self, cache: ResultCache, offload: OffloadPool | None = None):
+        super().__init__()
+        self.cache = cache
+        self.offload = offload
+        self.service = PolyServices()
+
+    def _key(self, op: str, m: int, operands: tuple[int, ...]) -> tuple:
+        return (op, m, *(sorted(operands) if op in self.COMMUTATIVE else operands))
+
+    def _compute(self, op: str, m: int, operands: tuple[int, ...]) -> int:
+        if self.offload is not None and self.offload.should_offload(op, m):
+            return self.offload.run(self.OPERATIONS[op], m, *operands)
+        return getattr(self.service, self.OPERATIONS[op])(m, *operands)
+
+    def _compute_batch(self, m: int, operations: list[tuple[str, list[int]]]) -> list[int | Exception]:
+        if self.offload is not None and any(self.offload.should_offload(op, m) for op, _ in operations):
+            return self.offload.run('batch_in_gf', m, operations)
+        return self.service.batch_in_gf(m, operations)
+
+    def _cached(self, op: str, m: int, *operands: int) -> int:
+        if not self.cache.enabled:
+            return self._compute(op, m, operands)
+        key = self._key(op, m, operands)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._compute(op, m, operands)
+            self.cache.put(key, result)
+        return result
+
+    def pin(self, op: str, m: int, operands: list[int]) -> int:
+        result = self._compute(op, m, tuple(operands))
+        self.cache.pin(self._key(op, m, tuple(operands)), result)
+        return result
+
+    def unpin(self, op: str, m: int, operands: list[int]) -> bool:
+        return self.cache.unpin(self._key(op, m, tuple(operands)))
+
+    def add_in_gf(self, m: int, poly1: int, poly2: int) -> int:
+        return self._cached('add', m, poly1, poly2)
+
+    def subtract_in_gf(self, m: int, poly1: int, poly2: int) -> int:
+        return self._cached('subtract', m, poly1, poly2)
+
+    def multiply_in_gf(self, m: int, poly1: int, poly2: int) -> int:
+        return self._cached('multiply', m, poly1, poly2)
+
+    def divide_in_gf(self, m: int, dividend: int, divisor: int) -> int:
+        return self._cached('divide', m, dividend, divisor)
+
+    def modulo_in_gf(self, m: int, poly: int) -> int:
+        return self._cached('modulo', m, poly)
+
+    def invert_in_gf(self, m: int, poly: int) -> int:
+        return self._cached('invert', m, poly)
+
+    def square_in_gf(self, m: int, poly: int) -> int:
+        return self._cached('square', m, poly)
+
+    def sqrt_in_gf(self, m: int, poly: int) -> int:
+        return self._cached('sqrt', m, poly)
+
+    def pow_in_gf(self, m: int, poly: int, exponent: int, cache_base: bool = False) -> int:
+        if cache_base:
+            return self.service.pow_in_gf(m, poly, exponent, cache_base)
+        return self._cached('power', m, poly, exponent)
+
+    def batch_in_gf(self, m: int, operations: list[tuple[str, list[int]]]) -> list[int | Exception]:
+        # The misses still run as one batch, so they keep the vectorized,
+        # bitsliced and batch-inversion paths. Errors are not cached.
+        if not self.cache.enabled:
+            return self._compute_batch(m, operations)
+        results = [None] * len(operations)
+        misses = []
+        keys = []
+        for index, (op, operands) in enumerate(operations):
+            key = self._key(op, m, tuple(operands))
+            result = self.cache.get(key)
+            if result is None:
+                misses.append(index)
+                keys.append(key)
+            else:
+                results[index] = result
+        if misses:
+            outputs = self._compute_batch(m, [operations[index] for index in misses])
+            for index, key, result in zip(misses, keys, outputs):
+                results[index] = result
+                if not isinstance(result, Exception):
+                    self.cache.put(key, result)
+        return results
+
+    def invert_many_in_gf(self, m: int, polys: list[int]) -> list[int | ValueError]:
+        return self.batch_in_gf(m, [('invert', [poly]) for poly in polys])
+
+    def multiply_many_in_gf(self, m: int, polys1: list[int], polys2: list[int]) -> list[int]:
+        return self.batch_in_gf(m, [('multiply', [poly1, poly2]) for poly1, poly2 in zip(polys1, polys2)])
+
+    def divide_many_in_gf(self, m: int, dividends: list[int], divisors: list[int]) -> list[int | Exception]:
+        return self.batch_in_gf(m, [('divide', [dividend, divisor]) for dividend, divisor in zip(dividends, divisors)])
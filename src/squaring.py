@@ -0,0 +1,33 @@
+# Squaring over GF(2) interleaves a zero bit after every bit of the input.
+# Each byte is spread with two 256-entry translate tables (low and high
+# nibble), so the whole operand is spread at C speed.
+_SPREAD_LOW = bytes(sum(((b >> i) & 1) << (2 * i) for i in range(4)) for b in range(256))
+_SPREAD_HIGH = bytes(sum(((b >> (i + 4)) & 1) << (2 * i) for i in range(4)) for b in range(256))
+
+
+def spread_bits(poly: int) -> int:
+    length = (poly.bit_length() + 7) // 8
+    data = poly.to_bytes(length, 'little')
+    spread = bytearray(2 * length)
+    spread[0::2] = data.translate(_SPREAD_LOW)
+    spread[1::2] = data.translate(_SPREAD_HIGH)
+    return int.from_bytes(spread, 'little')
+
+
+_EVEN_BITS = bytes(sum(((b >> (2 * i)) & 1) << i for i in range(4)) for b in range(256))
+_ODD_BITS = bytes(sum(((b >> (2 * i + 1)) & 1) << i for i in range(4)) for b in range(256))
+_EVEN_BITS_HIGH = bytes(value << 4 for value in _EVEN_BITS)
+_ODD_BITS_HIGH = bytes(value << 4 for value in _ODD_BITS)
+
+
+def split_bits(poly: int) -> tuple[int, int]:
+    # Inverse of spread_bits: returns (even, odd) with
+    # poly = spread_bits(even) ^ (spread_bits(odd) << 1). Even-indexed bytes
+    # land in the low nibble and odd-indexed ones in the high nibble of the
+    # same output byte, so the two halves combine with a single XOR.
+    length = (poly.bit_length() + 15) // 16 * 2
+    data = poly.to_bytes(length, 'little')
+    low, high = data[0::2], data[1::2]
+    even = int.from_bytes(low.translate(_EVEN_BITS), 'little') ^ int.from_bytes(high.translate(_EVEN_BITS_HIGH), 'little')
+    odd = int.from_bytes(low.translate(_ODD_BITS), 'little') ^ int.from_bytes(high.translate(_ODD_BITS_HIGH), 'little')
+    return even, odd
@@ -0,0 +1,160 @@
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from src.constants import LOG_TABLE_MAX_M, TABLE_FILE_VERSION
+from src.irreducible import get_irreducible_polynomial
+from src.logger import logger
+from src.tables import LogTables
+
+# Log/antilog tables on disk, one file per m:
+#   header (128 bytes): magic, format version, m, item size, generator,
+#                       exp length, log length, CRC32 of the payload,
+#                       SHA-256 of the modulus
+#   payload: exp then log, little-endian unsigned integers of `item size`
+# Workers map the file read-only and index it through memoryviews, so every
+# process shares the same page-cache copy and nothing is rebuilt. Build the
+# files once per deploy with `python -m src.table_store build [DIRECTORY]`
+# (default $GF_TABLE_DIR); create_app also builds any that are missing.
+
+MAGIC = b'GF2MLOG\x00'
+HEADER = struct.Struct('<8sIIIIIII32s')
+HEADER_SIZE = 128
+ITEM_FORMATS = {1: 'B', 2: 'H'}
+
+
+class StaleTableError(ValueError):
+    pass
+
+
+def modulus_digest(m: int, modulus: int) -> bytes:
+    return hashlib.sha256(f'{m}:{modulus:x}'.encode()).digest()
+
+
+def item_size(m: int) -> int:
+    return 1 if m <= 8 else 2
+
+
+def table_path(directory: str, m: int) -> str:
+    return os.path.join(directory, f'log_tables_m{m}.bin')
+
+
+def write_log_tables(path: str, tables: LogTables) -> None:
+    size = item_size(tables.m)
+    values = array(ITEM_FORMATS[size], tables.exp)
+    values.extend(tables.log)
+    if sys.byteorder == 'big':
+        values.byteswap()
+    payload = values.tobytes()
+    header = HEADER.pack(MAGIC, TABLE_FILE_VERSION, tables.m, size, tables.generator,
+                         len(tables.exp), len(tables.log), zlib.crc32(payload),
+                         modulus_digest(tables.m, tables.modulus))
+
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    # A unique temporary file per writer: threads of one server process may
+    # build the same missing m at once, and each renames its own file.
+    with tempfile.NamedTemporaryFile(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp',
+                                     delete=False) as f:
+        f.write(header.ljust(HEADER_SIZE, b'\x00'))
+        f.write(payload)
+    os.replace(f.name, path)
+
+
+def open_log_tables(path: str, m: int, modulus: int) -> LogTables:
+    # Raises FileNotFoundError when there is no file and StaleTableError when
+    # it was written for another modulus or format, or is damaged.
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    if len(mapped) < HEADER_SIZE:
+        raise StaleTableError(f"{path} is truncated")
+    (magic, version, file_m, size, generator, exp_length, log_length,
+     crc, digest) = HEADER.unpack_from(mapped)
+    if magic != MAGIC or version != TABLE_FILE_VERSION:
+        raise StaleTableError(f"{path} is not a version {TABLE_FILE_VERSION} table file")
+    if file_m != m or digest != modulus_digest(m, modulus):
+        raise StaleTableError(f"{path} was built for another modulus")
+    order = (1 << m) - 1
+    if size != item_size(m) or exp_length != 2 * order or log_length != order + 1:
+        raise StaleTableError(f"{path} has unexpected table sizes")
+    if len(mapped) != HEADER_SIZE + (exp_length + log_length) * size:
+        raise StaleTableError(f"{path} is truncated")
+
+    payload = memoryview(mapped)[HEADER_SIZE:]
+    if zlib.crc32(payload) != crc:
+        raise StaleTableError(f"{path} failed its checksum")
+    if size > 1 and sys.byteorder == 'big':
+        raise StaleTableError(f"{path} is little-endian; big-endian hosts build tables in memory")
+
+    values = payload.cast(ITEM_FORMATS[size])
+    return LogTables.from_arrays(m, modulus, generator,
+                                 values[:exp_length], values[exp_length:exp_length + log_length])
+
+
+table_directory = os.environ.get('GF_TABLE_DIR')
+
+
+def load_log_tables(m: int, modulus: int, directory: str | None = None) -> LogTables:
+    directory = directory or table_directory
+    if not directory:
+        return LogTables(m, modulus)
+
+    path = table_path(directory, m)
+    try:
+        return open_log_tables(path, m, modulus)
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning("Rebuilding log tables for GF(2^%s): %s", m, e)
+
+    tables = LogTables(m, modulus)
+    try:
+        write_log_tables(path, tables)
+        return open_log_tables(path, m, modulus)
+    except (OSError, ValueError) as e:
+        logger.warning("Could not share log tables for GF(2^%s) through %s: %s", m, path, e)
+        return tables
+
+
+def build_table_files(directory: str, ms=range(2, LOG_TABLE_MAX_M + 1)) -> list[str]:
+    # Deployment step: write (or refresh) the files once, before workers
+    # start, so that no worker has to build them.
+    paths = []
+    for m in ms:
+        modulus = get_irreducible_polynomial(m)
+        path = table_path(directory, m)
+        try:
+            open_log_tables(path, m, modulus)
+        except (OSError, ValueError):
+            write_log_tables(path, LogTables(m, modulus))
+        paths.append(path)
+    return paths
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m src.table_store',
+                                     description='Manage the shared log/antilog table files')
+    commands = parser.add_subparsers(dest='command', required=True)
+    build = commands.add_parser('build', help='write missing or stale table files')
+    build.add_argument('directory', nargs='?', default=table_directory, help='defaults to $GF_TABLE_DIR')
+    build.add_argument('--m', type=int, nargs='*', default=list(range(2, LOG_TABLE_MAX_M + 1)),
+                       help=f'field degrees, 2 to {LOG_TABLE_MAX_M} (default: all)')
+    args = parser.parse_args(argv)
+
+    if not args.directory:
+        parser.error('no directory given and GF_TABLE_DIR is not set')
+    if any(not 2 <= m <= LOG_TABLE_MAX_M for m in args.m):
+        parser.error(f'--m values must be between 2 and {LOG_TABLE_MAX_M}')
+    for path in build_table_files(args.directory, args.m):
+        print(path)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,77 @@
+class LogTables:
+    def __init__(self, m: int, modulus: int):
+        self.m = m
+        self.modulus = modulus
+        self.order = (1 << m) - 1
+        self.generator, self.exp, self.log = self._build(m, modulus, self.order)
+
+    @classmethod
+    def from_arrays(cls, m: int, modulus: int, generator: int, exp, log) -> 'LogTables':
+        # Wrap tables built elsewhere (e.g. memory-mapped from a file); exp
+        # and log only need to support indexing.
+        tables = cls.__new__(cls)
+        tables.m = m
+        tables.modulus = modulus
+        tables.order = (1 << m) - 1
+        tables.generator = generator
+        tables.exp = exp
+        tables.log = log
+        return tables
+
+    @staticmethod
+    def _times(value: int, factor: int, m: int, modulus: int) -> int:
+        result = 0
+        while factor:
+            if factor & 1:
+                result ^= value
+            factor >>= 1
+            value <<= 1
+            if value >> m:
+                value ^= modulus
+        return result
+
+    @classmethod
+    def _build(cls, m: int, modulus: int, order: int) -> tuple[int, list[int], list[int]]:
+        # Walk the powers of each candidate until one cycles through every
+        # non-zero element; the exp table is doubled so that a sum of two
+        # logarithms never needs a modular reduction.
+        for generator in range(2, order + 2):
+            exp = [0] * (2 * order)
+            log = [0] * (order + 1)
+            value = 1
+            for i in range(order):
+                if value == 1 and i:
+                    break
+                exp[i] = value
+                log[value] = i
+                value = cls._times(value, generator, m, modulus)
+            else:
+                if value == 1:
+                    exp[order:] = exp[:order]
+                    return generator, exp, log
+        raise ValueError(f"No primitive element found for modulus {modulus} in GF(2^{m})")
+
+    def multiply(self, poly1: int, poly2: int) -> int:
+        if poly1 == 0 or poly2 == 0:
+            return 0
+        return self.exp[self.log[poly1] + self.log[poly2]]
+
+    def divide(self, dividend: int, divisor: int) -> int:
+        if divisor == 0:
+            raise ZeroDivisionError(f"Division by zero in GF(2^{self.m})")
+        if dividend == 0:
+            return 0
+        return self.exp[self.log[dividend] + self.order - self.log[divisor]]
+
+    def invert(self, poly: int) -> int:
+        if poly == 0:
+            raise ValueError(f"Zero has no inverse in GF(2^{self.m})")
+        return self.exp[self.order - self.log[poly]]
+
+    def power(self, poly: int, exponent: int) -> int:
+        if poly == 0:
+            if exponent < 0:
+                raise ValueError(f"Zero has no inverse in GF(2^{self.m})")
+            return 1 if exponent == 0 else 0
+        return self.exp[(self.log[poly] * exponent) % self.order]
+
@@ -0,0 +1,171 @@
+import numbers
+from marshmallow import ValidationError
+from src.constants import OUTPUT_FORMATS
+from src.schemas import OPERAND_PATTERNS
+
+# Hand-compiled equivalents of SinglePolySchema, DoublePolySchema and
+# PowerSchema: the same rules and error messages, checked in one pass over
+# the request and built once at import. Operands come back parsed.
+
+M_RANGE = (1, 2**13)
+BITS = (16, 32, 64, 128, 256)
+TYPES = ('bin', 'hex')
+BASES = {'bin': 2, 'hex': 16}
+
+MISSING = 'Missing data for required field.'
+NULL = 'Field may not be null.'
+INVALID_INTEGER = 'Not a valid integer.'
+INVALID_STRING = 'Not a valid string.'
+NO_MATCH = 'String does not match expected pattern.'
+UNKNOWN = 'Unknown field.'
+EMPTY_OPERAND = 'Operand must not be empty.'
+
+
+def _integer(value, strict: bool = False) -> int:
+    if value is True or value is False or (strict and not isinstance(value, numbers.Integral)):
+        raise ValueError(INVALID_INTEGER)
+    try:
+        return int(value)
+    except OverflowError:
+        raise ValueError('Number too large.')
+    except (TypeError, ValueError):
+        raise ValueError(INVALID_INTEGER)
+
+
+def _m(value) -> int:
+    value = _integer(value)
+    if not M_RANGE[0] <= value <= M_RANGE[1]:
+        raise ValueError(f'Must be greater than or equal to {M_RANGE[0]} and less than or equal to {M_RANGE[1]}.')
+    return value
+
+
+def _bits(value) -> int:
+    value = _integer(value)
+    if value not in BITS:
+        raise ValueError(f'Must be one of: {", ".join(map(str, BITS))}.')
+    return value
+
+
+def _type(value) -> str:
+    if not isinstance(value, str):
+        raise ValueError(INVALID_STRING)
+    if value not in TYPES:
+        raise ValueError(f'Must be one of: {", ".join(TYPES)}.')
+    return value
+
+
+def _operand(pattern):
+    match = pattern.match
+
+    def parse(value) -> str:
+        if not isinstance(value, str):
+            raise ValueError(INVALID_STRING)
+        if not match(value):
+            raise ValueError(NO_MATCH)
+        return value
+    return parse
+
+
+def _output(value) -> str:
+    if not isinstance(value, str):
+        raise ValueError(INVALID_STRING)
+    if value not in OUTPUT_FORMATS:
+        raise ValueError(f'Must be one of: {", ".join(OUTPUT_FORMATS)}.')
+    return value
+
+
+def _exponent(value) -> int:
+    return _integer(value, strict=True)
+
+
+class RequestValidator:
+    def __init__(self, suffixes: tuple[str, ...], exponent: bool = False):
+        self.suffixes = suffixes
+        self.fields = {'m': _m, 'bits': _bits, 'type': _type}
+        for suffix in suffixes:
+            for type in TYPES:
+                # The schemas accept empty strings here; emptiness is
+                # reported once the operand is parsed.
+                self.fields[type + suffix] = _operand(OPERAND_PATTERNS[type + '_or_empty'])
+        self.fields['output'] = _output
+        if exponent:
+            self.fields['exponent'] = _exponent
+        self.required = ('m', 'bits', 'type') + (('exponent',) if exponent else ())
+
+    def __call__(self, data) -> dict:
+        if not isinstance(data, dict):
+            raise ValidationError({'_schema': ['Invalid input type.']})
+
+        values = {}
+        errors = {}
+        for name, parse in self.fields.items():
+            value = data.get(name, MISSING)
+            if value is MISSING:
+                if name in self.required:
+                    errors[name] = [MISSING]
+                continue
+            if value is None:
+                errors[name] = [NULL]
+                continue
+            try:
+                values[name] = parse(value)
+            except ValueError as e:
+                errors[name] = [str(e)]
+        for name in data:
+            if name not in self.fields:
+                errors[name] = [UNKNOWN]
+        if errors:
+            raise ValidationError(errors)
+
+        message = self._check_operands(values)
+        if message:
+            raise ValidationError({'_schema': [message]})
+
+        type = values['type']
+        operands = []
+        for suffix in self.suffixes:
+            name = type + suffix
+            if not values[name]:
+                raise ValidationError({name: [EMPTY_OPERAND]})
+            operands.append(int(values[name], BASES[type]))
+
+        request = {'m': values['m'], 'bits': values['bits'], 'type': type, 'operands': operands}
+        for name in ('exponent', 'output'):
+            if name in values:
+                request[name] = values[name]
+        return request
+
+    def _check_operands(self, values: dict) -> str | None:
+        type = values['type']
+        bits = values['bits']
+        if self.suffixes == ('',):
+            if type == 'bin' and 'bin' not in values:
+                return 'Binary input required when type is bin'
+            if type == 'hex' and 'hex' not in values:
+                return 'Hex input required when type is hex'
+            if type == 'bin' and len(values['bin']) > bits:
+                return f'bin must be of length at most {bits}'
+            if type == 'hex' and len(values['hex']) > bits // 4:
+                return f'hex must be of length at most {bits} / 4'
+            return None
+
+        for suffix in self.suffixes:
+            bin_name, hex_name = 'bin' + suffix, 'hex' + suffix
+            if bin_name not in values and hex_name not in values:
+                return f'Either {bin_name} or {hex_name} must be provided'
+            if bin_name in values and hex_name in values:
+                return f'Either {bin_name} or {hex_name} must be provided, not both'
+            if type == 'bin' and bin_name not in values:
+                return f'{bin_name} is required when type is bin'
+            if type == 'hex' and hex_name not in values:
+                return f'{hex_name} is required when type is hex'
+            if type == 'bin' and len(values[bin_name]) > bits:
+                return f'{bin_name} must be of length at most {bits}'
+            if type == 'hex' and len(values[hex_name]) > bits // 4:
+                return f'{hex_name} must be of length at most {bits} / 4'
+        return None
+
+
+validate_single_poly = RequestValidator(('',))
+validate_double_poly = RequestValidator(('1', '2'))
+validate_power = RequestValidator(('',), exponent=True)
@@ -0,0 +1,143 @@
+import numpy as np
+from src.constants import VECTORIZE_MAX_M
+from src.fields import GF2mField, get_field
+
+
+def element_dtype(m: int) -> np.dtype:
+    if m <= 8:
+        return np.dtype(np.uint8)
+    if m <= 16:
+        return np.dtype(np.uint16)
+    if m <= 32:
+        return np.dtype(np.uint32)
+    return np.dtype(np.uint64)
+
+
+def is_vectorizable(m: int) -> bool:
+    return 1 <= m <= VECTORIZE_MAX_M
+
+
+def from_ints(m: int, values) -> np.ndarray:
+    return np.array(values, dtype=element_dtype(m))
+
+
+def _field(m: int) -> GF2mField:
+    if not is_vectorizable(m):
+        raise ValueError(f"Vectorized arithmetic supports 1 <= m <= {VECTORIZE_MAX_M}, got {m}")
+    return get_field(m)
+
+
+def _elements(field: GF2mField, values) -> np.ndarray:
+    array = np.asarray(values)
+    if array.dtype.kind != 'u':
+        raise TypeError(f"Field elements must be an unsigned integer array, got {array.dtype}")
+    if array.dtype.itemsize * 8 > field.m and (array >> np.uint64(field.m)).any():
+        raise ValueError(f"Field elements must be smaller than 2^{field.m}")
+    return array.astype(element_dtype(field.m), copy=False)
+
+
+def _log_arrays(field: GF2mField) -> tuple[np.ndarray, np.ndarray] | None:
+    if field.log_tables is None:
+        return None
+    arrays = field.precomputed.get('numpy_log_tables')
+    if arrays is None:
+        tables = field.log_tables
+        # Memory-mapped exp tables are viewed in place; log is widened so
+        # that sums of logarithms cannot overflow.
+        exp = np.asarray(tables.exp, dtype=element_dtype(field.m))
+        log = np.array(tables.log, dtype=np.int32)
+        arrays = field.precomputed['numpy_log_tables'] = (exp, log)
+    return arrays
+
+
+def _multiply_bitwise(field: GF2mField, poly1: np.ndarray, poly2: np.ndarray) -> np.ndarray:
+    # Same shift-and-add as PolyServices._multiply_loop, one bit of poly2
+    # across the whole array per step.
+    one = np.uint64(1)
+    mask = np.uint64(field.mask)
+    top = np.uint64(field.m - 1)
+    reduction = np.uint64(field.modulus & field.mask)
+
+    poly1 = poly1.astype(np.uint64)
+    poly2 = poly2.astype(np.uint64)
+    result = np.zeros(np.broadcast_shapes(poly1.shape, poly2.shape), dtype=np.uint64)
+    for i in range(field.m):
+        result ^= poly1 & (np.uint64(0) - ((poly2 >> np.uint64(i)) & one))
+        carry = (poly1 >> top) & one
+        poly1 = ((poly1 << one) & mask) ^ (reduction & (np.uint64(0) - carry))
+    return result.astype(element_dtype(field.m))
+
+
+def add(m: int, poly1, poly2) -> np.ndarray:
+    field = _field(m)
+    return _elements(field, poly1) ^ _elements(field, poly2)
+
+
+def subtract(m: int, poly1, poly2) -> np.ndarray:
+    return add(m, poly1, poly2)
+
+
+def multiply(m: int, poly1, poly2) -> np.ndarray:
+    field = _field(m)
+    poly1 = _elements(field, poly1)
+    poly2 = _elements(field, poly2)
+
+    arrays = _log_arrays(field)
+    if arrays is None:
+        return _multiply_bitwise(field, poly1, poly2)
+
+    exp, log = arrays
+    result = exp[log[poly1] + log[poly2]]
+    result[(poly1 == 0) | (poly2 == 0)] = 0
+    return result
+
+
+def square(m: int, poly) -> np.ndarray:
+    field = _field(m)
+    poly = _elements(field, poly)
+
+    arrays = _log_arrays(field)
+    if arrays is None:
+        return _multiply_bitwise(field, poly, poly)
+
+    exp, log = arrays
+    result = exp[2 * log[poly]]
+    result[poly == 0] = 0
+    return result
+
+
+def invert(m: int, poly) -> np.ndarray:
+    field = _field(m)
+    poly = _elements(field, poly)
+    if (poly == 0).any():
+        raise ValueError(f"Zero has no inverse in GF(2^{m})")
+
+    arrays = _log_arrays(field)
+    if arrays is not None:
+        exp, log = arrays
+        return exp[field.log_tables.order - log[poly]]
+
+    # Fermat: poly^(2^m - 2) = poly^2 * poly^4 * ... * poly^(2^(m-1))
+    result = np.ones_like(poly)
+    power = poly
+    for _ in range(m - 1):
+        power = _multiply_bitwise(field, power, power)
+        result = _multiply_bitwise(field, result, power)
+    return result
+
+
+def divide(m: int, dividend, divisor) -> np.ndarray:
+    field = _field(m)
+    dividend = _elements(field, dividend)
+    divisor = _elements(field, divisor)
+    if (divisor == 0).any():
+        raise ZeroDivisionError(f"Division by zero in GF(2^{m})")
+
+    arrays = _log_arrays(field)
+    if arrays is None:
+        return _multiply_bitwise(field, dividend, invert(m, divisor))
+
+    exp, log = arrays
+    result = exp[log[dividend] + field.log_tables.order - log[divisor]]
+    result[dividend == 0] = 0
+    return result
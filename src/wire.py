@@ -0,0 +1,186 @@
+import struct
+from src.constants import BATCH_OPERATIONS, WIRE_MAX_PAYLOAD_BYTES, WIRE_MAX_WIDTH, WIRE_OPERATIONS, WIRE_VERSION
+
+try:
+    import numpy as np
+    from src import vectorized
+except ImportError:
+    np = vectorized = None
+
+# Packed binary requests for bulk traffic (application/octet-stream):
+#   header (16 bytes, little-endian): magic, version, op code, flags, m,
+#                                     element width in bytes, count
+#   body: count records of `arity` operands, each `width` bytes, in the byte
+#         order chosen by the big-endian flag
+# The response repeats the header, then count results of the same width and
+# byte order, then one status byte per result. Power records carry the
+# exponent as their second operand.
+
+MAGIC = b'GF2B'
+HEADER = struct.Struct('<4sBBBxHHI')
+MAX_MESSAGE_BYTES = HEADER.size + WIRE_MAX_PAYLOAD_BYTES
+FLAG_BIG_ENDIAN = 0x01
+
+STATUS_OK = 0
+STATUS_DIVISION_BY_ZERO = 1
+STATUS_INVALID = 2
+
+CONTENT_TYPE = 'application/octet-stream'
+OPERATION_NAMES = {code: op for op, code in WIRE_OPERATIONS.items()}
+ARITY = dict(BATCH_OPERATIONS, power=2)
+VECTOR_WIDTHS = {1: 'u1', 2: 'u2', 4: 'u4', 8: 'u8'}
+
+
+class WireFormatError(ValueError):
+    pass
+
+
+class WireRequest:
+    def __init__(self, op: str, m: int, width: int, byteorder: str, count: int, payload: memoryview):
+        self.op = op
+        self.m = m
+        self.width = width
+        self.byteorder = byteorder
+        self.count = count
+        self.payload = payload
+
+    @property
+    def arity(self) -> int:
+        return ARITY[self.op]
+
+    def columns(self) -> list[list[int]]:
+        # One list of operands per position; slicing the memoryview does not
+        # copy the payload.
+        width, byteorder, payload = self.width, self.byteorder, self.payload
+        from_bytes = int.from_bytes
+        stride = width * self.arity
+        return [[from_bytes(payload[offset:offset + width], byteorder)
+                 for offset in range(position * width, len(payload), stride)]
+                for position in range(self.arity)]
+
+    def arrays(self):
+        # The same columns as strided views over the payload, when numpy can
+        # hold an element of this width.
+        if np is None or self.width not in VECTOR_WIDTHS:
+            return None
+        dtype = np.dtype(('<' if self.byteorder == 'little' else '>') + VECTOR_WIDTHS[self.width])
+        records = np.frombuffer(self.payload, dtype=dtype).reshape(self.count, self.arity)
+        return [records[:, position] for position in range(self.arity)]
+
+
+def decode(body: bytes) -> WireRequest:
+    view = memoryview(body)
+    if len(view) < HEADER.size:
+        raise WireFormatError(f"Request is shorter than the {HEADER.size}-byte header")
+    magic, version, code, flags, m, width, count = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise WireFormatError("Request does not start with the GF2B magic")
+    if version != WIRE_VERSION:
+        raise WireFormatError(f"Unsupported wire format version {version}")
+    if code not in OPERATION_NAMES:
+        raise WireFormatError(f"Unknown operation code {code}")
+    if flags & ~FLAG_BIG_ENDIAN:
+        raise WireFormatError(f"Unknown flags {flags:#x}")
+    if not 1 <= m <= 2**13:
+        raise WireFormatError("m must be between 1 and 8192")
+    if not (m + 7) // 8 <= width <= WIRE_MAX_WIDTH:
+        raise WireFormatError(f"Element width must be between {(m + 7) // 8} and {WIRE_MAX_WIDTH} bytes for m={m}")
+
+    op = OPERATION_NAMES[code]
+    size = count * ARITY[op] * width
+    if size > WIRE_MAX_PAYLOAD_BYTES:
+        raise WireFormatError(f"Payload must be at most {WIRE_MAX_PAYLOAD_BYTES} bytes")
+    if len(view) != HEADER.size + size:
+        raise WireFormatError(f"Expected {size} payload bytes for {count} {op} records, got {len(view) - HEADER.size}")
+    byteorder = 'big' if flags & FLAG_BIG_ENDIAN else 'little'
+    return WireRequest(op, m, width, byteorder, count, view[HEADER.size:])
+
+
+def _status(error: Exception) -> int:
+    return STATUS_DIVISION_BY_ZERO if isinstance(error, ZeroDivisionError) else STATUS_INVALID
+
+
+def _evaluate_arrays(request: WireRequest, arrays) -> tuple | None:
+    kernels = {
+        'add': vectorized.add,
+        'subtract': vectorized.subtract,
+        'multiply': vectorized.multiply,
+        'divide': vectorized.divide,
+        'invert': vectorized.invert,
+        'square': vectorized.square,
+    }
+    kernel = kernels.get(request.op)
+    if kernel is None or not vectorized.is_vectorizable(request.m):
+        return None
+
+    statuses = bytearray(request.count)
+    zeros = None
+    if request.op in ('divide', 'invert'):
+        # Zero divisors get a status; 1 stands in for them in the kernel.
+        zeros = arrays[-1] == 0
+        if zeros.any():
+            arrays[-1] = np.where(zeros, arrays[-1].dtype.type(1), arrays[-1])
+            status = STATUS_DIVISION_BY_ZERO if request.op == 'divide' else STATUS_INVALID
+            statuses = bytearray(zeros.astype(np.uint8) * status)
+    try:
+        results = kernel(request.m, *arrays)
+    except ValueError:
+        # Unreduced operands: the scalar path keeps their exact results.
+        return None
+    if zeros is not None:
+        results[zeros] = 0
+    return results, statuses
+
+
+def evaluate_columns(service, op: str, m: int, columns: list[list[int]]) -> tuple[list[int], bytearray]:
+    if op == 'power':
+        outputs = []
+        for poly, exponent in zip(*columns):
+            try:
+                outputs.append(service.pow_in_gf(m, poly, exponent))
+            except (ZeroDivisionError, ValueError) as e:
+                outputs.append(e)
+    else:
+        outputs = service.batch_in_gf(m, [(op, list(operands)) for operands in zip(*columns)])
+
+    results = []
+    statuses = bytearray(len(outputs))
+    for index, output in enumerate(outputs):
+        if isinstance(output, Exception):
+            statuses[index] = _status(output)
+            output = 0
+        results.append(output)
+    return results, statuses
+
+
+def evaluate(service, request: WireRequest) -> tuple:
+    # (results, statuses); results is a numpy array when the whole request
+    # went through a vectorized kernel and a list of ints otherwise.
+    arrays = request.arrays()
+    if arrays is not None:
+        evaluated = _evaluate_arrays(request, arrays)
+        if evaluated is not None:
+            return evaluated
+    return evaluate_columns(service, request.op, request.m, request.columns())
+
+
+def pack_results(results, statuses: bytearray, width: int, byteorder: str) -> bytes:
+    # Results outside `width` bytes are written as zero with STATUS_INVALID.
+    if np is not None and isinstance(results, np.ndarray):
+        dtype = np.dtype(('<' if byteorder == 'little' else '>') + VECTOR_WIDTHS[width])
+        return results.astype(dtype).tobytes()
+
+    packed = bytearray()
+    for index, result in enumerate(results):
+        try:
+            packed += result.to_bytes(width, byteorder)
+        except OverflowError:
+            statuses[index] = STATUS_INVALID
+            packed += bytes(width)
+    return bytes(packed)
+
+
+def encode(request: WireRequest, results, statuses: bytearray) -> bytes:
+    flags = FLAG_BIG_ENDIAN if request.byteorder == 'big' else 0
+    header = HEADER.pack(MAGIC, WIRE_VERSION, WIRE_OPERATIONS[request.op], flags, request.m, request.width, request.count)
+    return b''.join((header, pack_results(results, statuses, request.width, request.byteorder), statuses))
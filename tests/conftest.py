@@ -0,0 +1,23 @@
+import os
+
+# Log to stderr only: set before src.logger configures itself on import.
+os.environ.setdefault('GF_LOG_FILE', '')
+
+import pytest
+from src import irreducible, table_store
+
+
+@pytest.fixture(autouse=True, scope='session')
+def isolated_caches(tmp_path_factory):
+    # Keep generated moduli and shared table files out of $HOME and the
+    # working tree. The environment covers worker and CLI subprocesses,
+    # which read it at import.
+    directory = tmp_path_factory.mktemp('caches')
+    cache_path = str(directory / 'irreducible.json')
+    table_dir = str(directory / 'tables')
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv('GF_IRREDUCIBLE_CACHE', cache_path)
+        patch.setenv('GF_TABLE_DIR', table_dir)
+        patch.setattr(irreducible, 'irreducible_cache', irreducible.IrreducibleCache(cache_path))
+        patch.setattr(table_store, 'table_directory', table_dir)
+        yield directory
@@ -0,0 +1,54 @@
+import random
+import pytest
+from src.additive_fft import evaluate, interpolate, multiply, multiply_fft, multiply_schoolbook
+from src.fields import get_field
+from src.services import PolyServices
+
+
+def _horner(field, coefficients, point):
+    value = 0
+    for coefficient in reversed(coefficients):
+        value = PolyServices._multiply(field, value, point) ^ coefficient
+    return value
+
+@pytest.mark.parametrize("m, length", [(1, 2), (4, 3), (8, 8), (8, 33), (16, 64), (17, 16), (64, 20)])
+def test_evaluate_matches_horner(m, length):
+    rng = random.Random(m * length)
+    field = get_field(m)
+    coefficients = [rng.getrandbits(m) for _ in range(length)]
+    values = evaluate(field, coefficients)
+    assert len(values) == length
+    assert values == [_horner(field, coefficients, point) for point in range(length)]
+
+@pytest.mark.parametrize("m, length", [(1, 2), (8, 1), (8, 256), (16, 128), (33, 32)])
+def test_interpolate_inverts_evaluate(m, length):
+    rng = random.Random(m + length)
+    field = get_field(m)
+    coefficients = [rng.getrandbits(m) for _ in range(length)]
+    assert interpolate(field, evaluate(field, coefficients)) == coefficients
+
+@pytest.mark.parametrize("m, lengths", [(8, (100, 50)), (16, (300, 260)), (16, (1, 5)), (40, (70, 90))])
+def test_multiply_matches_schoolbook(m, lengths):
+    rng = random.Random(m)
+    field = get_field(m)
+    poly1 = [rng.getrandbits(m) for _ in range(lengths[0])]
+    poly2 = [rng.getrandbits(m) for _ in range(lengths[1])]
+    expected = multiply_schoolbook(field, poly1, poly2)
+    assert multiply(field, poly1, poly2) == expected
+    assert multiply_fft(field, poly1, poly2) == expected
+
+def test_precomputation_is_cached_per_size():
+    field = get_field(12)
+    evaluate(field, [1, 2, 3], 8)
+    evaluate(field, [1, 2, 3, 4, 5], 8)
+    assert list(field.precomputed['additive_fft']) == [3]
+
+def test_invalid_sizes():
+    field = get_field(4)
+    with pytest.raises(ValueError):
+        evaluate(field, [1] * 17)
+    with pytest.raises(ValueError):
+        evaluate(field, [1, 2, 3], 2)
+    with pytest.raises(ValueError):
+        interpolate(field, [1, 2, 3])
+    assert multiply(field, [], [1]) == []
@@ -0,0 +1,55 @@
+import random
+import pytest
+from src import bitslice
+from src.fields import get_field
+from src.services import PolyServices
+
+
+@pytest.mark.parametrize("m", [1, 2, 8, 9, 16, 17, 33, 64, 65, 163])
+@pytest.mark.parametrize("n", [0, 1, 7, 64, 100])
+def test_transpose_round_trip(m, n):
+    rng = random.Random(m * 1000 + n)
+    values = [rng.getrandbits(m) for _ in range(n)]
+    planes = bitslice.transpose_in(values, m)
+    assert len(planes) == m
+    assert bitslice.transpose_out(planes, n) == values
+
+def test_transpose_bit_layout():
+    planes = bitslice.transpose_in([0b01, 0b10, 0b11], 2)
+    assert planes == [0b101, 0b110]
+
+@pytest.mark.parametrize("m", [2, 3, 8, 16, 24, 40, 64, 113, 163, 233])
+def test_multiply_and_square_match_scalar(m):
+    rng = random.Random(m)
+    field = get_field(m)
+    polys1 = [rng.getrandbits(m) for _ in range(50)] + [0, 1, field.mask]
+    polys2 = [rng.getrandbits(m) for _ in range(50)] + [field.mask, field.mask, field.mask]
+    assert bitslice.multiply_many(field, polys1, polys2) == \
+        [PolyServices._multiply(field, poly1, poly2) for poly1, poly2 in zip(polys1, polys2)]
+    assert bitslice.square_many(field, polys1) == [PolyServices._multiply(field, poly, poly) for poly in polys1]
+
+def test_is_worthwhile():
+    assert not bitslice.is_worthwhile(get_field(32), 10)
+    assert bitslice.is_worthwhile(get_field(32), 1000)
+    assert not bitslice.is_worthwhile(get_field(8), 500)
+    assert not bitslice.is_worthwhile(get_field(571), 500)
+
+@pytest.mark.parametrize("m", [32, 163])
+def test_services_use_bitslicing_without_numpy(m, monkeypatch):
+    monkeypatch.setattr('src.services.vectorized', None)
+    service = PolyServices()
+    field = get_field(m)
+    rng = random.Random(m)
+    n = 2 * max(128, 2 * m)
+    polys1 = [rng.getrandbits(m) for _ in range(n)]
+    polys2 = [rng.getrandbits(m) for _ in range(n)]
+    expected = [PolyServices._multiply(field, poly1, poly2) for poly1, poly2 in zip(polys1, polys2)]
+    assert service.multiply_many_in_gf(m, polys1, polys2) == expected
+
+    operations = [('multiply', [poly1, poly2]) for poly1, poly2 in zip(polys1, polys2)]
+    operations += [('square', [polys1[0]]), ('multiply', [1 << m, 3]), ('invert', [0])]
+    results = service.batch_in_gf(m, operations)
+    assert results[:n] == expected
+    assert results[n] == service.square_in_gf(m, polys1[0])
+    assert results[n + 1] == service.multiply_in_gf(m, 1 << m, 3)
+    assert isinstance(results[n + 2], ValueError)
@@ -0,0 +1,133 @@
+import subprocess
+import sys
+import pytest
+from src import cli
+from src.services import PolyServices
+
+
+def records_for(m, count, arity=2):
+    return [tuple((i * 0x9E3779B97F4A7C15 + k * 0xC2B2AE3D27D4EB4F) % (1 << m) for k in range(arity))
+            for i in range(count)]
+
+def write_packed(path, records, width):
+    path.write_bytes(b''.join(operand.to_bytes(width, 'little') for record in records for operand in record))
+
+def read_packed(path, width):
+    data = path.read_bytes()
+    return [int.from_bytes(data[i:i + width], 'little') for i in range(0, len(data), width)]
+
+@pytest.mark.parametrize("m, width", [(8, 1), (163, 21)])
+def test_packed_multiply_matches_services(tmp_path, m, width):
+    service = PolyServices()
+    records = records_for(m, 300)
+    write_packed(tmp_path / 'in.bin', records, width)
+    assert cli.main(['multiply', '-m', str(m), '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'),
+                     '--chunk-size', '1000', '-q']) == 0
+    assert read_packed(tmp_path / 'out.bin', width) == [service.multiply_in_gf(m, *record) for record in records]
+
+def test_text_divide_writes_error_lines(tmp_path):
+    (tmp_path / 'in.txt').write_text('1B 3\n\n1B 0\n1 1\n')
+    assert cli.main(['divide', '-m', '8', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.txt'),
+                     '--format', 'hex', '-q']) == 0
+    service = PolyServices()
+    assert (tmp_path / 'out.txt').read_text().splitlines() == [
+        f'{service.divide_in_gf(8, 0x1B, 3):02X}', 'ERROR division by zero', '01']
+
+def test_bin_input_to_packed_output(tmp_path):
+    (tmp_path / 'in.txt').write_text('101\n11111111\n')
+    assert cli.main(['invert', '-m', '8', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.bin'),
+                     '--format', 'bin', '--output-format', 'packed', '-q']) == 0
+    service = PolyServices()
+    assert read_packed(tmp_path / 'out.bin', 1) == [service.invert_in_gf(8, 5), service.invert_in_gf(8, 0xFF)]
+
+def test_text_chunks_split_on_lines(tmp_path):
+    records = records_for(64, 200)
+    (tmp_path / 'in.txt').write_text(''.join(f'{a:X} {b:X}\n' for a, b in records))
+    for chunk_size in ('7', '1000000'):
+        assert cli.main(['add', '-m', '64', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.txt'),
+                         '--format', 'hex', '--chunk-size', chunk_size, '-q']) == 0
+        assert [int(line, 16) for line in (tmp_path / 'out.txt').read_text().splitlines()] == [a ^ b for a, b in records]
+
+def test_resume_truncates_and_appends(tmp_path):
+    records = records_for(16, 100)
+    write_packed(tmp_path / 'in.bin', records, 2)
+    args = ['multiply', '-m', '16', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'), '-q']
+    assert cli.main(args) == 0
+    expected = (tmp_path / 'out.bin').read_bytes()
+    # A stopped run that got past its last reported offset.
+    (tmp_path / 'out.bin').write_bytes(expected[:120] + b'\xff' * 10)
+    assert cli.main(args + ['--resume-from', str(60 * 4)]) == 0
+    assert (tmp_path / 'out.bin').read_bytes() == expected
+
+def test_text_resume_does_not_duplicate_lines(tmp_path):
+    records = records_for(8, 100)
+    lines = [f'{a:X} {b:X}\n' for a, b in records]
+    lines[30:30] = ['\n', '1B 0\n']
+    (tmp_path / 'in.txt').write_text(''.join(lines))
+    args = ['divide', '-m', '8', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.txt'),
+            '--format', 'hex', '--chunk-size', '50', '-q']
+    assert cli.main(args) == 0
+    expected = (tmp_path / 'out.txt').read_bytes()
+    # Stopped after writing the first 60 lines, last reported at input line 45.
+    resume_from = len(''.join(lines[:45]))
+    (tmp_path / 'out.txt').write_bytes(b''.join(expected.splitlines(keepends=True)[:60]))
+    assert cli.main(args + ['--resume-from', str(resume_from)]) == 0
+    assert (tmp_path / 'out.txt').read_bytes() == expected
+
+def test_packed_to_text_resume_does_not_duplicate_lines(tmp_path):
+    write_packed(tmp_path / 'in.bin', records_for(16, 100), 2)
+    args = ['multiply', '-m', '16', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.txt'),
+            '--output-format', 'bin', '-q']
+    assert cli.main(args) == 0
+    expected = (tmp_path / 'out.txt').read_bytes()
+    assert cli.main(args + ['--resume-from', str(70 * 4)]) == 0
+    assert (tmp_path / 'out.txt').read_bytes() == expected
+
+def test_resume_needs_the_earlier_output(tmp_path, capsys):
+    (tmp_path / 'in.txt').write_text('1 2\n3 4\n5 6\n')
+    (tmp_path / 'out.txt').write_text('03\n')
+    assert cli.main(['add', '-m', '8', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.txt'),
+                     '--format', 'hex', '--resume-from', '8', '-q']) == 1
+    assert 'fewer than the 2 results' in capsys.readouterr().err
+
+def test_resume_offset_must_be_on_a_boundary(tmp_path, capsys):
+    write_packed(tmp_path / 'in.bin', records_for(16, 10), 2)
+    assert cli.main(['multiply', '-m', '16', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'),
+                     '--resume-from', '6', '-q']) == 1
+    assert 'resume offset' in capsys.readouterr().err
+    (tmp_path / 'in.txt').write_text('1 2\n3 4\n')
+    assert cli.main(['add', '-m', '8', '-i', str(tmp_path / 'in.txt'), '-o', str(tmp_path / 'out.txt'),
+                     '--format', 'hex', '--resume-from', '2', '-q']) == 1
+
+def test_truncated_packed_input_is_rejected(tmp_path):
+    (tmp_path / 'in.bin').write_bytes(b'\x01\x02\x03')
+    assert cli.main(['multiply', '-m', '8', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'), '-q']) == 1
+
+def test_empty_input(tmp_path):
+    (tmp_path / 'in.bin').write_bytes(b'')
+    assert cli.main(['square', '-m', '8', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'), '-q']) == 0
+    assert (tmp_path / 'out.bin').read_bytes() == b''
+
+def test_progress_report(tmp_path, capsys):
+    write_packed(tmp_path / 'in.bin', records_for(8, 10), 1)
+    assert cli.main(['add', '-m', '8', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin')]) == 0
+    assert '20/20 bytes (100.0%), 10 records, 0 failed' in capsys.readouterr().err
+
+def test_jobs_match_single_process(tmp_path):
+    records = records_for(64, 500)
+    write_packed(tmp_path / 'in.bin', records, 8)
+    args = ['multiply', '-m', '64', '-i', str(tmp_path / 'in.bin'), '--chunk-size', '1600', '-q']
+    assert cli.main(args + ['-o', str(tmp_path / 'one.bin')]) == 0
+    assert cli.main(args + ['-o', str(tmp_path / 'two.bin'), '-j', '2']) == 0
+    assert (tmp_path / 'one.bin').read_bytes() == (tmp_path / 'two.bin').read_bytes()
+
+def test_jobs_resolve_the_field_before_starting_workers(tmp_path, monkeypatch):
+    resolved = []
+    monkeypatch.setattr(cli, 'get_field', resolved.append)
+    write_packed(tmp_path / 'in.bin', records_for(8, 10), 1)
+    assert cli.main(['add', '-m', '8', '-i', str(tmp_path / 'in.bin'), '-o', str(tmp_path / 'out.bin'), '-j', '2', '-q']) == 0
+    assert resolved == [8]
+
+def test_cli_does_not_import_flask():
+    code = 'import sys, src.cli; sys.exit("flask" in sys.modules)'
+    assert subprocess.run([sys.executable, '-c', code], capture_output=True).returncode == 0
@@ -0,0 +1,53 @@
+import random
+import pytest
+from src.clmul import clmul_karatsuba, clmul_schoolbook, multiply_karatsuba
+from src.fields import get_field
+from src.services import PolyServices
+
+
+def clmul_reference(poly1, poly2):
+    result = 0
+    shift = 0
+    while poly2:
+        if poly2 & 1:
+            result ^= poly1 << shift
+        poly2 >>= 1
+        shift += 1
+    return result
+
+@pytest.mark.parametrize("bits", [1, 7, 63, 64, 65, 300, 1500, 5000])
+def test_clmul_matches_reference(bits):
+    rng = random.Random(bits)
+    poly1, poly2 = rng.getrandbits(bits), rng.getrandbits(bits)
+    expected = clmul_reference(poly1, poly2)
+    assert clmul_schoolbook(poly1, poly2) == expected
+    assert clmul_karatsuba(poly1, poly2, base_bits=128) == expected
+
+def test_clmul_unbalanced_operands():
+    rng = random.Random(1)
+    poly1, poly2 = rng.getrandbits(3000), rng.getrandbits(40)
+    assert clmul_karatsuba(poly1, poly2, base_bits=128) == clmul_reference(poly1, poly2)
+    assert clmul_karatsuba(0, poly1) == 0
+
+@pytest.mark.parametrize("m, modulus", [
+    (8, None),
+    (33, None),
+    (64, None),
+    (163, None),
+    (571, None),
+    (2048, (1 << 2048) | (1 << 19) | (1 << 14) | (1 << 13) | 1),
+    (8192, (1 << 8192) | (1 << 9) | (1 << 5) | (1 << 2) | 1),
+])
+def test_multiply_matches_loop(m, modulus):
+    field = get_field(m, modulus)
+    rng = random.Random(m)
+    for _ in range(5):
+        poly1, poly2 = rng.getrandbits(m), rng.getrandbits(m)
+        assert multiply_karatsuba(field, poly1, poly2) == PolyServices._multiply_loop(field, poly1, poly2)
+
+def test_service_uses_large_field_path():
+    field = get_field(64)
+    rng = random.Random(0)
+    poly1, poly2 = rng.getrandbits(64), rng.getrandbits(64)
+    assert PolyServices.multiply_in_gf(64, poly1, poly2) == PolyServices._multiply_loop(field, poly1, poly2)
+    assert field.taps is not None
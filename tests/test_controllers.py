@@ -1,6 +1,7 @@
 import pytest
 from flask import json
 from app import create_app
+from src.result_cache import result_cache
 
 @pytest.fixture
 def client():
@@ -9,6 +10,18 @@ def client():
     with app.test_client() as client:
         yield client
 
+@pytest.fixture
+def enabled_result_cache():
+    # The endpoints share the module-level cache: enable it for one test and
+    # leave it empty and as configured afterwards.
+    max_bytes, max_entry_bytes, max_pinned = result_cache.max_bytes, result_cache.max_entry_bytes, result_cache.max_pinned
+    result_cache.clear(pinned=True)
+    result_cache.resize(1 << 20)
+    yield result_cache
+    result_cache.clear(pinned=True)
+    result_cache.max_pinned = max_pinned
+    result_cache.resize(max_bytes, max_entry_bytes)
+
 @pytest.mark.parametrize("data, expected_result", [
     ({'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B'}, {'hex': '0x0031', 'bin': '0b0000000000110001'}),
     ({'m': 8, 'bits': 16, 'type': 'bin', 'bin1': '0000000000011010', 'bin2': '0000000000101011'}, {'hex': '0x0031', 'bin': '0b0000000000110001'})
@@ -165,3 +178,285 @@ def test_invert_endpoint_failure(client, data, expected_status):
     assert response.status_code == expected_status
     data = json.loads(response.data)
     assert 'error' in data
+
+@pytest.mark.parametrize("endpoint, data, expected_hex", [
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A', 'exponent': 3}, '0x00F7'),
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A', 'exponent': -2}, '0x0017'),
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '0000', 'exponent': 0}, '0x0001'),
+    ('/square', {'m': 8, 'bits': 16, 'type': 'bin', 'bin': '0000000000011010'}, '0x005F'),
+    ('/sqrt', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A'}, '0x0011'),
+])
+def test_power_square_sqrt_endpoints(client, endpoint, data, expected_hex):
+    response = client.post(endpoint, json=data)
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['result']['hex'] == expected_hex
+
+@pytest.mark.parametrize("endpoint, data, expected_status", [
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A'}, 400),
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A', 'exponent': '3'}, 400),
+    ('/power', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '0000', 'exponent': -1}, 405),
+    ('/square', {'m': 8, 'bits': 16, 'type': 'hex', 'hex': '00ZZ'}, 400),
+    ('/sqrt', {'m': 8, 'bits': 16, 'type': 'bin'}, 400),
+])
+def test_power_square_sqrt_endpoints_failure(client, endpoint, data, expected_status):
+    response = client.post(endpoint, json=data)
+    assert response.status_code == expected_status
+    data = json.loads(response.data)
+    assert 'error' in data
+
+def test_batch_endpoint(client):
+    data = {'m': 8, 'bits': 16, 'type': 'hex', 'operations': [
+        {'op': 'add', 'operands': ['001A', '002B']},
+        {'op': 'multiply', 'operands': ['001A', '002B']},
+        {'op': 'divide', 'operands': ['001A', '002B']},
+        {'op': 'modulo', 'operands': ['001A']},
+        {'op': 'invert', 'operands': ['001A']},
+    ]}
+    response = client.post('/batch', json=data)
+    assert response.status_code == 200
+    results = json.loads(response.data)['results']
+    assert [r['result']['hex'] for r in results] == ['0x0031', '0x0093', '0x00C9', '0x001A', '0x00FD']
+    assert results[1]['result']['bin'] == '0b0000000010010011'
+
+def test_batch_endpoint_item_errors(client):
+    data = {'m': 8, 'bits': 16, 'type': 'bin', 'operations': [
+        {'op': 'divide', 'operands': ['11010', '0']},
+        {'op': 'invert', 'operands': ['0']},
+        {'op': 'power', 'operands': ['11010']},
+        {'op': 'add', 'operands': ['11010']},
+        {'op': 'add', 'operands': ['11010', '002B']},
+        {'op': 'add', 'operands': ['11010', '101011']},
+        1,
+        ['add', '1', '10'],
+    ]}
+    response = client.post('/batch', json=data)
+    assert response.status_code == 200
+    results = json.loads(response.data)['results']
+    assert [r.get('status') for r in results] == [404, 405, 400, 400, 400, None, 400, 400]
+    assert results[5]['result']['hex'] == '0x0031'
+
+@pytest.mark.parametrize("data", [
+    {'m': 8, 'bits': 16, 'type': 'hex'},
+    {'m': 8, 'bits': 16, 'type': 'hex', 'operations': []},
+    {'m': 0, 'bits': 16, 'type': 'hex', 'operations': [{'op': 'add', 'operands': ['01', '02']}]},
+    {'m': 8, 'bits': 16, 'type': 'oct', 'operations': [{'op': 'add', 'operands': ['01', '02']}]},
+])
+def test_batch_endpoint_failure(client, data):
+    response = client.post('/batch', json=data)
+    assert response.status_code == 400
+    data = json.loads(response.data)
+    assert 'error' in data
+
+def test_reed_solomon_endpoints(client):
+    payload = bytes(range(256)) * 8
+    response = client.post('/reed-solomon/encode?m=8&n=255&k=223', data=payload,
+                           content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/octet-stream'
+    encoded = bytearray(response.data)
+    assert len(encoded) == len(payload) + 10 * 32
+    encoded[5] ^= 0x42
+    encoded[300] ^= 0x17
+    response = client.post('/reed-solomon/decode?m=8&n=255&k=223', data=bytes(encoded),
+                           content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.data == payload
+
+@pytest.mark.parametrize("endpoint, data, expected_status", [
+    ('/reed-solomon/encode?m=8&n=255', b'abc', 400),
+    ('/reed-solomon/encode?m=12&n=255&k=223', b'abc', 400),
+    ('/reed-solomon/encode?m=8&n=300&k=223', b'abc', 400),
+    ('/reed-solomon/encode?m=16&n=65535&k=1', b'abc', 400),
+    ('/reed-solomon/encode?m=16&n=4000&k=1000', b'abc', 400),
+    ('/reed-solomon/encode?m=16&n=5000&k=4900', b'abc', 400),
+    ('/reed-solomon/encode?m=16&n=255&k=223', b'abc', 405),
+    ('/reed-solomon/decode?m=8&n=20&k=10', bytes(20), 200),
+    ('/reed-solomon/decode?m=8&n=20&k=10', b'\x01' * 20, 405),
+])
+def test_reed_solomon_endpoints_failure(client, endpoint, data, expected_status):
+    response = client.post(endpoint, data=data, content_type='application/octet-stream')
+    assert response.status_code == expected_status
+    if expected_status != 200:
+        assert 'error' in json.loads(response.data)
+
+def test_stream_endpoint(client):
+    lines = [
+        {'op': 'add', 'm': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B'},
+        {'op': 'divide', 'm': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '0000'},
+        {'op': 'invert', 'm': 8, 'bits': 16, 'type': 'bin', 'bin': '0000000000011010'},
+        {'op': 'power', 'm': 8, 'bits': 16, 'type': 'hex', 'hex': '001A', 'exponent': 3},
+        {'op': 'invert', 'm': 8, 'bits': 16, 'type': 'hex', 'hex': '0000'},
+        {'op': 'multiply', 'm': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A'},
+        {'op': 'cube', 'm': 8, 'bits': 16, 'type': 'hex', 'hex': '001A'},
+    ]
+    body = '\n'.join(json.dumps(line) for line in lines) + '\n\nnot json\n'
+    response = client.post('/stream', data=body, content_type='application/x-ndjson')
+    assert response.status_code == 200
+    assert response.mimetype == 'application/x-ndjson'
+    results = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert len(results) == 8
+    assert results[0]['result']['hex'] == '0x0031'
+    assert results[2]['result']['hex'] == '0x00FD'
+    assert results[3]['result']['hex'] == '0x00F7'
+    assert [r.get('status') for r in results] == [None, 404, None, None, 405, 400, 400, 400]
+
+def test_stream_endpoint_skips_oversized_lines(client, monkeypatch):
+    monkeypatch.setattr('src.controllers.NDJSON_MAX_LINE_BYTES', 100)
+    body = json.dumps({'op': 'add', 'm': 8, 'bits': 16, 'type': 'hex', 'hex1': '1A', 'hex2': '2B' * 60}) + '\n'
+    body += json.dumps({'op': 'modulo', 'm': 8, 'bits': 16, 'type': 'hex', 'hex': '011A'})
+    response = client.post('/stream', data=body, content_type='application/x-ndjson')
+    results = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert results[0]['status'] == 400
+    assert results[1]['result']['hex'] == '0x0001'
+
+def test_cache_endpoints(client, enabled_result_cache):
+    pin = {'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert', 'operands': ['001A']}
+    response = client.post('/cache/pin', json=pin)
+    assert response.status_code == 200
+    data = json.loads(response.data)
+    assert data['result']['hex'] == '0x00FD' and data['pinned'] == 1
+    client.post('/invert', json={'m': 8, 'bits': 16, 'type': 'hex', 'hex': '001A'})
+    response = client.get('/cache/stats')
+    assert response.status_code == 200
+    stats = json.loads(response.data)
+    assert stats['results']['hits'] >= 1
+    assert {'hits', 'misses', 'evictions'} <= set(stats['fields'])
+
+    response = client.post('/cache/unpin', json=pin)
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'unpinned': True, 'pinned': 0}
+    assert json.loads(client.post('/cache/unpin', json=pin).data)['unpinned'] is False
+    assert client.post('/cache/unpin', json={'m': 8}).status_code == 400
+
+    client.post('/cache/pin', json=pin)
+    response = client.post('/cache/clear')
+    assert response.status_code == 200
+    assert json.loads(response.data)['results']['pinned'] == 0 and len(result_cache) == 0
+
+def test_cache_pin_is_capped(client, enabled_result_cache):
+    enabled_result_cache.max_pinned = 1
+    pin = {'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert', 'operands': ['0003']}
+    assert client.post('/cache/pin', json=pin).status_code == 200
+    assert client.post('/cache/pin', json=pin).status_code == 200
+    response = client.post('/cache/pin', json=dict(pin, operands=['0005']))
+    assert response.status_code == 409
+    assert 'maximum' in json.loads(response.data)['error']
+
+def test_cache_pin_output_encoding(client, enabled_result_cache):
+    pin = {'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert', 'operands': ['001A'], 'output': 'int'}
+    response = client.post('/cache/pin', json=pin)
+    assert response.status_code == 200
+    assert json.loads(response.data)['result'] == {'int': 0xFD}
+    assert client.post('/cache/pin', json=dict(pin, output='oct')).status_code == 400
+
+def test_cache_pin_needs_an_enabled_cache(client, enabled_result_cache):
+    enabled_result_cache.resize(0)
+    response = client.post('/cache/pin', json={'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert', 'operands': ['0003']})
+    assert response.status_code == 409
+    assert not result_cache.enabled and result_cache.stats()['pinned'] == 0
+
+@pytest.mark.parametrize("data, expected_status", [
+    ({'m': 8, 'bits': 16, 'type': 'hex', 'op': 'power', 'operands': ['001A']}, 400),
+    ({'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert'}, 400),
+    ({'m': 8, 'bits': 16, 'type': 'hex', 'op': 'invert', 'operands': ['0000']}, 405),
+    ({'m': 8, 'bits': 16, 'type': 'hex', 'op': 'divide', 'operands': ['001A', '0000']}, 404),
+])
+def test_cache_pin_endpoint_failure(client, data, expected_status):
+    response = client.post('/cache/pin', json=data)
+    assert response.status_code == expected_status
+    assert 'error' in json.loads(response.data)
+
+def test_metrics_endpoint(client):
+    client.post('/multiply', json={'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B'})
+    client.post('/multiply', json={'m': 8, 'bits': 16, 'type': 'hex'})
+    client.post('/invert', json={'m': 8, 'bits': 16, 'type': 'hex', 'hex': '0000'})
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    text = response.data.decode()
+    assert 'gf_requests_total{operation="multiply",status="200"}' in text
+    assert 'gf_request_errors_total{operation="multiply",status="400"}' in text
+    assert 'gf_request_errors_total{operation="invert",status="405"}' in text
+    assert 'gf_request_duration_seconds_count{operation="multiply",m_bucket="1-8"}' in text
+    for phase in ('validation', 'compute', 'serialization'):
+        assert f'gf_request_phase_duration_seconds_count{{operation="multiply",phase="{phase}"}}' in text
+    assert 'gf_payload_size_bytes_count{operation="multiply",direction="request"}' in text
+
+def test_offload_timeout_returns_504(client, monkeypatch):
+    from src.controllers import offload_pool
+    from src.offload import OffloadTimeoutError
+
+    def run(method, *args):
+        raise OffloadTimeoutError(f"{method} did not finish within 0.01 seconds")
+    monkeypatch.setattr(offload_pool, 'workers', 1)
+    monkeypatch.setattr(offload_pool, 'min_m', {'invert': 2})
+    monkeypatch.setattr(offload_pool, 'run', run)
+    response = client.post('/invert', json={'m': 8, 'bits': 16, 'type': 'hex', 'hex': '0037'})
+    assert response.status_code == 504
+    assert 'did not finish' in json.loads(response.data)['error']
+    response = client.post('/add', json={'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B'})
+    assert response.status_code == 200
+
+def test_offload_timeout_in_batch_and_pin_returns_504(client, monkeypatch, enabled_result_cache):
+    from src.controllers import offload_pool
+    from src.offload import OffloadTimeoutError
+
+    def run(method, *args):
+        raise OffloadTimeoutError(f"{method} did not finish within 0.01 seconds")
+    monkeypatch.setattr(offload_pool, 'workers', 1)
+    monkeypatch.setattr(offload_pool, 'min_m', {'modulo': 2})
+    monkeypatch.setattr(offload_pool, 'run', run)
+    response = client.post('/batch', json={'m': 8, 'bits': 16, 'type': 'hex', 'operations': [
+        {'op': 'add', 'operands': ['001A', '002B']},
+        {'op': 'modulo', 'operands': ['011A']},
+    ]})
+    assert response.status_code == 504
+    assert 'did not finish' in json.loads(response.data)['error']
+    response = client.post('/cache/pin', json={'m': 8, 'bits': 16, 'type': 'hex', 'op': 'modulo', 'operands': ['011A']})
+    assert response.status_code == 504
+    assert enabled_result_cache.stats()['pinned'] == 0
+
+def test_binary_endpoint(client):
+    from src import wire
+    body = wire.HEADER.pack(wire.MAGIC, 1, wire.WIRE_OPERATIONS['multiply'], 0, 8, 1, 2) + bytes([0x1A, 0x2B, 0x1A, 0])
+    response = client.post('/binary', data=body, content_type='application/octet-stream')
+    assert response.status_code == 200
+    assert response.content_type == 'application/octet-stream'
+    assert response.data == body[:16] + bytes([0x93, 0, 0, 0])
+    response = client.post('/binary', data=body[:-1], content_type='application/octet-stream')
+    assert response.status_code == 400
+    assert 'payload bytes' in json.loads(response.data)['error']
+
+def test_binary_endpoint_rejects_oversized_bodies(client, monkeypatch):
+    from src import wire
+    monkeypatch.setattr(wire, 'MAX_MESSAGE_BYTES', 20)
+    body = wire.HEADER.pack(wire.MAGIC, 1, wire.WIRE_OPERATIONS['add'], 0, 8, 1, 3) + bytes(6)
+    response = client.post('/binary', data=body, content_type='application/octet-stream')
+    assert response.status_code == 413
+    response = client.post('/binary', data=body[:20], content_type='application/octet-stream')
+    assert response.status_code == 400
+
+@pytest.mark.parametrize("output, expected", [
+    ('hex', {'hex': '0x0093'}),
+    ('bin', {'bin': '0b0000000010010011'}),
+    ('int', {'int': 0x93}),
+    ('bytes', {'bytes': 'AJM='}),
+])
+def test_output_encodings(client, output, expected):
+    data = {'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B', 'output': output}
+    response = client.post('/multiply', json=data)
+    assert response.status_code == 200
+    assert json.loads(response.data) == {'result': expected}
+    response = client.post('/batch', json={'m': 8, 'bits': 16, 'type': 'hex', 'output': output, 'operations': [
+        {'op': 'multiply', 'operands': ['001A', '002B']}, {'op': 'divide', 'operands': ['001A', '0000']}]})
+    assert response.status_code == 200
+    results = json.loads(response.data)['results']
+    assert results[0] == {'result': expected}
+    assert results[1]['status'] == 404
+
+def test_output_encoding_is_validated(client):
+    data = {'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '001A', 'hex2': '002B', 'output': 'oct'}
+    response = client.post('/multiply', json=data)
+    assert response.status_code == 400
+    assert 'output' in json.loads(response.data)['error']
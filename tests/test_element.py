@@ -0,0 +1,87 @@
+import pickle
+import pytest
+from array import array
+from src.element import GF2mElement, get_context
+from src.services import PolyServices
+
+
+@pytest.mark.parametrize("m", [8, 16, 64, 163, 571])
+def test_operators_match_services(m):
+    service = PolyServices()
+    x, y = (0x9E3779B97F4A7C15 << 3) % (1 << m) | 1, (0xC2B2AE3D27D4EB4F * 5) % (1 << m) | 2
+    a, b = GF2mElement(x, m), GF2mElement(y, m)
+    assert (a + b).value == (a - b).value == x ^ y
+    assert (a * b).value == service.multiply_in_gf(m, x, y)
+    assert (a * a).value == (a ** 2).value == service.square_in_gf(m, x)
+    assert (a / b).value == service.divide_in_gf(m, x, y)
+    assert (~a).value == service.invert_in_gf(m, x)
+    assert (a ** 1000).value == service.pow_in_gf(m, x, 1000)
+    assert (a ** -3).value == service.pow_in_gf(m, x, -3)
+    assert a * ~a == GF2mElement(1, m)
+    assert -a is a
+
+def test_zero_divisors():
+    zero, one = GF2mElement(0, 163), GF2mElement(1, 163)
+    with pytest.raises(ZeroDivisionError):
+        one / zero
+    with pytest.raises(ValueError):
+        ~zero
+    with pytest.raises(ValueError):
+        zero ** -1
+    assert (zero ** 0).value == 1
+    with pytest.raises(ZeroDivisionError):
+        GF2mElement(1, 8) / GF2mElement(0, 8)
+
+def test_values_are_reduced():
+    service = PolyServices()
+    assert GF2mElement(0x1FF, 8).value == service.modulo_in_gf(8, 0x1FF)
+    with pytest.raises(ValueError):
+        GF2mElement(-1, 8)
+
+def test_equality_and_hash():
+    a = GF2mElement(0x57, 8)
+    assert a == GF2mElement(0x57, 8) and hash(a) == hash(GF2mElement(0x57, 8))
+    assert a != GF2mElement(0x57, 16)
+    assert a != 0x57
+    assert len({a, GF2mElement(0x57, 8), GF2mElement(0x58, 8)}) == 2
+
+def test_mixed_fields_and_types_are_rejected():
+    with pytest.raises(ValueError):
+        GF2mElement(3, 8) * GF2mElement(3, 16)
+    with pytest.raises(TypeError):
+        GF2mElement(3, 8) + 3
+
+def test_immutable_and_slotted():
+    a = GF2mElement(5, 8)
+    with pytest.raises(AttributeError):
+        a.value = 6
+    assert not hasattr(a, '__dict__')
+
+def test_context_is_shared():
+    assert GF2mElement(1, 64).context is GF2mElement(2, 64).context is get_context(64)
+
+def test_pickle_round_trip():
+    a = GF2mElement(0x1234, 163)
+    assert pickle.loads(pickle.dumps(a)) == a
+
+@pytest.mark.parametrize("m, width", [(8, 1), (16, 2), (64, 8), (163, 21)])
+@pytest.mark.parametrize("byteorder", ['little', 'big'])
+def test_from_bytes(m, width, byteorder):
+    values = [(i * 0x9E3779B97F4A7C15) % (1 << m) for i in range(20)]
+    data = b''.join(value.to_bytes(width, byteorder) for value in values)
+    assert [int(element) for element in GF2mElement.from_bytes(data, m, byteorder=byteorder)] == values
+
+def test_from_bytes_rejects_partial_elements():
+    with pytest.raises(ValueError):
+        GF2mElement.from_bytes(b'\x01\x02\x03', 16)
+    assert GF2mElement.from_bytes(b'\x01\x02\x03', 8, width=3) == [GF2mElement(0x030201, 8)]
+
+def test_from_hex_and_arrays():
+    assert GF2mElement.from_hex('57 0x83\n1b', 8) == [GF2mElement(v, 8) for v in (0x57, 0x83, 0x1B)]
+    assert GF2mElement.from_hex(['FF'], 8) == [GF2mElement(0xFF, 8)]
+    assert GF2mElement.from_array(array('H', [1, 2]), 16) == GF2mElement.from_array([1, 2], 16)
+
+def test_from_numpy_array():
+    np = pytest.importorskip('numpy')
+    elements = GF2mElement.from_array(np.arange(10, dtype=np.uint16), 16)
+    assert [int(element) for element in elements] == list(range(10))
@@ -0,0 +1,54 @@
+import pytest
+from src.fields import FieldCache, GF2mField, field_cache, get_field
+from src.utils import get_irreducible_polynomial
+
+
+def test_field_context_holds_precomputed_state():
+    field = GF2mField(8, 283)
+    assert field.degree == 8
+    assert field.mask == 0xFF
+    assert field.high_bit == 0x80
+    assert field.log_tables is field.log_tables
+
+def test_get_field_uses_shipped_modulus():
+    field = get_field(16)
+    assert field.modulus == get_irreducible_polynomial(16)
+    assert get_field(16) is field
+
+def test_cache_counts_hits_and_misses():
+    cache = FieldCache(maxsize=4)
+    cache.get(8)
+    cache.get(8)
+    cache.get(16)
+    assert cache.stats() == {'size': 2, 'maxsize': 4, 'hits': 1, 'misses': 2, 'evictions': 0}
+
+def test_cache_evicts_least_recently_used():
+    cache = FieldCache(maxsize=2)
+    first = cache.get(8)
+    cache.get(16)
+    cache.get(8)
+    cache.get(32)
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    assert cache.get(8) is first
+    assert cache.stats()['misses'] == 3
+
+def test_cache_keys_on_modulus():
+    cache = FieldCache(maxsize=4)
+    assert cache.get(8, 283) is not cache.get(8, 285)
+
+def test_resize_shrinks_cache():
+    cache = FieldCache(maxsize=8)
+    for m in range(2, 10):
+        cache.get(m)
+    cache.resize(3)
+    assert len(cache) == 3
+    assert cache.evictions == 5
+
+@pytest.mark.parametrize("m", [8, 163])
+def test_services_reuse_cached_field(m):
+    from src.services import PolyServices
+    get_field(m)
+    hits = field_cache.hits
+    PolyServices.multiply_in_gf(m, 3, 5)
+    assert field_cache.hits == hits + 1
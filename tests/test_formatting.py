@@ -0,0 +1,47 @@
+import base64
+import json
+import pytest
+from src.formatting import ResultFormatter, get_formatter
+from src.utils import int_to_bin, int_to_hex, int_to_hex_bin
+
+NUMBERS = [0, 1, 0x1A, 0xFFFF, (1 << 255) | 3, 1 << 300]
+
+
+@pytest.mark.parametrize("bits", [16, 32, 64, 128, 256])
+def test_default_output_matches_int_to_hex_bin(bits):
+    formatter = get_formatter(bits)
+    for number in NUMBERS:
+        hex_result, bin_result = int_to_hex_bin(number, bits)
+        assert formatter(number) == {'hex': hex_result, 'bin': bin_result}
+
+def test_padding():
+    assert int_to_hex(0x1A, 16) == '0x001A'
+    assert int_to_bin(5, 16) == '0b0000000000000101'
+    assert int_to_hex(0x12345, 16) == '0x12345'
+
+@pytest.mark.parametrize("output, expected", [
+    ('hex', {'hex': '0x001A'}),
+    ('bin', {'bin': '0b0000000000011010'}),
+    ('int', {'int': 26}),
+    ('bytes', {'bytes': base64.b64encode(b'\x00\x1a').decode()}),
+])
+def test_single_encodings(output, expected):
+    assert get_formatter(16, output)(0x1A) == expected
+
+@pytest.mark.parametrize("output", ['hex_bin', 'hex', 'bin', 'int', 'bytes'])
+def test_json_fragments_match_json_dumps(output):
+    formatter = get_formatter(256, output)
+    for number in NUMBERS:
+        assert json.loads(formatter.json(number)) == formatter(number)
+
+def test_batch_body():
+    body = get_formatter(16, 'hex').batch_body([0x1A, {'error': 'Division by zero in GF(2^8)', 'status': 404}])
+    assert json.loads(body) == {'results': [{'result': {'hex': '0x001A'}},
+                                            {'error': 'Division by zero in GF(2^8)', 'status': 404}]}
+
+def test_bytes_grow_past_bits():
+    assert base64.b64decode(get_formatter(16, 'bytes')(1 << 20)['bytes']) == (1 << 20).to_bytes(3, 'big')
+
+def test_unknown_output():
+    with pytest.raises(ValueError):
+        ResultFormatter(16, 'oct')
@@ -0,0 +1,53 @@
+import random
+import pytest
+from src import inversion
+from src.fields import get_field
+from src.inversion import invert_itoh_tsujii, multi_square
+from src.reduction import multi_square_poly, reduce_poly, square_poly
+from src.services import PolyServices
+from src.squaring import spread_bits
+
+
+def test_spread_bits_squares_over_gf2():
+    assert spread_bits(0) == 0
+    assert spread_bits(0b1011) == 0b1000101
+    poly = random.Random(0).getrandbits(1000)
+    assert spread_bits(poly) == int('0'.join(bin(poly)[2:]), 2)
+
+@pytest.mark.parametrize("m", [2, 8, 17, 64, 163, 233, 571])
+def test_itoh_tsujii_matches_euclid(m):
+    field = get_field(m)
+    rng = random.Random(m)
+    for _ in range(5):
+        poly = rng.getrandbits(m) or 1
+        expected = reduce_poly(field, PolyServices._invert_euclid(poly, field.modulus))
+        assert invert_itoh_tsujii(field, poly) == expected
+
+@pytest.mark.parametrize("count", [1, 16, 35])
+def test_multi_square_table_matches_repeated_squaring(count):
+    field = get_field(163)
+    poly = random.Random(count).getrandbits(163)
+    assert multi_square(field, poly, count) == multi_square_poly(field, poly, count)
+    assert square_poly(field, poly) == PolyServices._multiply_loop(field, poly, poly)
+
+def test_chain_and_tables_are_cached_per_field():
+    field = get_field(283)
+    invert_itoh_tsujii(field, 12345)
+    assert field.precomputed['itoh_tsujii_chain'] == [0, 0, 0, 1, 1, 0, 1, 0]
+    assert set(field.precomputed['multi_square_tables']) == {17, 35, 70, 141}
+
+def test_itoh_tsujii_rejects_zero():
+    with pytest.raises(ValueError):
+        invert_itoh_tsujii(get_field(163), 0)
+
+def test_service_selects_inversion_by_threshold(monkeypatch):
+    service = PolyServices()
+    field = get_field(163)
+    poly = random.Random(1).getrandbits(163)
+    expected = service.invert_in_gf(163, poly)
+    field.precomputed.pop('itoh_tsujii_chain', None)
+    monkeypatch.setattr(inversion, 'itoh_tsujii_min_m', 100)
+    assert inversion.use_itoh_tsujii(163)
+    assert service.invert_in_gf(163, poly) == expected
+    assert service.divide_in_gf(163, poly, poly) == 1
+    assert 'itoh_tsujii_chain' in field.precomputed
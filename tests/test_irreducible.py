@@ -0,0 +1,97 @@
+import json
+import pytest
+from src.constants import irreducible_polynomials_map
+from src.irreducible import (IrreducibleCache, find_irreducible, get_irreducible_polynomial, is_irreducible,
+                             is_primitive, rejected_degrees, verify_table)
+
+
+def from_exponents(*exponents):
+    return sum(1 << exponent for exponent in exponents)
+
+@pytest.mark.parametrize("poly, expected", [
+    (0b111, True),
+    (0b101, False),
+    (283, True),
+    (from_exponents(163, 7, 6, 3, 0), True),
+    (from_exponents(233, 74, 0), True),
+    (from_exponents(8, 4, 3, 2, 0), True),
+    (from_exponents(8, 1, 0), False),
+    (from_exponents(64, 4, 3, 1, 0), True),
+    (from_exponents(64, 1, 0), False),
+])
+def test_is_irreducible(poly, expected):
+    assert is_irreducible(poly) == expected
+
+def test_is_primitive():
+    assert is_primitive(from_exponents(8, 4, 3, 2, 0))
+    assert not is_primitive(283)
+
+@pytest.mark.parametrize("m, exponents", [
+    (1, (1, 0)),
+    (2, (2, 1, 0)),
+    (8, (8, 4, 3, 2, 0)),
+    (18, (18, 7, 0)),
+    (64, (64, 4, 3, 1, 0)),
+    (100, (100, 15, 0)),
+])
+def test_find_irreducible_lowest_weight(m, exponents):
+    assert find_irreducible(m) == from_exponents(*exponents)
+
+def test_shipped_table_is_verified():
+    verified, rejected = verify_table({8: 283, 18: from_exponents(18, 1, 0), 20: 0b11})
+    assert verified == {8: 283}
+    assert rejected == [18, 20]
+    assert rejected_degrees == []
+
+@pytest.mark.parametrize("m", [18, 32, 61])
+def test_shipped_moduli_are_irreducible(m):
+    poly = get_irreducible_polynomial(m)
+    assert poly == irreducible_polynomials_map[m]
+    assert poly.bit_length() - 1 == m
+    assert is_irreducible(poly)
+
+def test_cache_persists_found_moduli(tmp_path):
+    path = tmp_path / 'irreducible.json'
+    cache = IrreducibleCache(str(path))
+    assert cache.get(100) == from_exponents(100, 15, 0)
+    stored = json.loads(path.read_text())
+    assert stored['polynomials'] == {'100': hex(from_exponents(100, 15, 0))}
+
+    path.write_text(json.dumps({'version': 1, 'polynomials': {'100': hex(from_exponents(100, 15, 0)), '7': '0x83'}}))
+    assert IrreducibleCache(str(path)).get(7) == 0x83
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    path = tmp_path / 'irreducible.json'
+    path.write_text('not json')
+    assert IrreducibleCache(str(path)).get(18) == from_exponents(18, 7, 0)
+    assert json.loads(path.read_text())['polynomials'] == {'18': hex(from_exponents(18, 7, 0))}
+
+def test_cache_search_does_not_block_lookups(tmp_path, monkeypatch):
+    import threading
+    from src import irreducible
+    started, release = threading.Event(), threading.Event()
+    searches = []
+
+    def slow_find(m):
+        searches.append(m)
+        started.set()
+        release.wait(5)
+        return find_irreducible(m)
+    monkeypatch.setattr(irreducible, 'find_irreducible', slow_find)
+    path = tmp_path / 'irreducible.json'
+    path.write_text(json.dumps({'version': 1, 'polynomials': {'7': '0x83'}}))
+    cache = IrreducibleCache(str(path))
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get(18))) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    assert started.wait(5)
+    lookup = threading.Thread(target=lambda: results.append(cache.get(7)))
+    lookup.start()
+    lookup.join(1)
+    assert results == [0x83]
+    release.set()
+    for thread in threads:
+        thread.join(5)
+    assert results == [0x83] + [from_exponents(18, 7, 0)] * 2
+    assert searches == [18]
@@ -0,0 +1,48 @@
+import logging
+import pytest
+from src.logger import DeferredQueueHandler, SamplingFilter, configure_logging, logger, operation_logger, shutdown_logging
+
+
+@pytest.fixture
+def reconfigure():
+    yield configure_logging
+    configure_logging()
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord('test', logging.DEBUG, __file__, 0, message, (), None)
+
+@pytest.mark.parametrize("rate, kept", [(1.0, 100), (0.25, 25), (0.1, 10), (0.0, 0)])
+def test_sampling_filter_keeps_an_even_fraction(rate, kept):
+    sampler = SamplingFilter(rate)
+    decisions = [sampler.filter(_record('x')) for _ in range(100)]
+    assert sum(decisions) == kept
+    if 0 < kept < 100:
+        assert decisions[int(1 / rate) - 1]
+
+def test_queue_handler_defers_formatting():
+    record = logging.LogRecord('test', logging.INFO, __file__, 0, 'value %#x', (255,), None)
+    handler = DeferredQueueHandler(None)
+    assert handler.prepare(record) is record
+    assert record.msg == 'value %#x' and record.args == (255,)
+
+def test_configure_logging_writes_through_listener(reconfigure, tmp_path):
+    log_file = tmp_path / 'gf.log'
+    reconfigure(level='debug', log_file=str(log_file), sample_rate=0.5)
+    assert logging.getLogger().level == logging.DEBUG
+    for i in range(4):
+        operation_logger.debug("operation %d", i)
+    logger.info("kept %s", "always")
+    shutdown_logging()
+
+    lines = log_file.read_text().splitlines()
+    assert [line.rsplit(' - ', 1)[1] for line in lines] == ['operation 1', 'operation 3', 'kept always']
+    assert sum(isinstance(h, DeferredQueueHandler) for h in logging.getLogger().handlers) == 1
+
+def test_level_gates_operation_logs(reconfigure, tmp_path):
+    log_file = tmp_path / 'gf.log'
+    reconfigure(level='INFO', log_file=str(log_file), sample_rate=1.0)
+    assert not operation_logger.isEnabledFor(logging.DEBUG)
+    operation_logger.debug("hidden %s", 1)
+    logger.warning("shown")
+    shutdown_logging()
+    assert log_file.read_text().splitlines()[0].endswith('shown')
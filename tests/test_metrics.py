@@ -0,0 +1,64 @@
+import threading
+import pytest
+from src.metrics import MetricsRegistry, RequestMetrics, m_bucket, phase_duration, requests_total
+
+
+def test_counter_renders_labelled_samples():
+    registry = MetricsRegistry()
+    counter = registry.counter('test_total', 'Test counter.', ('operation',))
+    counter.inc('add')
+    counter.inc('add', amount=2)
+    assert counter.value('add') == 3
+    lines = registry.render().splitlines()
+    assert lines == ['# HELP test_total Test counter.', '# TYPE test_total counter', 'test_total{operation="add"} 3']
+
+def test_histogram_buckets_are_cumulative():
+    registry = MetricsRegistry()
+    histogram = registry.histogram('test_seconds', 'Test histogram.', ('operation',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 2.0):
+        histogram.observe(value, 'add')
+    text = registry.render()
+    assert 'test_seconds_bucket{operation="add",le="0.1"} 2' in text
+    assert 'test_seconds_bucket{operation="add",le="1.0"} 3' in text
+    assert 'test_seconds_bucket{operation="add",le="+Inf"} 4' in text
+    assert 'test_seconds_sum{operation="add"} 2.65' in text
+    assert 'test_seconds_count{operation="add"} 4' in text
+
+def test_label_values_are_escaped():
+    registry = MetricsRegistry()
+    registry.counter('test_total', 'Test counter.', ('path',)).inc('a"b\\c')
+    assert 'test_total{path="a\\"b\\\\c"} 1' in registry.render()
+
+def test_duplicate_metric_names_are_rejected():
+    registry = MetricsRegistry()
+    registry.counter('test_total', 'Test counter.')
+    with pytest.raises(ValueError):
+        registry.histogram('test_total', 'Test histogram.')
+
+def test_counter_is_thread_safe():
+    counter = MetricsRegistry().counter('test_total', 'Test counter.')
+
+    def work():
+        for _ in range(10000):
+            counter.inc()
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert counter.value() == 80000
+
+@pytest.mark.parametrize("m, expected", [(None, 'none'), (1, '1-8'), (8, '1-8'), (9, '9-16'), (163, '65-256'), (8192, '1025-8192')])
+def test_m_bucket(m, expected):
+    assert m_bucket(m) == expected
+
+def test_request_metrics_records_phases():
+    before = requests_total.value('unit', '200'), phase_duration.count('unit', 'serialization')
+    metrics = RequestMetrics('unit')
+    metrics.validation = 0.001
+    metrics.compute = 0.002
+    metrics.computed_at = metrics.start
+    metrics.finish(200, 10, 20)
+    assert metrics.finished
+    assert requests_total.value('unit', '200') == before[0] + 1
+    assert phase_duration.count('unit', 'serialization') == before[1] + 1
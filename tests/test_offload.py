@@ -0,0 +1,56 @@
+import pytest
+from src.offload import OffloadPool, OffloadTimeoutError
+from src.result_cache import ResultCache
+from src.services import CachedPolyServices, PolyServices
+
+
+@pytest.fixture(scope='module')
+def pool():
+    pool = OffloadPool(1, min_m={'invert': 2, 'divide': 2, 'power': 2})
+    yield pool
+    pool.shutdown()
+
+def test_small_fields_stay_inline():
+    pool = OffloadPool(2)
+    assert pool.should_offload('invert', 8192)
+    assert not pool.should_offload('invert', 8)
+    assert not pool.should_offload('add', 8192)
+    assert not OffloadPool(0).should_offload('invert', 8192)
+
+def test_offloaded_results_match_inline(pool):
+    service = CachedPolyServices(ResultCache(0), pool)
+    inline = PolyServices()
+    poly = (1 << 570) | 0x1234567
+    assert service.invert_in_gf(571, poly) == inline.invert_in_gf(571, poly)
+    assert service.pow_in_gf(163, poly >> 408, 12345) == inline.pow_in_gf(163, poly >> 408, 12345)
+    assert service.multiply_in_gf(8, 0x1A, 0x2B) == 0x93
+    assert pool.stats()['submitted'] == 2
+
+def test_offloaded_errors_propagate(pool):
+    service = CachedPolyServices(ResultCache(0), pool)
+    with pytest.raises(ValueError):
+        service.invert_in_gf(8, 0)
+    with pytest.raises(ZeroDivisionError):
+        service.divide_in_gf(8, 0x1A, 0)
+
+def test_timeout_restarts_the_pool(pool):
+    service = CachedPolyServices(ResultCache(0), pool)
+    service.invert_in_gf(8, 3)
+    pool.timeout = 0.01
+    try:
+        with pytest.raises(OffloadTimeoutError):
+            service.pow_in_gf(8192, (1 << 8191) | 3, (1 << 2048) - 1)
+    finally:
+        pool.timeout = 10.0
+    assert pool.stats()['restarts'] >= 1
+    assert service.invert_in_gf(8, 0x1A) == 0xFD
+
+def test_batch_misses_are_offloaded_together(pool):
+    service = CachedPolyServices(ResultCache(1 << 20), pool)
+    inline = PolyServices()
+    poly = (1 << 570) | 0x1234567
+    operations = [('invert', [poly]), ('invert', [poly + 2]), ('add', [1, 2])]
+    submitted = pool.stats()['submitted']
+    assert service.batch_in_gf(571, operations) == inline.batch_in_gf(571, operations)
+    assert service.batch_in_gf(571, operations) == inline.batch_in_gf(571, operations)
+    assert pool.stats()['submitted'] == submitted + 1
@@ -0,0 +1,56 @@
+import random
+import pytest
+from src.constants import standard_sparse_polynomials
+from src.fields import GF2mField, get_field
+from src.reduction import reduce_poly, reduce_sparse, reduce_windowed
+from src.services import PolyServices
+
+
+def reduce_reference(modulus, poly):
+    degree = modulus.bit_length() - 1
+    while poly.bit_length() > degree:
+        poly ^= modulus << (poly.bit_length() - 1 - degree)
+    return poly
+
+@pytest.mark.parametrize("m", sorted(standard_sparse_polynomials))
+def test_standard_moduli_are_sparse(m):
+    field = get_field(m)
+    assert field.degree == m
+    assert field.taps == standard_sparse_polynomials[m][1:]
+
+@pytest.mark.parametrize("m", [2, 8, 16, 163, 233, 239, 283, 409, 571])
+def test_sparse_matches_reference(m):
+    field = get_field(m)
+    rng = random.Random(m)
+    for bits in (m, m + 1, 2 * m - 1, 3 * m):
+        poly = rng.getrandbits(bits)
+        assert reduce_sparse(field, poly) == reduce_reference(field.modulus, poly)
+
+@pytest.mark.parametrize("m", [8, 163, 571])
+def test_windowed_matches_sparse(m):
+    field = GF2mField(m, get_field(m).modulus)
+    rng = random.Random(m)
+    for _ in range(20):
+        poly = rng.getrandbits(2 * m - 1)
+        assert reduce_windowed(field, poly) == reduce_sparse(field, poly)
+
+def test_dense_modulus_uses_window_table():
+    field = GF2mField(64, 0x17FFFFFFFFFFFFF97)
+    assert field.taps is None
+    poly = random.Random(0).getrandbits(127)
+    assert reduce_poly(field, poly) == reduce_reference(field.reduction_modulus, poly)
+    assert 'reduction_table' in field.precomputed
+
+@pytest.mark.parametrize("m", [163, 283, 571])
+def test_services_share_reduction(m):
+    service = PolyServices()
+    field = get_field(m)
+    rng = random.Random(m)
+    poly1, poly2 = rng.getrandbits(m), rng.getrandbits(m)
+    product = service.multiply_in_gf(m, poly1, poly2)
+    assert product == PolyServices._multiply_loop(field, poly1, poly2)
+    assert service.modulo_in_gf(m, poly1 << m) == reduce_reference(field.modulus, poly1 << m)
+    assert service.multiply_in_gf(m, poly1, service.invert_in_gf(m, poly1)) == 1
+
+def test_modulo_fully_reduces_degree_m():
+    assert PolyServices.modulo_in_gf(8, 0x100) == 0x1B
@@ -0,0 +1,88 @@
+import random
+import pytest
+from src.fields import get_field
+from src.reed_solomon import ReedSolomonError, get_codec
+
+
+def _corrupt(codec, encoded: bytes, count: int, rng: random.Random) -> bytes:
+    corrupted = bytearray(encoded)
+    block_bytes = codec.n * codec.symbol_bytes
+    for start in range(0, len(corrupted), block_bytes):
+        length = min(block_bytes, len(corrupted) - start) // codec.symbol_bytes
+        for position in rng.sample(range(length), min(count, length)):
+            corrupted[start + position * codec.symbol_bytes] ^= rng.randrange(1, 256)
+    return bytes(corrupted)
+
+@pytest.mark.parametrize("m, n, k", [(8, 255, 223), (8, 15, 9), (16, 300, 260)])
+def test_round_trip_corrects_up_to_half_the_parity(m, n, k):
+    rng = random.Random(n)
+    codec = get_codec(m, n, k)
+    data = rng.randbytes(codec.symbol_bytes * (3 * k + 5))
+    encoded = codec.encode(data)
+    assert len(encoded) == len(data) + 4 * (n - k) * codec.symbol_bytes
+    assert encoded[:k * codec.symbol_bytes] == data[:k * codec.symbol_bytes]
+    assert codec.decode(encoded) == data
+    assert codec.decode(_corrupt(codec, encoded, (n - k) // 2, rng)) == data
+
+def test_decode_block_reports_corrections():
+    codec = get_codec(8, 255, 223)
+    block = codec.encode_block(bytes(range(223)))
+    corrupted = bytearray(block)
+    corrupted[0] ^= 1
+    corrupted[254] ^= 0xFF
+    assert codec.decode_block(bytes(corrupted)) == (bytes(range(223)), 2)
+
+def test_too_many_errors_raise():
+    rng = random.Random(0)
+    codec = get_codec(8, 255, 223)
+    encoded = codec.encode(rng.randbytes(223))
+    with pytest.raises(ReedSolomonError):
+        codec.decode(_corrupt(codec, encoded, 20, rng))
+
+def test_streaming_matches_whole_payload():
+    rng = random.Random(1)
+    codec = get_codec(8, 255, 223)
+    data = rng.randbytes(5000)
+    chunks = [data[i:i + 97] for i in range(0, len(data), 97)]
+    encoded_chunks = list(codec.encode_stream(iter(chunks)))
+    assert b''.join(encoded_chunks) == codec.encode(data)
+    assert all(len(chunk) == 255 for chunk in encoded_chunks[:-1])
+    encoded = b''.join(encoded_chunks)
+    decoded = codec.decode_stream(encoded[i:i + 1000] for i in range(0, len(encoded), 1000))
+    assert b''.join(decoded) == data
+
+def test_berlekamp_massey_chien_forney():
+    codec = get_codec(8, 15, 9)
+    block = bytearray(codec.encode_block(bytes(9)))
+    block[3] ^= 7
+    block[10] ^= 100
+    parity_bytes = codec.nsym
+    remainder = codec._parity(block[:-parity_bytes]) ^ int.from_bytes(block[-parity_bytes:], 'big')
+    syndromes = codec.syndromes(remainder)
+    locator = codec.berlekamp_massey(syndromes)
+    assert len(locator) == 3
+    positions = codec.chien_search(locator, 15)
+    assert sorted(positions) == [3, 10]
+    magnitudes = dict(zip(positions, codec.forney(syndromes, locator, positions, 15)))
+    assert magnitudes == {3: 7, 10: 100}
+
+@pytest.mark.parametrize("m, n, k", [(4, 15, 9), (8, 256, 200), (8, 10, 10), (16, 10, 0)])
+def test_invalid_parameters(m, n, k):
+    with pytest.raises(ValueError):
+        get_codec(m, n, k)
+
+def test_codecs_are_cached_per_field_with_lru_eviction(monkeypatch):
+    monkeypatch.setattr('src.reed_solomon.REED_SOLOMON_CODEC_CACHE_SIZE', 2)
+    first = get_codec(8, 30, 20)
+    second = get_codec(8, 31, 20)
+    assert get_codec(8, 30, 20) is first
+    get_codec(8, 32, 20)
+    assert get_codec(8, 30, 20) is first
+    assert get_codec(8, 31, 20) is not second
+    assert len(get_field(8).precomputed['reed_solomon']) == 2
+
+def test_invalid_payloads():
+    with pytest.raises(ValueError):
+        get_codec(16, 20, 10).encode(b'\x01\x02\x03')
+    with pytest.raises(ValueError):
+        get_codec(8, 20, 10).decode(bytes(30))
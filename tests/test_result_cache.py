@@ -0,0 +1,107 @@
+import pytest
+from src.result_cache import CachePinError, ResultCache
+from src.services import CachedPolyServices, PolyServices
+
+
+def test_cache_counts_hits_and_misses():
+    cache = ResultCache(max_bytes=10000)
+    assert cache.get(('multiply', 8, 2, 3)) is None
+    cache.put(('multiply', 8, 2, 3), 6)
+    assert cache.get(('multiply', 8, 2, 3)) == 6
+    stats = cache.stats()
+    assert (stats['size'], stats['hits'], stats['misses']) == (1, 1, 1)
+    assert stats['size_bytes'] == ResultCache.cost(('multiply', 8, 2, 3), 6)
+
+def test_eviction_is_size_aware():
+    small = ResultCache.cost(('multiply', 8, 1, 1), 1)
+    cache = ResultCache(max_bytes=40 * small, max_entry_bytes=4000)
+    for i in range(20):
+        cache.put(('multiply', 8, i, 1), 1)
+    large_key = ('multiply', 8192, (1 << 8191) | 1, 3)
+    cache.put(large_key, (1 << 8191) | 3)
+    # A 8192-bit entry displaces a few small ones, by cost, not the whole cache.
+    assert cache.stats()['evictions'] < 20
+    assert cache.get(large_key) is not None
+    assert cache.get(('multiply', 8, 19, 1)) == 1
+    assert cache.size_bytes <= cache.max_bytes
+
+def test_oversized_entries_are_rejected():
+    cache = ResultCache(max_bytes=6400)
+    cache.put(('multiply', 8192, 1 << 8191, 2), 1 << 8191)
+    assert len(cache) == 0 and cache.stats()['rejections'] == 1
+
+def test_ttl_expires_entries(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr('src.result_cache.time.monotonic', lambda: now[0])
+    cache = ResultCache(max_bytes=10000, ttl=5)
+    cache.put(('invert', 8, 3), 0xF6)
+    now[0] += 4
+    assert cache.get(('invert', 8, 3)) == 0xF6
+    now[0] += 2
+    assert cache.get(('invert', 8, 3)) is None
+    assert cache.stats()['expirations'] == 1 and cache.size_bytes == 0
+
+def test_pinned_entries_survive_eviction_and_clear():
+    cache = ResultCache(max_bytes=200, max_entry_bytes=200)
+    cache.pin(('invert', 8, 3), 0xF6)
+    for i in range(10):
+        cache.put(('invert', 8, 5 + i), 1)
+    cache.clear()
+    assert cache.get(('invert', 8, 3)) == 0xF6
+    assert cache.get(('invert', 8, 5)) is None
+    assert cache.unpin(('invert', 8, 3)) and not cache.unpin(('invert', 8, 3))
+    cache.pin(('invert', 8, 3), 0xF6)
+    cache.clear(pinned=True)
+    assert cache.get(('invert', 8, 3)) is None and len(cache) == 0
+
+def test_pins_are_capped_and_need_an_enabled_cache():
+    with pytest.raises(CachePinError):
+        ResultCache(max_bytes=0).pin(('invert', 8, 3), 0xF6)
+    cache = ResultCache(max_bytes=1000, max_pinned=2)
+    cache.pin(('invert', 8, 3), 0xF6)
+    cache.pin(('invert', 8, 4), 1)
+    cache.pin(('invert', 8, 4), 1)
+    with pytest.raises(CachePinError):
+        cache.pin(('invert', 8, 5), 2)
+    assert cache.stats()['pinned'] == 2 and cache.enabled
+    cache.unpin(('invert', 8, 3))
+    cache.pin(('invert', 8, 5), 2)
+
+def test_cached_services_match_and_share_commutative_entries():
+    cache = ResultCache(max_bytes=100000)
+    service = CachedPolyServices(cache)
+    plain = PolyServices()
+    assert service.multiply_in_gf(163, 5, 7 << 100) == plain.multiply_in_gf(163, 5, 7 << 100)
+    assert service.multiply_in_gf(163, 7 << 100, 5) == plain.multiply_in_gf(163, 5, 7 << 100)
+    assert cache.stats()['hits'] == 1
+    assert service.divide_in_gf(8, 0x1A, 0x2B) == plain.divide_in_gf(8, 0x1A, 0x2B)
+    assert service.pow_in_gf(8, 0x1A, -2) == plain.pow_in_gf(8, 0x1A, -2)
+    with pytest.raises(ZeroDivisionError):
+        service.divide_in_gf(8, 1, 0)
+    with pytest.raises(ValueError):
+        service.invert_in_gf(8, 0)
+
+def test_disabled_cache_stores_nothing():
+    cache = ResultCache(max_bytes=0)
+    service = CachedPolyServices(cache)
+    assert service.invert_in_gf(8, 0x1A) == 0xFD
+    with pytest.raises(CachePinError):
+        service.pin('invert', 8, [0x1A])
+    assert service.invert_in_gf(8, 0x1A) == 0xFD
+    assert not cache.enabled
+    assert cache.stats()['hits'] == 0 and cache.stats()['size'] == 0 and cache.stats()['pinned'] == 0
+
+def test_cached_services_store_only_requested_results():
+    cache = ResultCache(max_bytes=100000)
+    service = CachedPolyServices(cache)
+    plain = PolyServices()
+    poly = (1 << 160) | 0x1234567
+    assert service.divide_in_gf(163, poly, 0x2B) == plain.divide_in_gf(163, poly, 0x2B)
+    assert cache.stats()['size'] == 1 and cache.stats()['misses'] == 1
+
+    polys = [poly + i for i in range(5)]
+    assert service.invert_many_in_gf(163, polys) == plain.invert_many_in_gf(163, polys)
+    assert cache.stats()['size'] == 6 and cache.stats()['misses'] == 6
+    assert service.batch_in_gf(163, [('invert', [p]) for p in polys] + [('invert', [0])])[:5] == \
+        [plain.invert_in_gf(163, p) for p in polys]
+    assert cache.stats()['hits'] == 5 and cache.stats()['size'] == 6
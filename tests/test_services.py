@@ -0,0 +1,88 @@
+import random
+import pytest
+from src.services import PolyServices
+
+
+@pytest.fixture
+def service():
+    return PolyServices()
+
+@pytest.mark.parametrize("m", [3, 8, 163])
+def test_add_reduces_unreduced_operands(service, m):
+    poly1, poly2 = (1 << (2 * m)) | 0b101, 0b11
+    expected = service.modulo_in_gf(m, poly1 ^ poly2)
+    assert service.add_in_gf(m, poly1, poly2) == service.subtract_in_gf(m, poly1, poly2) == expected
+    assert service.add_in_gf(m, 0b101, 0b11) == 0b110
+
+@pytest.mark.parametrize("m", [8, 17, 163, 571])
+def test_invert_many_matches_invert(service, m):
+    rng = random.Random(m)
+    polys = [rng.getrandbits(m) for _ in range(50)] + [0, 1]
+    results = service.invert_many_in_gf(m, polys)
+    for poly, result in zip(polys, results):
+        if poly == 0:
+            assert isinstance(result, ValueError)
+        else:
+            assert result == service.invert_in_gf(m, poly)
+
+def test_invert_many_handles_unreduced_and_empty(service):
+    assert service.invert_many_in_gf(8, []) == []
+    assert service.invert_many_in_gf(8, [0x11A, 0x1A]) == [service.invert_in_gf(8, 0x11A), 0xFD]
+
+@pytest.mark.parametrize("m", [8, 233])
+def test_divide_many_matches_divide(service, m):
+    rng = random.Random(m)
+    dividends = [rng.getrandbits(m) for _ in range(30)]
+    divisors = [rng.getrandbits(m) for _ in range(29)] + [0]
+    results = service.divide_many_in_gf(m, dividends, divisors)
+    assert isinstance(results[-1], ZeroDivisionError)
+    assert results[:-1] == [service.divide_in_gf(m, a, b) for a, b in zip(dividends[:-1], divisors[:-1])]
+
+def test_batch_uses_bulk_inversion(service):
+    m = 283
+    rng = random.Random(0)
+    polys = [rng.getrandbits(m) for _ in range(10)]
+    operations = [('invert', [poly]) for poly in polys]
+    operations += [('divide', [polys[0], polys[1]]), ('divide', [polys[0], 0]), ('invert', [0]), ('multiply', polys[:2])]
+    results = service.batch_in_gf(m, operations)
+    assert results[:10] == [service.invert_in_gf(m, poly) for poly in polys]
+    assert results[10] == service.divide_in_gf(m, polys[0], polys[1])
+    assert isinstance(results[11], ZeroDivisionError)
+    assert isinstance(results[12], ValueError) and not isinstance(results[12], ZeroDivisionError)
+    assert results[13] == service.multiply_in_gf(m, *polys[:2])
+
+def _power_reference(service, m, poly, exponent):
+    result = 1
+    for bit in bin(exponent)[2:]:
+        result = service.multiply_in_gf(m, result, result)
+        if bit == '1':
+            result = service.multiply_in_gf(m, result, poly)
+    return result
+
+@pytest.mark.parametrize("m", [8, 17, 64, 163, 571])
+def test_pow_matches_repeated_multiplication(service, m):
+    rng = random.Random(m)
+    for _ in range(5):
+        poly = rng.getrandbits(m) | 1
+        for exponent in (0, 1, 2, 7, 255, rng.getrandbits(100), rng.getrandbits(m)):
+            expected = _power_reference(service, m, poly, exponent)
+            assert service.pow_in_gf(m, poly, exponent) == expected
+            assert service.pow_in_gf(m, poly, exponent, cache_base=True) == expected
+
+@pytest.mark.parametrize("m", [8, 233])
+def test_pow_edge_cases(service, m):
+    poly = random.Random(m).getrandbits(m) | 1
+    assert service.pow_in_gf(m, 0, 0) == 1
+    assert service.pow_in_gf(m, 0, 5) == 0
+    assert service.pow_in_gf(m, poly, (1 << m) - 1) == 1
+    assert service.pow_in_gf(m, poly, -1) == service.invert_in_gf(m, poly)
+    with pytest.raises(ValueError):
+        service.pow_in_gf(m, 0, -1)
+
+@pytest.mark.parametrize("m", [1, 8, 17, 163, 409])
+def test_square_and_sqrt(service, m):
+    rng = random.Random(m)
+    for poly in [0, 1] + [rng.getrandbits(m) for _ in range(20)]:
+        assert service.square_in_gf(m, poly) == service.multiply_in_gf(m, poly, poly)
+        root = service.sqrt_in_gf(m, poly)
+        assert service.square_in_gf(m, root) == poly
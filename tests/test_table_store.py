@@ -0,0 +1,77 @@
+import pytest
+from src.fields import GF2mField
+from src.irreducible import get_irreducible_polynomial
+from src.tables import LogTables
+from src.table_store import (HEADER_SIZE, StaleTableError, build_table_files, load_log_tables, main, open_log_tables,
+                             table_path, write_log_tables)
+
+
+@pytest.mark.parametrize("m, modulus", [(4, 0b10011), (8, 0x11B), (12, 0x1053)])
+def test_round_trip_through_mmap(tmp_path, m, modulus):
+    built = LogTables(m, modulus)
+    path = table_path(str(tmp_path), m)
+    write_log_tables(path, built)
+    mapped = open_log_tables(path, m, modulus)
+    assert isinstance(mapped.exp, memoryview)
+    assert list(mapped.exp) == built.exp and list(mapped.log) == built.log
+    assert mapped.generator == built.generator
+    assert mapped.multiply(3, 7) == built.multiply(3, 7)
+    assert mapped.invert(5) == built.invert(5)
+
+def test_stale_and_corrupt_files_are_detected(tmp_path):
+    path = table_path(str(tmp_path), 8)
+    write_log_tables(path, LogTables(8, 0x11B))
+    with pytest.raises(StaleTableError):
+        open_log_tables(path, 8, 0x11D)
+
+    data = bytearray(open(path, 'rb').read())
+    data[HEADER_SIZE + 10] ^= 1
+    open(path, 'wb').write(bytes(data))
+    with pytest.raises(StaleTableError):
+        open_log_tables(path, 8, 0x11B)
+
+    open(path, 'wb').write(bytes(data[:HEADER_SIZE + 5]))
+    with pytest.raises(StaleTableError):
+        open_log_tables(path, 8, 0x11B)
+
+def test_load_rebuilds_stale_files_and_shares_them(tmp_path):
+    directory = str(tmp_path)
+    write_log_tables(table_path(directory, 8), LogTables(8, 0x11D))
+    tables = load_log_tables(8, 0x11B, directory)
+    assert isinstance(tables.exp, memoryview)
+    assert tables.multiply(0x1A, 0x2B) == LogTables(8, 0x11B).multiply(0x1A, 0x2B)
+    assert open_log_tables(table_path(directory, 8), 8, 0x11B).generator == tables.generator
+
+def test_fields_use_table_directory(tmp_path, monkeypatch):
+    paths = build_table_files(str(tmp_path), [8, 16])
+    assert all(path.startswith(str(tmp_path)) for path in paths)
+    monkeypatch.setattr('src.table_store.table_directory', str(tmp_path))
+    field = GF2mField(16, 0x1002B)
+    # build_table_files used the shipped modulus, so a field with another
+    # one gets its own tables rebuilt and rewritten in place.
+    assert isinstance(field.log_tables.exp, memoryview)
+    assert field.log_tables.multiply(3, 3) == 5
+
+def test_vectorized_views_mapped_exp_table(tmp_path, monkeypatch):
+    np = pytest.importorskip('numpy')
+    from src.vectorized import _log_arrays
+    monkeypatch.setattr('src.table_store.table_directory', str(tmp_path))
+    field = GF2mField(16, 0x1002B)
+    exp, _ = _log_arrays(field)
+    assert np.shares_memory(exp, np.asarray(field.log_tables.exp))
+
+def test_build_command_writes_table_files(tmp_path, capsys):
+    assert main(['build', str(tmp_path), '--m', '4', '8']) == 0
+    assert capsys.readouterr().out.split() == [table_path(str(tmp_path), 4), table_path(str(tmp_path), 8)]
+    assert open_log_tables(table_path(str(tmp_path), 8), 8, get_irreducible_polynomial(8)).m == 8
+    with pytest.raises(SystemExit):
+        main(['build', str(tmp_path), '--m', '17'])
+
+def test_concurrent_writers_do_not_share_a_temporary_file(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    built = LogTables(12, 0x1053)
+    path = table_path(str(tmp_path), 12)
+    with ThreadPoolExecutor(8) as executor:
+        list(executor.map(lambda _: write_log_tables(path, built), range(32)))
+    assert list(open_log_tables(path, 12, 0x1053).exp) == built.exp
+    assert [p.name for p in tmp_path.iterdir()] == ['log_tables_m12.bin']
@@ -0,0 +1,70 @@
+import random
+import pytest
+from src.services import PolyServices
+from src.fields import get_field
+from src.tables import LogTables
+
+
+def random_pairs(m, count=200, seed=0):
+    rng = random.Random(seed + m)
+    return [(rng.randrange(1 << m), rng.randrange(1 << m)) for _ in range(count)]
+
+@pytest.mark.parametrize("m", range(2, 17))
+def test_multiply_matches_loop(m):
+    field = get_field(m)
+    tables = field.log_tables
+    for a, b in random_pairs(m):
+        assert tables.multiply(a, b) == PolyServices._multiply_loop(field, a, b)
+
+@pytest.mark.parametrize("m", range(2, 17))
+def test_invert_matches_euclid(m):
+    field = get_field(m)
+    tables = field.log_tables
+    for a, _ in random_pairs(m):
+        if a == 0:
+            continue
+        expected = PolyServices.modulo_in_gf(m, PolyServices._invert_euclid(a, field.modulus))
+        assert tables.invert(a) == expected
+
+@pytest.mark.parametrize("m", range(2, 17))
+def test_divide_matches_invert_then_multiply(m):
+    field = get_field(m)
+    tables = field.log_tables
+    for a, b in random_pairs(m):
+        if b == 0:
+            continue
+        inverse = PolyServices.modulo_in_gf(m, PolyServices._invert_euclid(b, field.modulus))
+        assert tables.divide(a, b) == PolyServices._multiply_loop(field, a, inverse)
+
+@pytest.mark.parametrize("m", [2, 8, 13, 16])
+def test_power_matches_repeated_multiply(m):
+    field = get_field(m)
+    tables = field.log_tables
+    for a, _ in random_pairs(m, count=20):
+        expected = 1
+        for e in range(40):
+            assert tables.power(a, e) == expected
+            expected = PolyServices._multiply_loop(field, expected, a)
+
+def test_generator_spans_field():
+    tables = LogTables(8, 283)
+    assert tables.generator == 3
+    assert sorted(tables.exp[:tables.order]) == list(range(1, 256))
+
+def test_zero_handling():
+    tables = get_field(8).log_tables
+    assert tables.multiply(0, 7) == 0
+    assert tables.divide(0, 7) == 0
+    assert tables.power(0, 0) == 1
+    with pytest.raises(ZeroDivisionError):
+        tables.divide(7, 0)
+    with pytest.raises(ValueError):
+        tables.invert(0)
+
+@pytest.mark.parametrize("m", [1, 17, 163])
+def test_tables_only_for_small_fields(m):
+    assert get_field(m).log_tables is None
+
+def test_service_falls_back_for_unreduced_operands():
+    field = get_field(8)
+    assert PolyServices.multiply_in_gf(8, 0x1FF, 0x2B) == PolyServices._multiply_loop(field, 0x1FF, 0x2B)
@@ -0,0 +1,56 @@
+import itertools
+import pytest
+from marshmallow import ValidationError
+from src.schemas import DoublePolySchema, PowerSchema, SinglePolySchema
+from src.validators import validate_double_poly, validate_power, validate_single_poly
+
+M_VALUES = [8, 0, 8193, '8', 8.5, True, None, 'x']
+BITS_VALUES = [16, 17, '32', None]
+TYPE_VALUES = ['bin', 'hex', 'oct', 3]
+BIN_VALUES = ['1', '0' * 17, '2', 5, None]
+HEX_VALUES = ['1A', '1a', 'F' * 5, None]
+MISSING = object()
+
+
+def _messages(validate, data):
+    try:
+        validate(data)
+    except ValidationError as e:
+        return e.messages
+    return None
+
+def _requests(**choices):
+    names = list(choices)
+    for values in itertools.product(*(choices[name] + [MISSING] for name in names)):
+        yield {name: value for name, value in zip(names, values) if value is not MISSING}
+
+@pytest.mark.parametrize("schema, validate, choices", [
+    (SinglePolySchema, validate_single_poly, {'m': M_VALUES, 'bits': BITS_VALUES, 'type': TYPE_VALUES,
+                                              'bin': BIN_VALUES, 'hex': HEX_VALUES}),
+    (DoublePolySchema, validate_double_poly, {'m': [8], 'bits': [16, 17], 'type': TYPE_VALUES,
+                                              'bin1': BIN_VALUES[:3], 'hex1': HEX_VALUES[:3],
+                                              'bin2': BIN_VALUES[:3], 'hex2': HEX_VALUES[:3]}),
+    (PowerSchema, validate_power, {'m': [8, 0], 'bits': [16], 'type': ['bin', 'hex'], 'bin': ['101'],
+                                   'hex': ['1A'], 'exponent': [3, -3, '3', 3.0, True, None]}),
+    (SinglePolySchema, validate_single_poly, {'m': [8], 'bits': [16], 'type': ['hex'], 'hex': ['1A'],
+                                              'output': ['hex', 'int', 'oct', 3, None]}),
+])
+def test_matches_marshmallow_schemas(schema, validate, choices):
+    for data in _requests(**choices):
+        assert _messages(validate, data) == _messages(schema().load, data), data
+
+def test_parses_operands():
+    assert validate_double_poly({'m': 8, 'bits': 16, 'type': 'hex', 'hex1': '1A', 'hex2': '2B'}) == \
+        {'m': 8, 'bits': 16, 'type': 'hex', 'operands': [0x1A, 0x2B]}
+    assert validate_power({'m': '8', 'bits': 16, 'type': 'bin', 'bin': '101', 'exponent': -2}) == \
+        {'m': 8, 'bits': 16, 'type': 'bin', 'operands': [5], 'exponent': -2}
+    assert validate_single_poly({'m': 8, 'bits': 16, 'type': 'hex', 'hex': '1A', 'output': 'hex'}) == \
+        {'m': 8, 'bits': 16, 'type': 'hex', 'operands': [0x1A], 'output': 'hex'}
+
+@pytest.mark.parametrize("data, messages", [
+    ([1], {'_schema': ['Invalid input type.']}),
+    ({'m': 8, 'bits': 16, 'type': 'bin', 'bin': '1', 'extra': 1}, {'extra': ['Unknown field.']}),
+    ({'m': 8, 'bits': 16, 'type': 'bin', 'bin': ''}, {'bin': ['Operand must not be empty.']}),
+])
+def test_rejections(data, messages):
+    assert _messages(validate_single_poly, data) == messages
@@ -0,0 +1,73 @@
+import random
+import pytest
+from src.services import PolyServices
+
+np = pytest.importorskip('numpy')
+from src import vectorized
+
+
+def random_elements(m, count=300, seed=0, nonzero=False):
+    rng = random.Random(seed * 1000 + m)
+    low = 1 if nonzero else 0
+    return vectorized.from_ints(m, [rng.randrange(low, 1 << m) for _ in range(count)])
+
+# Fields whose shipped modulus is irreducible of degree m
+FIELDS = [2, 5, 8, 13, 16, 17, 20, 29, 31, 41]
+
+@pytest.mark.parametrize("m", FIELDS)
+def test_multiply_matches_service(m):
+    a, b = random_elements(m), random_elements(m, seed=1)
+    result = vectorized.multiply(m, a, b)
+    assert result.dtype == vectorized.element_dtype(m)
+    assert result.tolist() == [PolyServices.multiply_in_gf(m, x, y) for x, y in zip(a.tolist(), b.tolist())]
+
+@pytest.mark.parametrize("m", FIELDS)
+def test_square_matches_service(m):
+    a = random_elements(m)
+    assert vectorized.square(m, a).tolist() == [PolyServices.multiply_in_gf(m, x, x) for x in a.tolist()]
+
+@pytest.mark.parametrize("m", FIELDS)
+def test_invert_and_divide_match_service(m):
+    service = PolyServices()
+    a, b = random_elements(m, count=50), random_elements(m, count=50, seed=1, nonzero=True)
+    assert vectorized.invert(m, b).tolist() == [service.invert_in_gf(m, y) for y in b.tolist()]
+    assert vectorized.divide(m, a, b).tolist() == [service.divide_in_gf(m, x, y) for x, y in zip(a.tolist(), b.tolist())]
+
+def test_add_is_xor():
+    a, b = random_elements(64), random_elements(64, seed=1)
+    assert vectorized.add(64, a, b).tolist() == [x ^ y for x, y in zip(a.tolist(), b.tolist())]
+
+def test_multiply_full_width():
+    a, b = random_elements(64, count=20), random_elements(64, count=20, seed=1)
+    expected = [PolyServices.multiply_in_gf(64, x, y) for x, y in zip(a.tolist(), b.tolist())]
+    assert vectorized.multiply(64, a, b).tolist() == expected
+
+def test_accepts_wider_unsigned_dtypes():
+    a = np.array([0x1A, 0, 0xFF], dtype=np.uint64)
+    b = np.array([0x2B, 0x2B, 1], dtype=np.uint32)
+    assert vectorized.multiply(8, a, b).tolist() == [0x93, 0, 0xFF]
+
+def test_rejects_invalid_input():
+    with pytest.raises(TypeError):
+        vectorized.add(8, np.array([1, 2]), np.array([3, 4]))
+    with pytest.raises(ValueError):
+        vectorized.add(8, np.array([256], dtype=np.uint16), np.array([1], dtype=np.uint16))
+    with pytest.raises(ValueError):
+        vectorized.multiply(65, np.array([1], dtype=np.uint64), np.array([1], dtype=np.uint64))
+    with pytest.raises(ValueError):
+        vectorized.invert(8, np.array([1, 0], dtype=np.uint8))
+    with pytest.raises(ZeroDivisionError):
+        vectorized.divide(8, np.array([1, 1], dtype=np.uint8), np.array([1, 0], dtype=np.uint8))
+
+@pytest.mark.parametrize("m", [8, 31])
+def test_batch_uses_vectorized_path(m):
+    service = PolyServices()
+    a, b = random_elements(m, count=100).tolist(), random_elements(m, count=100, seed=1).tolist()
+    operations = [('multiply', [x, y]) for x, y in zip(a, b)]
+    operations += [('divide', [a[0], 0]), ('invert', [0]), ('add', [a[1], b[1]]), ('divide', [a[2], b[2] or 1])]
+    results = service.batch_in_gf(m, operations)
+    assert results[:100] == [service.multiply_in_gf(m, x, y) for x, y in zip(a, b)]
+    assert isinstance(results[100], ZeroDivisionError)
+    assert isinstance(results[101], ValueError)
+    assert results[102] == a[1] ^ b[1]
+    assert results[103] == service.divide_in_gf(m, a[2], b[2] or 1)
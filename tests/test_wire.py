@@ -0,0 +1,66 @@
+import pytest
+from src import wire
+from src.services import PolyServices
+
+
+def pack(op, m, width, records, byteorder='little', count=None):
+    flags = wire.FLAG_BIG_ENDIAN if byteorder == 'big' else 0
+    header = wire.HEADER.pack(wire.MAGIC, 1, wire.WIRE_OPERATIONS[op], flags, m, width,
+                              len(records) if count is None else count)
+    return header + b''.join(operand.to_bytes(width, byteorder) for record in records for operand in record)
+
+def unpack(body, width, byteorder='little'):
+    count = wire.HEADER.unpack_from(body)[-1]
+    data = body[wire.HEADER.size:]
+    results = [int.from_bytes(data[i * width:(i + 1) * width], byteorder) for i in range(count)]
+    return results, list(data[count * width:])
+
+def run(body):
+    request = wire.decode(body)
+    return wire.encode(request, *wire.evaluate(PolyServices(), request))
+
+def test_header_is_sixteen_bytes():
+    assert wire.HEADER.size == 16
+
+@pytest.mark.parametrize("byteorder", ['little', 'big'])
+@pytest.mark.parametrize("m, width", [(8, 1), (8, 2), (16, 2), (64, 8), (163, 21)])
+def test_multiply_matches_services(m, width, byteorder):
+    service = PolyServices()
+    records = [((i * 0x9E3779B97F4A7C15) % (1 << m), (i * 0xC2B2AE3D27D4EB4F + 1) % (1 << m)) for i in range(50)]
+    results, statuses = unpack(run(pack('multiply', m, width, records, byteorder)), width, byteorder)
+    assert results == [service.multiply_in_gf(m, *record) for record in records]
+    assert statuses == [0] * 50
+
+@pytest.mark.parametrize("m, width", [(8, 1), (163, 21)])
+def test_zero_divisors_get_statuses(m, width):
+    records = [(5, 3), (5, 0)] * 20
+    results, statuses = unpack(run(pack('divide', m, width, records)), width)
+    assert statuses == [0, wire.STATUS_DIVISION_BY_ZERO] * 20
+    assert results[1] == 0
+    results, statuses = unpack(run(pack('invert', m, width, [(0,), (1,)] * 20)), width)
+    assert statuses == [wire.STATUS_INVALID, 0] * 20
+    assert results[:2] == [0, 1]
+
+def test_power_and_modulo():
+    service = PolyServices()
+    results, _ = unpack(run(pack('power', 163, 21, [(3, 12345), (0x1A, 0)])), 21)
+    assert results == [service.pow_in_gf(163, 3, 12345), 1]
+    results, _ = unpack(run(pack('modulo', 8, 2, [(0x11A,)])), 2)
+    assert results == [service.modulo_in_gf(8, 0x11A)]
+
+def test_empty_request():
+    assert unpack(run(pack('multiply', 8, 1, [])), 1) == ([], [])
+
+@pytest.mark.parametrize("body, message", [
+    (b'GF2B', 'shorter'),
+    (b'XXXX' + pack('add', 8, 1, [(1, 2)])[4:], 'magic'),
+    (pack('add', 8, 1, [(1, 2)])[:16] + b'\x01', 'Expected 2 payload bytes'),
+    (pack('add', 163, 8, [(1, 2)]), 'Element width'),
+    (pack('add', 8, 1, [(1, 2)], count=2), 'Expected 4 payload bytes'),
+    (wire.HEADER.pack(wire.MAGIC, 1, 42, 0, 8, 1, 0), 'Unknown operation'),
+    (wire.HEADER.pack(wire.MAGIC, 2, 1, 0, 8, 1, 0), 'version'),
+    (wire.HEADER.pack(wire.MAGIC, 1, 1, 4, 8, 1, 0), 'flags'),
+])
+def test_malformed_requests(body, message):
+    with pytest.raises(wire.WireFormatError, match=message):
+        wire.decode(body)